@@ -2,6 +2,10 @@
 
 from position import Position
 
+# Movement directions in Position.neighbors_4() order, with (row, col) deltas
+DIRECTIONS = ("up", "down", "left", "right")
+DELTAS = {"up": (-1, 0), "down": (1, 0), "left": (0, -1), "right": (0, 1)}
+
 
 class Agent:
     """
@@ -10,18 +14,22 @@ class Agent:
     Attributes:
         world (GridWorld): The grid world environment
         at (Position): Current position of agent
+        planner: Object with ``next_step(pos)`` the agent follows, or None
     """
 
-    def __init__(self, world, pos=None):
+    def __init__(self, world, pos=None, planner=None):
         """
         Initialize an agent in a grid world.
 
         Args:
             world (GridWorld): The grid world environment
             pos (Position, optional): Starting position (default: world.start)
+            planner (optional): Planner to follow, e.g. a DStarLite or a
+                compact_path.PathFollower
         """
         self.world = world
         self.at = pos if pos is not None else world.start
+        self.planner = planner
 
     def can_move_to(self, pos):
         """
@@ -46,16 +54,10 @@ class Agent:
             bool: True if move was successful, False otherwise
         """
         # Calculate new position based on direction
-        if direction == 'up':
-            new_pos = Position(self.at.row - 1, self.at.col)
-        elif direction == 'down':
-            new_pos = Position(self.at.row + 1, self.at.col)
-        elif direction == 'left':
-            new_pos = Position(self.at.row, self.at.col - 1)
-        elif direction == 'right':
-            new_pos = Position(self.at.row, self.at.col + 1)
-        else:
+        delta = DELTAS.get(direction)
+        if delta is None:
             return False  # Invalid direction
+        new_pos = Position(self.at.row + delta[0], self.at.col + delta[1])
 
         # Check if move is valid
         if self.can_move_to(new_pos):
@@ -64,6 +66,41 @@ class Agent:
         else:
             return False
 
+    def follow(self, planner):
+        """
+        Subscribe the agent to a planner.
+
+        Args:
+            planner: Object with a ``next_step(pos)`` method returning the
+                next Position or None
+        """
+        self.planner = planner
+
+    def next_step(self):
+        """
+        Ask the planner for the next position from the current one.
+
+        Returns:
+            Position or None: Next position, or None without a planner,
+                at the goal, or when the goal is unreachable
+        """
+        if self.planner is None:
+            return None
+        return self.planner.next_step(self.at)
+
+    def advance(self):
+        """
+        Move one step along the planner's current plan.
+
+        Returns:
+            bool: True if the agent moved, False otherwise
+        """
+        new_pos = self.next_step()
+        if new_pos is not None and self.can_move_to(new_pos):
+            self.at = new_pos
+            return True
+        return False
+
     def reset(self, pos):
         """
         Teleport agent to a new position.
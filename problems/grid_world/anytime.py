@@ -0,0 +1,165 @@
+"""Resumable A* that can stop at a deadline and continue later."""
+
+from position import Position
+from path import AStarSearch
+
+
+class AnytimeResult:
+    """
+    Outcome of one AnytimeSearch.run call.
+
+    Attributes:
+        path (list or None): Positions from start to goal when complete;
+            when incomplete, a partial path from start to the expanded
+            cell closest to the goal; None if no path exists
+        complete (bool): True once the search has finished, either by
+            reaching the goal or by proving it unreachable
+        nodes_expanded (int): Cells expanded during this call
+        total_expanded (int): Cells expanded since the search (re)started
+    """
+
+    __slots__ = ("path", "complete", "nodes_expanded", "total_expanded")
+
+    def __init__(self, path, complete, nodes_expanded, total_expanded):
+        """
+        Initialize a result.
+
+        Args:
+            path (list or None): Full or partial path
+            complete (bool): Whether the search has finished
+            nodes_expanded (int): Cells expanded during this call
+            total_expanded (int): Cells expanded in total
+        """
+        self.path = path
+        self.complete = complete
+        self.nodes_expanded = nodes_expanded
+        self.total_expanded = total_expanded
+
+    def __repr__(self):
+        """
+        String representation of AnytimeResult.
+
+        Returns:
+            str: Summary of the result
+        """
+        length = len(self.path) if self.path is not None else None
+        state = "complete" if self.complete else "partial"
+        return (f"AnytimeResult({state}, path_length={length}, "
+                f"expanded={self.nodes_expanded}/{self.total_expanded})")
+
+
+class AnytimeSearch:
+    """
+    A* search that runs in slices under a time or expansion budget.
+
+    The search itself is path.AStarSearch, the engine behind
+    Pathfinder's "astar" and "weighted_astar", kept between run() calls
+    so each one continues where the previous one stopped. A run that
+    hits its budget returns a partial path to the expanded cell with the
+    smallest Manhattan distance to the goal, flagged as incomplete; once
+    the goal is reached the result is the same path Pathfinder would
+    return.
+
+    If the world's walls change between runs (its version moved on), the
+    saved state is stale and the next run starts the search over, reusing
+    the same per-cell buffers.
+
+    Attributes:
+        world (GridWorld): World with an occupancy buffer
+        start (Position): Starting position
+        goal (Position): Goal position
+        epsilon (float): Heuristic weight, 1 for plain A*
+        total_expanded (int): Cells expanded since the search (re)started
+        complete (bool): Whether the search has finished
+    """
+
+    def __init__(self, world, start=None, goal=None, epsilon=1.0):
+        """
+        Initialize a search; no cells are expanded until run().
+
+        Args:
+            world (GridWorld): World with an occupancy buffer
+            start (Position, optional): Starting position (default: world.start)
+            goal (Position, optional): Goal position (default: world.goal)
+            epsilon (float): Heuristic weight, >= 1 (default: 1.0)
+        """
+        if epsilon < 1:
+            raise ValueError("epsilon must be >= 1")
+        self.world = world
+        self.start = start if start is not None else world.start
+        self.goal = goal if goal is not None else world.goal
+        self.epsilon = epsilon
+        self._search = AStarSearch(world.rows, world.cols, epsilon)
+        self._reset()
+
+    def _reset(self):
+        """Discard any saved state and seed the open list with the start."""
+        world = self.world
+        cols = world.cols
+        self._version = getattr(world, "version", None)
+        self.total_expanded = 0
+        self.complete = False
+        self._started = False
+        self._search.release()
+
+        if not (world.in_bounds(self.start) and world.in_bounds(self.goal)):
+            self.complete = True
+            return
+        occupancy = world.occupancy()
+        start = self.start.row * cols + self.start.col
+        goal = self.goal.row * cols + self.goal.col
+        if occupancy[start] or occupancy[goal]:
+            self.complete = True
+            return
+        self._search.reset(occupancy, start, goal, self._version)
+        self._started = True
+
+    def run(self, deadline=None, max_expansions=None):
+        """
+        Continue the search until it finishes or a budget runs out.
+
+        Args:
+            deadline (float, optional): ``time.perf_counter()`` value at
+                which to stop, e.g. ``time.perf_counter() + 0.005`` for a
+                5 ms budget
+            max_expansions (int, optional): Most cells to expand in this
+                call
+
+        Returns:
+            AnytimeResult: Full path when complete, otherwise the best
+                partial path so far
+        """
+        if self._version != getattr(self.world, "version", None):
+            self._reset()
+        if self.complete:
+            return AnytimeResult(self._path(), True, 0, self.total_expanded)
+
+        search = self._search
+        limit = max_expansions if max_expansions is not None else -1
+        expanded = search.run(limit, deadline)
+        if search.done:
+            self.complete = True
+            search.release()
+        self.total_expanded += expanded
+        return AnytimeResult(self._path(), self.complete, expanded, self.total_expanded)
+
+    def _path(self):
+        """
+        Current answer: the full path, the partial path, or None.
+
+        Returns:
+            list or None: Position objects from the start
+        """
+        search = self._search
+        if not self._started:
+            return None
+        if self.complete:
+            cell = search.found
+            if cell is None:
+                return None
+        elif search.best == -1:
+            return [self.start]
+        else:
+            cell = search.best
+        cols = self.world.cols
+        return [Position(c // cols, c % cols) for c in search.trace(cell)]
@@ -0,0 +1,257 @@
+"""
+Pathfinding benchmark: time every engine on generated maps.
+
+Usage:
+    python benchmark.py --sizes 10 100 1000 --output report.json
+    python benchmark.py --output new.json --compare old.json
+
+Each (map, size, engine) run records the best wall time over
+``--repeat`` runs, nodes expanded, path length and peak traced memory.
+With ``--compare`` the new report is checked against an older one and
+the script exits with status 1 if any run got slower than
+``--threshold`` times its old time or returned a different path length.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from generators import GENERATORS
+from path import ALGORITHMS, Pathfinder, JumpPointSearch
+
+
+def _pathfinder(algorithm):
+    """Engine running Pathfinder with one algorithm."""
+    def run(world):
+        finder = Pathfinder(world, algorithm=algorithm)
+        return finder.find_path(world.start, world.goal), finder.nodes_expanded
+    return run
+
+
+def _jps(world):
+    """Engine running 4-connected Jump Point Search."""
+    finder = JumpPointSearch(world)
+    return finder.find_path(world.start, world.goal), finder.nodes_expanded
+
+
+def _hierarchical(world):
+    """Engine building an HPA* abstraction and answering one query."""
+    from hierarchical import HierarchicalPathfinder
+    finder = HierarchicalPathfinder(world)
+    try:
+        return finder.find_path(world.start, world.goal), finder.nodes_expanded
+    finally:
+        finder.close()
+
+
+def _dstar_lite(world):
+    """Engine running the initial D* Lite plan."""
+    from dstar_lite import DStarLite
+    planner = DStarLite(world)
+    try:
+        return planner.path(), planner.nodes_expanded
+    finally:
+        planner.close()
+
+
+def _flow_field(world):
+    """Engine computing a NumPy flow field and following it."""
+    from fields import FlowField
+    field = FlowField(world)
+    path = [world.start]
+    while path[-1] != world.goal:
+        step = field.next_step(path[-1])
+        if step is None:
+            return None, None
+        path.append(step)
+    return path, None
+
+
+# Engine name -> function(world) returning (path or None, nodes expanded or None)
+ENGINES = {name: _pathfinder(name) for name in ALGORITHMS}
+ENGINES.update({
+    "jps": _jps,
+    "hierarchical": _hierarchical,
+    "dstar_lite": _dstar_lite,
+    "flow_field": _flow_field,
+})
+
+# Largest map (in cells) each slow engine is run on by default
+ENGINE_CELL_LIMITS = {"dstar_lite": 1_000_000}
+
+
+def run_engine(engine, world, repeat=3):
+    """
+    Benchmark one engine on one world.
+
+    Timing runs and the memory run are separate, because tracemalloc
+    slows allocation-heavy code down.
+
+    Args:
+        engine (callable): Entry of ENGINES
+        world (GridWorld): Map to solve
+        repeat (int): Timed runs; the fastest is reported
+
+    Returns:
+        dict: seconds, nodes_expanded, path_length and peak_bytes
+    """
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        path, expanded = engine(world)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    try:
+        engine(world)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "seconds": best,
+        "nodes_expanded": expanded,
+        "path_length": len(path) if path is not None else None,
+        "peak_bytes": peak,
+    }
+
+
+def run_suite(sizes, maps=None, engines=None, repeat=3, seed=0, log=None):
+    """
+    Benchmark engines on every generated map size.
+
+    Engines whose optional dependency is missing (NumPy for flow_field)
+    are skipped. Engines listed in ENGINE_CELL_LIMITS are skipped on
+    larger maps unless named explicitly in ``engines``.
+
+    Args:
+        sizes (list): Side lengths of the square maps
+        maps (list, optional): GENERATORS names (default: all)
+        engines (list, optional): ENGINES names (default: all)
+        repeat (int): Timed runs per engine
+        seed (int): Generator seed
+        log (callable, optional): Called with a progress line per run
+
+    Returns:
+        list: One result dict per (map, size, engine)
+    """
+    explicit = engines is not None
+    maps = maps or list(GENERATORS)
+    engines = engines or list(ENGINES)
+    results = []
+    for name in maps:
+        for size in sizes:
+            world = GENERATORS[name](size, size, seed=seed)
+            for engine in engines:
+                limit = ENGINE_CELL_LIMITS.get(engine)
+                if not explicit and limit is not None and size * size > limit:
+                    continue
+                try:
+                    stats = run_engine(ENGINES[engine], world, repeat)
+                except ImportError:
+                    continue
+                result = {"map": name, "size": size, "engine": engine}
+                result.update(stats)
+                results.append(result)
+                if log is not None:
+                    log(f"{name:>6} {size:>5} {engine:>14} {stats['seconds']:9.4f}s "
+                        f"expanded={stats['nodes_expanded']} length={stats['path_length']} "
+                        f"peak={stats['peak_bytes']}")
+    return results
+
+
+def _commit():
+    """Current git commit hash, or None outside a git checkout."""
+    try:
+        output = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True,
+                                text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def make_report(results):
+    """
+    Wrap results with details of where they were measured.
+
+    Args:
+        results (list): Output of run_suite
+
+    Returns:
+        dict: Report ready for json.dump
+    """
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare_reports(old, new, threshold=1.25):
+    """
+    Find runs that regressed between two reports.
+
+    Args:
+        old (dict): Baseline report
+        new (dict): Report to check
+        threshold (float): Allowed slowdown factor
+
+    Returns:
+        list: Human-readable regression descriptions, empty if none
+    """
+    baseline = {(r["map"], r["size"], r["engine"]): r for r in old["results"]}
+    problems = []
+    for result in new["results"]:
+        key = (result["map"], result["size"], result["engine"])
+        before = baseline.get(key)
+        if before is None:
+            continue
+        label = "{} {} {}".format(*key)
+        if result["path_length"] != before["path_length"]:
+            problems.append(f"{label}: path length {before['path_length']} -> {result['path_length']}")
+        if before["seconds"] > 0 and result["seconds"] > threshold * before["seconds"]:
+            ratio = result["seconds"] / before["seconds"]
+            problems.append(f"{label}: {before['seconds']:.4f}s -> {result['seconds']:.4f}s "
+                            f"({ratio:.2f}x)")
+    return problems
+
+
+def main(argv=None):
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--maps", nargs="+", choices=list(GENERATORS))
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument("--compare", help="baseline report to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.maps, args.engines, args.repeat, args.seed, log=print)
+    report = make_report(results)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        problems = compare_reports(old, report, args.threshold)
+        for problem in problems:
+            print("REGRESSION", problem)
+        if problems:
+            return 1
+        print(f"No regressions against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
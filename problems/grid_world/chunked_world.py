@@ -0,0 +1,290 @@
+"""Sparse grid world stored as lazily created bitmap tiles."""
+
+from position import Position
+
+
+class ChunkedOccupancy:
+    """
+    Wall store made of fixed-size square bitmap tiles kept in a dict.
+
+    A tile is created the first time a wall is placed in it and dropped
+    again when its last wall is removed, so memory is proportional to
+    the area that actually contains walls. Coordinates may be negative.
+    Supports the same set-like interface as OccupancyGrid.
+
+    Attributes:
+        chunk_size (int): Tile side length in cells, a multiple of 8
+        tiles (dict): ``(tile_row, tile_col)`` -> ``bytearray`` bitmap
+        on_change (callable or None): Called as ``on_change(pos, is_wall)``
+            after add or discard changes a cell; set by the owning
+            ChunkedGridWorld
+    """
+
+    def __init__(self, chunk_size=64):
+        """
+        Initialize an empty store.
+
+        Args:
+            chunk_size (int): Tile side length in cells (default: 64)
+        """
+        if chunk_size <= 0 or chunk_size % 8:
+            raise ValueError("chunk_size must be a positive multiple of 8")
+        self.chunk_size = chunk_size
+        self.tiles = {}
+        self._tile_bytes = chunk_size * chunk_size // 8
+        self._count = 0
+        self.on_change = None
+
+    def _locate(self, pos):
+        """Tile key, byte offset and bit mask of a position."""
+        tile_row, row = divmod(pos.row, self.chunk_size)
+        tile_col, col = divmod(pos.col, self.chunk_size)
+        i = row * self.chunk_size + col
+        return (tile_row, tile_col), i >> 3, 0x80 >> (i & 7)
+
+    def add(self, pos):
+        """
+        Mark a position as a wall, creating its tile if needed.
+
+        Args:
+            pos (Position): Position to mark
+        """
+        key, byte, mask = self._locate(pos)
+        tile = self.tiles.get(key)
+        if tile is None:
+            tile = self.tiles[key] = bytearray(self._tile_bytes)
+        if not tile[byte] & mask:
+            tile[byte] |= mask
+            self._count += 1
+            if self.on_change is not None:
+                self.on_change(pos, True)
+
+    def discard(self, pos):
+        """
+        Clear a wall if present, dropping its tile once it is empty.
+
+        Args:
+            pos (Position): Position to clear
+        """
+        key, byte, mask = self._locate(pos)
+        tile = self.tiles.get(key)
+        if tile is None or not tile[byte] & mask:
+            return
+        tile[byte] &= ~mask & 0xFF
+        self._count -= 1
+        if tile.count(0) == len(tile):
+            del self.tiles[key]
+        if self.on_change is not None:
+            self.on_change(pos, False)
+
+    def __contains__(self, pos):
+        """
+        Check whether a position is a wall.
+
+        Args:
+            pos (Position): Position to check
+
+        Returns:
+            bool: True if pos is marked as a wall
+        """
+        key, byte, mask = self._locate(pos)
+        tile = self.tiles.get(key)
+        return tile is not None and bool(tile[byte] & mask)
+
+    def __len__(self):
+        """
+        Number of walls.
+
+        Returns:
+            int: Count of wall cells
+        """
+        return self._count
+
+    def __iter__(self):
+        """
+        Iterate over wall positions, tile by tile.
+
+        Yields:
+            Position: Each wall position
+        """
+        size = self.chunk_size
+        for (tile_row, tile_col), tile in list(self.tiles.items()):
+            for byte, bits in enumerate(tile):
+                if not bits:
+                    continue
+                for bit in range(8):
+                    if bits & (0x80 >> bit):
+                        row, col = divmod(byte * 8 + bit, size)
+                        yield Position(tile_row * size + row, tile_col * size + col)
+
+
+class ChunkedGridWorld:
+    """
+    Grid world for huge or unbounded, mostly empty maps.
+
+    Walls live in a ChunkedOccupancy, so no per-cell buffer is ever
+    allocated. The world offers the in_bounds/passable/place_wall
+    interface that Pathfinder and Agent rely on; having no occupancy()
+    buffer, Pathfinder searches it with its generic BFS.
+
+    With ``rows`` and ``cols`` left as None the world has no edges. A
+    search for an unreachable goal in an unbounded world never ends, so
+    give such worlds bounds before searching them.
+
+    Attributes:
+        rows (int or None): Number of rows, None if unbounded
+        cols (int or None): Number of columns, None if unbounded
+        walls (ChunkedOccupancy): Wall positions (read-only attribute;
+            editing the store directly is tracked like place_wall)
+        start (Position): Starting position
+        goal (Position or None): Goal position
+        version (int): Modification counter, bumped whenever a wall is
+            placed or removed
+    """
+
+    def __init__(self, rows=None, cols=None, walls=None, start=None, goal=None,
+                 chunk_size=64):
+        """
+        Initialize a chunked world.
+
+        Args:
+            rows (int, optional): Number of rows (default: unbounded)
+            cols (int, optional): Number of columns (default: unbounded)
+            walls (iterable, optional): Wall positions
+            start (Position, optional): Starting position (default: (0, 0))
+            goal (Position, optional): Goal position (default:
+                (rows-1, cols-1) when bounded, otherwise None)
+            chunk_size (int): Tile side length in cells (default: 64)
+        """
+        if (rows is None) != (cols is None):
+            raise ValueError("rows and cols must both be given or both be None")
+        self.rows = rows
+        self.cols = cols
+        self._walls = ChunkedOccupancy(chunk_size)
+        for pos in walls or ():
+            if self.in_bounds(pos):
+                self._walls.add(pos)
+        self._walls.on_change = self._wall_changed
+        self.start = start if start is not None else Position(0, 0)
+        if goal is None and rows is not None:
+            goal = Position(rows - 1, cols - 1)
+        self.goal = goal
+        self.version = 0
+        self._listeners = []
+
+    @property
+    def walls(self):
+        """
+        Wall store of the world.
+
+        Returns:
+            ChunkedOccupancy: Wall positions
+        """
+        return self._walls
+
+    def _wall_changed(self, pos, is_wall):
+        """Record a change made to the wall store and notify listeners."""
+        self.version += 1
+        for listener in self._listeners:
+            listener(pos, is_wall)
+
+    @property
+    def chunk_count(self):
+        """
+        Number of tiles currently allocated.
+
+        Returns:
+            int: Tiles holding at least one wall
+        """
+        return len(self._walls.tiles)
+
+    def in_bounds(self, pos):
+        """
+        Check if position is inside the grid.
+
+        Args:
+            pos (Position): Position to check
+
+        Returns:
+            bool: True if the world is unbounded or pos is within it
+        """
+        if self.rows is None:
+            return True
+        return 0 <= pos.row < self.rows and 0 <= pos.col < self.cols
+
+    def passable(self, pos):
+        """
+        Check if position is not a wall.
+
+        Args:
+            pos (Position): Position to check
+
+        Returns:
+            bool: True if position is passable (not a wall)
+        """
+        return pos not in self._walls
+
+    def is_goal(self, pos):
+        """
+        Check if position is the goal.
+
+        Args:
+            pos (Position): Position to check
+
+        Returns:
+            bool: True if position is the goal
+        """
+        return pos == self.goal
+
+    def place_wall(self, pos):
+        """
+        Add a wall at the specified position. Out-of-bounds positions are
+        ignored.
+
+        Args:
+            pos (Position): Position to place wall
+        """
+        if self.in_bounds(pos):
+            self._walls.add(pos)
+
+    def remove_wall(self, pos):
+        """
+        Remove wall at the specified position.
+
+        Args:
+            pos (Position): Position to remove wall
+        """
+        self._walls.discard(pos)
+
+    def subscribe(self, listener):
+        """
+        Register a callback for wall changes.
+
+        Args:
+            listener (callable): Function taking (Position, bool)
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        """
+        Remove a callback registered with subscribe.
+
+        Args:
+            listener (callable): Previously registered function
+        """
+        self._listeners.remove(listener)
+
+    def render(self, path=None, agent=None, window=None):
+        """
+        Print ASCII representation of part of the grid.
+
+        Uses the same legend as GridWorld.render.
+
+        Args:
+            path (list, optional): List of Position objects forming a path
+            agent (Position, optional): Current agent position
+            window (tuple, optional): ``(top, left, height, width)`` to
+                draw; required for unbounded worlds (default: whole grid)
+        """
+        from render import Renderer
+        Renderer(self, viewport=window).render(path, agent)
@@ -0,0 +1,277 @@
+"""Paths stored as a start cell plus two bits per move."""
+
+from array import array
+from agent import DIRECTIONS, DELTAS
+from position import Position
+
+# Moves between stored (row, col) checkpoints used by indexing
+CHECKPOINT_EVERY = 256
+
+_DROW = tuple(DELTAS[d][0] for d in DIRECTIONS)
+_DCOL = tuple(DELTAS[d][1] for d in DIRECTIONS)
+
+# Packed byte -> its four direction codes, most significant bits first
+_UNPACK = tuple(((b >> 6) & 3, (b >> 4) & 3, (b >> 2) & 3, b & 3) for b in range(256))
+
+# (row delta, col delta) -> direction code
+_CODES = {DELTAS[d]: code for code, d in enumerate(DIRECTIONS)}
+
+
+def _pack(codes):
+    """Pack direction codes four to a byte, most significant bits first."""
+    codes = bytes(codes) + bytes(-len(codes) % 4)
+    return bytes((a << 6) | (b << 4) | (c << 2) | d
+                 for a, b, c, d in zip(codes[0::4], codes[1::4], codes[2::4], codes[3::4]))
+
+
+class CompactPath:
+    """
+    Immutable path stored as its start cell and packed move codes.
+
+    Each move is an index into agent.DIRECTIONS packed into two bits, so
+    a path costs about a quarter byte per cell instead of a Position
+    object and a list slot. Cells are decoded lazily: iteration walks
+    the moves, and indexing starts from the nearest of the (row, col)
+    checkpoints stored every CHECKPOINT_EVERY moves.
+
+    Supports ``len()``, iteration, indexing (negative indices and slices
+    too), equality with other paths and with lists of Positions, and
+    to_list() for the full list.
+
+    Attributes:
+        start (Position): First cell of the path
+        data (bytes): Move codes, four per byte
+    """
+
+    __slots__ = ("start", "data", "_moves", "_checkpoints")
+
+    def __init__(self, start, codes=()):
+        """
+        Initialize a path from a start and its moves.
+
+        Args:
+            start (Position): First cell
+            codes (iterable): Direction codes, indices into agent.DIRECTIONS
+        """
+        codes = bytes(codes)
+        if codes and max(codes) >= len(DIRECTIONS):
+            raise ValueError(f"direction codes must be 0..{len(DIRECTIONS) - 1}")
+        self.start = start
+        self.data = _pack(codes)
+        self._moves = len(codes)
+
+        checkpoints = array('l', [start.row, start.col])
+        row, col = start.row, start.col
+        for i in range(0, len(codes) - CHECKPOINT_EVERY + 1, CHECKPOINT_EVERY):
+            chunk = codes[i:i + CHECKPOINT_EVERY]
+            row += chunk.count(1) - chunk.count(0)
+            col += chunk.count(3) - chunk.count(2)
+            checkpoints.append(row)
+            checkpoints.append(col)
+        self._checkpoints = checkpoints
+
+    @classmethod
+    def from_positions(cls, positions):
+        """
+        Encode a list of Positions.
+
+        Args:
+            positions (sequence): Non-empty Positions, each adjacent to
+                the previous one
+
+        Returns:
+            CompactPath: Equivalent compact path
+        """
+        codes = bytearray(len(positions) - 1)
+        for i, (a, b) in enumerate(zip(positions, positions[1:])):
+            code = _CODES.get((b.row - a.row, b.col - a.col))
+            if code is None:
+                raise ValueError(f"{a} and {b} are not adjacent")
+            codes[i] = code
+        return cls(positions[0], codes)
+
+    @classmethod
+    def from_cells(cls, cells, cols):
+        """
+        Encode a sequence of flat cell ids without creating Positions.
+
+        Args:
+            cells (sequence): Non-empty cell ids (``row * cols + col``),
+                each adjacent to the previous one
+            cols (int): Grid width
+
+        Returns:
+            CompactPath: Equivalent compact path
+        """
+        # Vertical entries come last so they win when cols == 1
+        codes_by_step = {-1: 2, 1: 3, -cols: 0, cols: 1}
+        codes = bytearray(len(cells) - 1)
+        for i, (a, b) in enumerate(zip(cells, cells[1:])):
+            code = codes_by_step.get(b - a)
+            if code is None or (code > 1 and a // cols != b // cols):
+                raise ValueError(f"cells {a} and {b} are not adjacent")
+            codes[i] = code
+        return cls(Position(*divmod(cells[0], cols)), codes)
+
+    def __len__(self):
+        """
+        Number of cells, counting the start.
+
+        Returns:
+            int: Moves plus one
+        """
+        return self._moves + 1
+
+    def __iter__(self):
+        """
+        Decode cells one at a time.
+
+        Yields:
+            Position: Each cell from the start to the end
+        """
+        row, col = self.start.row, self.start.col
+        yield self.start
+        remaining = self._moves
+        for byte in self.data:
+            for code in _UNPACK[byte]:
+                if not remaining:
+                    return
+                remaining -= 1
+                row += _DROW[code]
+                col += _DCOL[code]
+                yield Position(row, col)
+
+    def directions(self):
+        """
+        Decode the moves as direction names, as taken by Agent.step.
+
+        Yields:
+            str: "up", "down", "left" or "right" per move
+        """
+        remaining = self._moves
+        for byte in self.data:
+            for code in _UNPACK[byte]:
+                if not remaining:
+                    return
+                remaining -= 1
+                yield DIRECTIONS[code]
+
+    def __getitem__(self, index):
+        """
+        Cell at an index, or a list of cells for a slice.
+
+        Args:
+            index (int or slice): Cell index; negative counts from the end
+
+        Returns:
+            Position or list: The cell, or Positions for a slice
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("path index out of range")
+        if index == 0:
+            return self.start
+
+        checkpoint = index // CHECKPOINT_EVERY
+        row = self._checkpoints[2 * checkpoint]
+        col = self._checkpoints[2 * checkpoint + 1]
+        data = self.data
+        for move in range(checkpoint * CHECKPOINT_EVERY, index):
+            code = (data[move >> 2] >> (6 - 2 * (move & 3))) & 3
+            row += _DROW[code]
+            col += _DCOL[code]
+        return Position(row, col)
+
+    @property
+    def end(self):
+        """
+        Last cell of the path.
+
+        Returns:
+            Position: Final cell
+        """
+        return self[-1]
+
+    def to_list(self):
+        """
+        Expand into a list of Positions.
+
+        Returns:
+            list: Position objects from start to end
+        """
+        return list(self)
+
+    def __eq__(self, other):
+        """
+        Compare with another path.
+
+        Args:
+            other (CompactPath or list): Path to compare against
+
+        Returns:
+            bool: True if both visit the same cells in the same order
+        """
+        if isinstance(other, CompactPath):
+            return (self._moves == other._moves and self.start == other.start
+                    and self.data == other.data)
+        if isinstance(other, (list, tuple)):
+            return len(other) == len(self) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        """
+        String representation of CompactPath.
+
+        Returns:
+            str: Start, end and length
+        """
+        return f"CompactPath({self.start}->{self.end}, {len(self)} cells)"
+
+
+class PathFollower:
+    """
+    Planner that walks an agent along a fixed path.
+
+    Pass it to Agent.follow(); each advance() then moves the agent one
+    cell. The path is decoded one cell ahead of the agent, so a
+    CompactPath is never expanded into a list.
+
+    Attributes:
+        path (CompactPath or list): Path being followed
+    """
+
+    def __init__(self, path):
+        """
+        Initialize a follower at the start of a path.
+
+        Args:
+            path (CompactPath or list): Positions to visit in order
+        """
+        self.path = path
+        self._cells = iter(path)
+        self._current = next(self._cells)
+        self._next = next(self._cells, None)
+
+    def next_step(self, pos):
+        """
+        Next cell after pos along the path.
+
+        Args:
+            pos (Position): Where the agent is now
+
+        Returns:
+            Position or None: Next cell, or None at the end of the path or
+                when pos is not the cell the follower expects
+        """
+        if self._next is not None and pos == self._next:
+            # The agent took the last step handed out
+            self._current = self._next
+            self._next = next(self._cells, None)
+        if pos == self._current:
+            return self._next
+        return None
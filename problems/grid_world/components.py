@@ -0,0 +1,230 @@
+"""Connected-component labelling of passable cells for instant reachability."""
+
+from array import array
+from collections import deque
+
+
+class ComponentIndex:
+    """
+    Connected components of a world's passable cells, kept up to date.
+
+    Every open cell carries a label; labels are merged with a union-find,
+    so two cells are connected exactly when their labels share a root.
+    Removing a wall unions the labels around the opened cell. Placing a
+    wall runs a local check from the cell's open neighbors: searches grow
+    from each of them in turn and merge on contact, and any search that
+    runs out of cells before meeting the others has found a piece that
+    was cut off, which alone is relabelled. The largest piece keeps its
+    label, so the work is bounded by the smaller side of the split.
+
+    Attributes:
+        world (GridWorld): The grid world environment
+        components (int): Number of connected components
+    """
+
+    def __init__(self, world):
+        """
+        Label the world and start listening to wall changes.
+
+        Args:
+            world (GridWorld): World with an occupancy buffer
+        """
+        self.world = world
+        self.rows = world.rows
+        self.cols = world.cols
+        self._blocked = bytearray(world.occupancy())
+        self._labels = array('l', [-1]) * (self.rows * self.cols)
+        self._parent = []
+        self.components = 0
+        self._label_all()
+        world.subscribe(self._on_wall_change)
+
+    def close(self):
+        """Stop listening to wall changes."""
+        self.world.unsubscribe(self._on_wall_change)
+
+    def component(self, pos):
+        """
+        Component id of a position.
+
+        Args:
+            pos (Position): Position to look up
+
+        Returns:
+            int or None: Component id, or None for walls and out-of-bounds
+        """
+        if not (0 <= pos.row < self.rows and 0 <= pos.col < self.cols):
+            return None
+        label = self._labels[pos.row * self.cols + pos.col]
+        return self._find(label) if label >= 0 else None
+
+    def connected(self, a, b):
+        """
+        Check whether two open positions are in the same component.
+
+        Args:
+            a (Position): First position
+            b (Position): Second position
+
+        Returns:
+            bool: True if a path between them exists
+        """
+        if a == b:
+            return True
+        ca = self.component(a)
+        return ca is not None and ca == self.component(b)
+
+    def may_reach(self, start, goal):
+        """
+        Cheap test used by searches to reject impossible queries.
+
+        Only answers False when a search is certain to fail; a start on a
+        wall or outside the grid is left for the search to decide.
+
+        Args:
+            start (Position): Starting position
+            goal (Position): Goal position
+
+        Returns:
+            bool: False if goal is definitely unreachable from start
+        """
+        if start == goal:
+            return True
+        if self.component(start) is None:
+            return True
+        return self.connected(start, goal)
+
+    def _find(self, label):
+        """Union-find root of a label, with path halving."""
+        parent = self._parent
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    def _new_label(self):
+        """Allocate a fresh root label."""
+        label = len(self._parent)
+        self._parent.append(label)
+        return label
+
+    def _neighbors(self, cell):
+        """Open neighbor cell ids."""
+        cols = self.cols
+        blocked = self._blocked
+        col = cell % cols
+        if cell >= cols and not blocked[cell - cols]:
+            yield cell - cols
+        if cell < (self.rows - 1) * cols and not blocked[cell + cols]:
+            yield cell + cols
+        if col > 0 and not blocked[cell - 1]:
+            yield cell - 1
+        if col < cols - 1 and not blocked[cell + 1]:
+            yield cell + 1
+
+    def _label_all(self):
+        """Flood-fill every open cell from scratch."""
+        labels = self._labels
+        # Walls and labelled cells are "seen"; find() jumps to the next open one
+        seen = bytearray(self._blocked)
+        cell = seen.find(0)
+        while cell != -1:
+            label = self._new_label()
+            self.components += 1
+            seen[cell] = 1
+            labels[cell] = label
+            queue = [cell]
+            head = 0
+            while head < len(queue):
+                current = queue[head]
+                head += 1
+                for nxt in self._neighbors(current):
+                    if not seen[nxt]:
+                        seen[nxt] = 1
+                        labels[nxt] = label
+                        queue.append(nxt)
+            cell = seen.find(0, cell + 1)
+
+    def _on_wall_change(self, pos, is_wall):
+        """World listener: keep the labelling in step with the walls."""
+        if not (0 <= pos.row < self.rows and 0 <= pos.col < self.cols):
+            return
+        cell = pos.row * self.cols + pos.col
+        if is_wall:
+            self._close_cell(cell)
+        else:
+            self._open_cell(cell)
+
+    def _open_cell(self, cell):
+        """A wall was removed: join the cell's neighbors into one component."""
+        self._blocked[cell] = 0
+        roots = {self._find(self._labels[n]) for n in self._neighbors(cell)}
+        if not roots:
+            self._labels[cell] = self._new_label()
+            self.components += 1
+            return
+        root = roots.pop()
+        for other in roots:
+            self._parent[other] = root
+        self.components -= len(roots)
+        self._labels[cell] = root
+
+    def _close_cell(self, cell):
+        """A wall was placed: split off any pieces it disconnected."""
+        self._blocked[cell] = 1
+        self._labels[cell] = -1
+        starts = list(self._neighbors(cell))
+        if not starts:
+            self.components -= 1
+            return
+        if len(starts) == 1:
+            return
+
+        # One growing search per neighbor; groups merge when they touch
+        group_of = list(range(len(starts)))
+        owner = {}
+        queues = []
+        members = []
+        for i, start in enumerate(starts):
+            owner[start] = i
+            queues.append(deque([start]))
+            members.append([start])
+        active = list(range(len(starts)))
+
+        def root(group):
+            while group_of[group] != group:
+                group = group_of[group]
+            return group
+
+        while len(active) > 1:
+            for group in list(active):
+                if group not in active:
+                    continue
+                queue = queues[group]
+                if not queue:
+                    # Exhausted without meeting the others: a separate piece
+                    label = self._new_label()
+                    for member in members[group]:
+                        self._labels[member] = label
+                    self.components += 1
+                    active.remove(group)
+                    if len(active) == 1:
+                        break
+                    continue
+
+                current = queue.popleft()
+                for nxt in self._neighbors(current):
+                    other = owner.get(nxt)
+                    if other is None:
+                        owner[nxt] = group
+                        queue.append(nxt)
+                        members[group].append(nxt)
+                        continue
+                    other = root(other)
+                    if other != group:
+                        group_of[other] = group
+                        queue.extend(queues[other])
+                        members[group].extend(members[other])
+                        queues[other] = deque()
+                        members[other] = []
+                        active.remove(other)
@@ -0,0 +1,554 @@
+"""Cooperative multi-agent planning with a space-time reservation table."""
+
+import heapq
+from collections import OrderedDict
+from position import Position
+
+# Direction code of a wait; move codes are indices into agent.DIRECTIONS
+WAIT = -1
+
+
+class ReservationTable:
+    """
+    Cells and moves claimed by already planned agents, per timestep.
+
+    A vertex reservation says "cell c is occupied at time t" and is
+    stored as the integer ``t * cells + c``. An edge reservation stops
+    two agents from swapping cells: when an agent moves from a to b
+    between t and t+1, the reverse move b -> a in that interval is
+    stored as ``(t * cells + b) * 4 + code``. Both live in plain sets of
+    ints, so every check is one hash lookup with no tuple allocation.
+
+    Attributes:
+        cells (int): Number of cells in the grid (``rows * cols``)
+        cols (int): Grid width, used to tell vertical from horizontal moves
+    """
+
+    def __init__(self, cells, cols):
+        """
+        Initialize an empty table.
+
+        Args:
+            cells (int): Number of cells in the grid
+            cols (int): Grid width
+        """
+        self.cells = cells
+        self.cols = cols
+        self.vertices = set()
+        self.edges = set()
+
+    def __len__(self):
+        """
+        Number of vertex reservations.
+
+        Returns:
+            int: Reserved (cell, timestep) pairs
+        """
+        return len(self.vertices)
+
+    def clear(self):
+        """Drop every reservation."""
+        self.vertices.clear()
+        self.edges.clear()
+
+    def is_free(self, cell, t):
+        """
+        Check whether a cell is unclaimed at a timestep.
+
+        Args:
+            cell (int): Cell id
+            t (int): Timestep
+
+        Returns:
+            bool: True if no planned agent occupies cell at t
+        """
+        return t * self.cells + cell not in self.vertices
+
+    def move_code(self, a, b):
+        """
+        Direction code of a move between adjacent cells.
+
+        Args:
+            a (int): Cell moved from
+            b (int): Cell moved to
+
+        Returns:
+            int: Index into agent.DIRECTIONS, or WAIT if a == b
+        """
+        if a == b:
+            return WAIT
+        if a // self.cols != b // self.cols:
+            return 0 if b < a else 1
+        return 2 if b < a else 3
+
+    def reserve(self, path):
+        """
+        Claim every (cell, timestep) of a path and the reverse of each move.
+
+        Args:
+            path (sequence): Cell id at timesteps 0, 1, 2, ...
+        """
+        n = self.cells
+        vertices = self.vertices
+        for t, cell in enumerate(path):
+            vertices.add(t * n + cell)
+        for t in range(len(path) - 1):
+            a, b = path[t], path[t + 1]
+            code = self.move_code(a, b)
+            if code != WAIT:
+                # Codes pair up as up/down and left/right, so ^ 1 reverses
+                self.edges.add((t * n + b) * 4 + (code ^ 1))
+
+
+class ReverseSearch:
+    """
+    Exact distances to one goal, computed lazily by reverse resumable A*.
+
+    The search runs backward from the goal toward ``origin`` with the
+    Manhattan distance to origin as its heuristic. Looking up a cell
+    that is not closed yet resumes the search until it is, so only the
+    cells the planner actually asks about, plus the band around the
+    shortest path from origin, are ever expanded. The heuristic is
+    consistent, so every closed distance is exact whichever cell is
+    asked for, and one search can serve every agent with the same goal.
+
+    Indexing returns the distance, or -1 for walls and for cells that
+    cannot reach the goal, like a precomputed distance array would.
+
+    Attributes:
+        goal (int): Goal cell id
+        origin (int): Cell id the search is steered toward
+        closed (dict): Cell id -> exact distance to the goal
+        nodes_expanded (int): Cells closed so far
+    """
+
+    def __init__(self, occupancy, rows, cols, goal, origin):
+        """
+        Start a search; nothing is expanded until the first lookup.
+
+        Args:
+            occupancy (bytes-like): 1 for a wall, 0 for an open cell
+            rows (int): Number of rows
+            cols (int): Number of columns
+            goal (int): Goal cell id
+            origin (int): Cell id the search heads for first, usually
+                where the first agent bound for goal stands
+        """
+        self.occupancy = occupancy
+        self.rows = rows
+        self.cols = cols
+        self.goal = goal
+        self.origin = origin
+        self.closed = {}
+        self.nodes_expanded = 0
+        self._best = {goal: 0}
+        self._heap = [(self._h(goal), 0, goal)]
+
+    def _h(self, cell):
+        """Manhattan distance from cell to the origin."""
+        row, col = divmod(cell, self.cols)
+        origin_row, origin_col = divmod(self.origin, self.cols)
+        return abs(row - origin_row) + abs(col - origin_col)
+
+    def __getitem__(self, cell):
+        """
+        Distance from a cell to the goal.
+
+        Args:
+            cell (int): Cell id
+
+        Returns:
+            int: Length of a shortest path, or -1 if there is none
+        """
+        distance = self.closed.get(cell)
+        if distance is not None:
+            return distance
+        if self.occupancy[cell]:
+            return -1
+        return self._resume(cell)
+
+    def _resume(self, target):
+        """Expand cells until target is closed; -1 if it never is."""
+        occupancy = self.occupancy
+        cols = self.cols
+        last_row = self.rows - 1
+        last_col = cols - 1
+        origin_row, origin_col = divmod(self.origin, cols)
+        closed = self.closed
+        best = self._best
+        heap = self._heap
+        push = heapq.heappush
+        pop = heapq.heappop
+
+        while heap:
+            _, g, cell = pop(heap)
+            if cell in closed:
+                continue
+            closed[cell] = g
+            self.nodes_expanded += 1
+            row, col = divmod(cell, cols)
+            ng = g + 1
+            for ok, nxt in ((row > 0, cell - cols), (row < last_row, cell + cols),
+                            (col > 0, cell - 1), (col < last_col, cell + 1)):
+                if ok and not occupancy[nxt] and nxt not in closed and ng < best.get(nxt, ng + 1):
+                    best[nxt] = ng
+                    r, c = divmod(nxt, cols)
+                    push(heap, (ng + abs(r - origin_row) + abs(c - origin_col), ng, nxt))
+            if cell == target:
+                return g
+        return -1
+
+
+def _plan_window(occupancy, rows, cols, start, goal, horizon, table, distances=None):
+    """
+    Space-time A* for one agent against a reservation table.
+
+    States are (cell, t) pairs encoded as ``t * cells + cell``; each of
+    the four moves and waiting costs one timestep, so g is always t. The
+    search ends at the first state popped that either is the goal with
+    the goal free for the rest of the window, or lies on the horizon; in
+    the second case its f value makes it the most promising end point,
+    as in windowed hierarchical cooperative A*.
+
+    Args:
+        occupancy (bytes-like): 1 for a wall, 0 for an open cell
+        rows (int): Number of rows
+        cols (int): Number of columns
+        start (int): Start cell id at t = 0
+        goal (int): Goal cell id
+        horizon (int): Last timestep planned
+        table (ReservationTable): Claims of higher-priority agents
+        distances (sequence, optional): True distance to the goal per
+            cell, -1 where unreachable, such as a ReverseSearch
+            (default: Manhattan distance)
+
+    Returns:
+        tuple: (list of horizon + 1 cell ids or None, nodes expanded,
+            moves rejected because of a reservation)
+    """
+    n = rows * cols
+    vertices = table.vertices
+    edges = table.edges
+    goal_row, goal_col = divmod(goal, cols)
+    last_row = rows - 1
+    last_col = cols - 1
+    push = heapq.heappush
+    pop = heapq.heappop
+
+    if distances is not None:
+        h = distances[start]
+        if h < 0:
+            return None, 0, 0
+    else:
+        row, col = divmod(start, cols)
+        h = abs(row - goal_row) + abs(col - goal_col)
+    heap = [(h, h, start)]
+    parent = {start: -1}
+    closed = set()
+    expanded = 0
+    conflicts = 0
+
+    while heap:
+        _, _, key = pop(heap)
+        if key in closed:
+            continue
+        closed.add(key)
+        expanded += 1
+        t, cell = divmod(key, n)
+
+        if t == horizon or (cell == goal and all(
+                s * n + cell not in vertices for s in range(t + 1, horizon + 1))):
+            path = []
+            while key != -1:
+                path.append(key % n)
+                key = parent[key]
+            path.reverse()
+            path.extend([cell] * (horizon + 1 - len(path)))
+            return path, expanded, conflicts
+
+        row, col = divmod(cell, cols)
+        base = (t + 1) * n
+        edge_base = (t * n + cell) * 4
+        candidates = (
+            (True, cell, WAIT),
+            (row > 0, cell - cols, 0),
+            (row < last_row, cell + cols, 1),
+            (col > 0, cell - 1, 2),
+            (col < last_col, cell + 1, 3),
+        )
+        for ok, nxt, code in candidates:
+            if not ok or occupancy[nxt]:
+                continue
+            nkey = base + nxt
+            if nkey in parent:
+                continue
+            if nkey in vertices or (code != WAIT and edge_base + code in edges):
+                conflicts += 1
+                continue
+            if distances is not None:
+                h = distances[nxt]
+                if h < 0:
+                    continue
+            else:
+                r, c = divmod(nxt, cols)
+                h = abs(r - goal_row) + abs(c - goal_col)
+            parent[nkey] = key
+            push(heap, (t + 1 + h, h, nkey))
+
+    return None, expanded, conflicts
+
+
+class CooperativePlanner:
+    """
+    Collision-free movement for many agents sharing one world.
+
+    Agents are planned one at a time in priority order (the order they
+    were given, except that agents already on their goal go last) with
+    space-time A*; each plan is written into a ReservationTable that
+    later agents must route around, waiting in place when that is
+    better. Planning looks only ``horizon`` timesteps ahead. Every
+    ``replan_every`` steps the table is cleared and all agents plan a
+    fresh window from where they stand, so memory and work per window
+    stay proportional to agents times horizon no matter how long the
+    agents travel.
+
+    By default each window's search is guided by the exact distance to
+    the agent's goal, from a ReverseSearch shared by every agent with
+    that goal. Searches are computed lazily and kept in a bounded LRU
+    cache. With plain Manhattan distance, windows end at the horizon cell
+    that looks closest, and agents can pace up and down a dead end that
+    points at the goal without ever leaving it.
+
+    Within a window agents never share a cell or swap cells, except
+    after a failure: an agent whose search finds no collision-free
+    window at all (boxed in by higher-priority plans) waits in place,
+    and that is counted in ``failures``.
+
+    Attributes:
+        world (GridWorld): World with an occupancy buffer
+        goals (list): Goal Position of each agent
+        horizon (int): Timesteps planned per window
+        replan_every (int): Steps executed before the next window
+        time (int): Timesteps executed so far
+        conflicts (int): Moves rejected because they clashed with a
+            higher-priority agent's reservation
+        replans (int): Single-agent window searches run
+        windows (int): Planning rounds over all agents
+        failures (int): Searches that found no collision-free window
+        nodes_expanded (int): Space-time states expanded in total
+    """
+
+    def __init__(self, world, starts, goals, horizon=32, replan_every=None,
+                 heuristic="distance", cache_goals=128):
+        """
+        Initialize the planner; the first window is planned lazily.
+
+        Args:
+            world (GridWorld): World with an occupancy buffer
+            starts (list): Starting Position per agent, or Agent objects,
+                whose ``at`` is then updated by step()
+            goals (list): Goal Position per agent, same order
+            horizon (int): Timesteps per planning window (default: 32)
+            replan_every (int, optional): Steps between windows, at most
+                horizon (default: horizon // 2)
+            heuristic (str): "distance" for exact distances from a lazy
+                ReverseSearch per goal (default), or "manhattan", which
+                costs nothing but can leave agents stuck behind walls
+            cache_goals (int): Most goals whose ReverseSearch is kept;
+                the least recently used is dropped first (default: 128)
+        """
+        if len(starts) != len(goals):
+            raise ValueError("need one goal per agent")
+        if horizon < 1:
+            raise ValueError("horizon must be >= 1")
+        if replan_every is None:
+            replan_every = max(1, horizon // 2)
+        if not 1 <= replan_every <= horizon:
+            raise ValueError("replan_every must be between 1 and horizon")
+        if heuristic not in ("manhattan", "distance"):
+            raise ValueError(f"unknown heuristic {heuristic!r}")
+        if cache_goals < 1:
+            raise ValueError("cache_goals must be >= 1")
+
+        self.world = world
+        starts = list(starts)
+        self.agents = starts if starts and all(hasattr(s, "at") for s in starts) else []
+        positions = [s.at for s in starts] if self.agents else starts
+        self.goals = list(goals)
+        self.horizon = horizon
+        self.replan_every = replan_every
+        self.heuristic = heuristic
+        self.cache_goals = cache_goals
+        cols = world.cols
+        occupancy = world.occupancy()
+        self._cells = [pos.row * cols + pos.col for pos in positions]
+        self._goal_cells = [pos.row * cols + pos.col for pos in self.goals]
+        for pos in positions + self.goals:
+            if not world.in_bounds(pos) or occupancy[pos.row * cols + pos.col]:
+                raise ValueError(f"{pos} is not an open cell")
+        if len(set(self._cells)) != len(self._cells):
+            raise ValueError("agents must start on distinct cells")
+
+        self.table = ReservationTable(world.rows * cols, cols)
+        self._plans = None
+        self._offset = 0
+        self._searches = OrderedDict()
+        self._searches_version = None
+        self.time = 0
+        self.conflicts = 0
+        self.replans = 0
+        self.windows = 0
+        self.failures = 0
+        self.nodes_expanded = 0
+        self._dropped_expanded = 0
+
+    def __len__(self):
+        """
+        Number of agents.
+
+        Returns:
+            int: Agents being planned
+        """
+        return len(self._cells)
+
+    @property
+    def positions(self):
+        """
+        Current position of every agent.
+
+        Returns:
+            list: Position objects, in priority order
+        """
+        cols = self.world.cols
+        return [Position(cell // cols, cell % cols) for cell in self._cells]
+
+    @property
+    def done(self):
+        """
+        Whether every agent stands on its goal.
+
+        Returns:
+            bool: True once all agents have arrived
+        """
+        return self._cells == self._goal_cells
+
+    @property
+    def heuristic_expanded(self):
+        """
+        Cells expanded by reverse searches, including dropped ones.
+
+        Returns:
+            int: Total ReverseSearch expansions so far
+        """
+        return self._dropped_expanded + sum(
+            search.nodes_expanded for search in self._searches.values())
+
+    def _goal_distances(self, goal, cell):
+        """
+        Lazy exact distances to a goal, shared by goal, LRU-cached.
+
+        Args:
+            goal (int): Goal cell id
+            cell (int): Where the asking agent stands; a new search is
+                steered toward it
+
+        Returns:
+            ReverseSearch: Search answering distance lookups
+        """
+        world = self.world
+        version = getattr(world, "version", None)
+        searches = self._searches
+        if version != self._searches_version:
+            self._drop_searches()
+            self._searches_version = version
+        search = searches.get(goal)
+        if search is None:
+            search = searches[goal] = ReverseSearch(
+                world.occupancy(), world.rows, world.cols, goal, cell)
+            if len(searches) > self.cache_goals:
+                _, evicted = searches.popitem(last=False)
+                self._dropped_expanded += evicted.nodes_expanded
+        else:
+            searches.move_to_end(goal)
+        return search
+
+    def _drop_searches(self):
+        """Forget every cached search, keeping the expansion count."""
+        for search in self._searches.values():
+            self._dropped_expanded += search.nodes_expanded
+        self._searches.clear()
+
+    def plan(self):
+        """
+        Plan the next window for every agent, in priority order.
+
+        Agents standing on their goal come after all others, keeping
+        their relative order.
+
+        Returns:
+            list: Per agent, its Positions at timesteps 0..horizon of the
+                window (index 0 is where it stands now)
+        """
+        world = self.world
+        occupancy = world.occupancy()
+        rows, cols = world.rows, world.cols
+        table = self.table
+        table.clear()
+
+        cells = self._cells
+        goals = self._goal_cells
+        # Agents already on their goal plan last, so one parked in a
+        # doorway steps aside for agents still travelling
+        order = sorted(range(len(cells)), key=lambda i: cells[i] == goals[i])
+        plans = [None] * len(cells)
+        for i in order:
+            cell, goal = cells[i], goals[i]
+            distances = self._goal_distances(goal, cell) if self.heuristic == "distance" else None
+            path, expanded, conflicts = _plan_window(
+                occupancy, rows, cols, cell, goal, self.horizon, table, distances)
+            self.replans += 1
+            self.nodes_expanded += expanded
+            self.conflicts += conflicts
+            if path is None:
+                self.failures += 1
+                path = [cell] * (self.horizon + 1)
+            table.reserve(path)
+            plans[i] = path
+
+        self.windows += 1
+        self._plans = plans
+        self._offset = 0
+        return [[Position(c // cols, c % cols) for c in path] for path in plans]
+
+    def step(self):
+        """
+        Advance every agent one timestep, planning a new window when due.
+
+        Returns:
+            list: Position of every agent after the step
+        """
+        if self._plans is None or self._offset >= self.replan_every:
+            self.plan()
+        self._offset += 1
+        self._cells = [path[self._offset] for path in self._plans]
+        self.time += 1
+        if self.agents:
+            for agent, pos in zip(self.agents, self.positions):
+                agent.at = pos
+        return self.positions
+
+    def run(self, max_steps=None):
+        """
+        Step until every agent has arrived or a step limit is reached.
+
+        Args:
+            max_steps (int, optional): Most timesteps to execute
+
+        Returns:
+            int: Timesteps executed by this call
+        """
+        steps = 0
+        while not self.done and (max_steps is None or steps < max_steps):
+            self.step()
+            steps += 1
+        return steps
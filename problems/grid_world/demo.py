@@ -4,6 +4,7 @@ from position import Position
 from grid_world import GridWorld
 from agent import Agent
 from path import Pathfinder
+from render import Renderer
 import time
 
 
@@ -31,11 +32,13 @@ def main():
     for wall in walls:
         world.place_wall(wall)
 
+    renderer = Renderer(world)
+
     # Print initial world
     print("\nInitial Grid World:")
     print("Legend: S=start, G=goal, #=wall, .=empty")
     print("-" * 60)
-    world.render()
+    renderer.render()
 
     # Use BFS to find path
     print("\n" + "=" * 60)
@@ -59,7 +62,7 @@ def main():
     # Render path on grid
     print("\nGrid with Path (*):")
     print("-" * 60)
-    world.render(path=path)
+    renderer.render(path=path)
 
     # Step agent along path
     print("\n" + "=" * 60)
@@ -67,16 +70,19 @@ def main():
     print("=" * 60)
 
     agent = Agent(world)
+    time.sleep(1.0)
 
+    # draw() clears the screen once, then repaints only the cells the
+    # agent left and entered; the status line goes below the frame
     for i, position in enumerate(path):
-        print(f"\nStep {i + 1}/{len(path)} - Agent at {position}")
-        print("-" * 60)
-        world.render(path=path, agent=position)
+        renderer.draw(path=path, agent=position)
+        print(f"\x1b[KStep {i + 1}/{len(path)} - Agent at {position}", end="", flush=True)
 
         if i < len(path) - 1:
             time.sleep(0.5)  # Pause for visualization
+    renderer.close()
 
-    print("\n" + "=" * 60)
+    print("\n\n" + "=" * 60)
     print("Agent reached the goal!")
     print("=" * 60)
 
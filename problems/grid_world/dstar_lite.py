@@ -0,0 +1,239 @@
+"""Incremental replanning with D* Lite."""
+
+import heapq
+from array import array
+from position import Position
+
+INF = float("inf")
+
+
+class DStarLite:
+    """
+    D* Lite planner that repairs its search as walls change.
+
+    The search runs backward from the goal, so g values are distances to
+    the goal and stay valid while the start moves. The planner subscribes
+    to the world's wall changes; the next call to next_step() or path()
+    re-examines only the changed cells and the part of the search tree
+    whose distances they affect.
+
+    Attributes:
+        world (GridWorld): The grid world environment
+        goal (Position): Goal position
+        start (Position): Position the plan currently starts from
+        nodes_expanded (int): Nodes expanded by the most recent replan
+        total_expanded (int): Nodes expanded since the planner was created
+    """
+
+    def __init__(self, world, start=None, goal=None):
+        """
+        Initialize the planner and compute the first plan.
+
+        Args:
+            world (GridWorld): The grid world environment
+            start (Position, optional): Starting position (default: world.start)
+            goal (Position, optional): Goal position (default: world.goal)
+        """
+        self.world = world
+        self.start = start if start is not None else world.start
+        self.goal = goal if goal is not None else world.goal
+        self.nodes_expanded = 0
+        self.total_expanded = 0
+
+        rows = world.rows
+        cols = world.cols
+        self._cols = cols
+        self._last_row = rows - 1
+        self._blocked = bytearray(world.occupancy())
+        self._g = array('d', [INF]) * (rows * cols)
+        self._rhs = array('d', [INF]) * (rows * cols)
+        self._km = 0
+        self._heap = []
+        self._open = {}
+        self._pending = []
+
+        self._goal_cell = self._cell(self.goal)
+        self._start_cell = self._cell(self.start)
+        self._last_cell = self._start_cell
+        self._rhs[self._goal_cell] = 0
+        self._push(self._goal_cell)
+
+        world.subscribe(self._on_wall_change)
+        self._compute()
+
+    def close(self):
+        """Stop listening to wall changes."""
+        self.world.unsubscribe(self._on_wall_change)
+
+    def next_step(self, pos):
+        """
+        Next position on a shortest path from pos to the goal.
+
+        Moves the plan's start to pos and repairs the plan for any wall
+        changes seen since the last call.
+
+        Args:
+            pos (Position): Current position
+
+        Returns:
+            Position or None: Adjacent position to move to, or None if pos
+                is the goal or the goal is unreachable
+        """
+        self._replan(pos)
+        cell = self._start_cell
+        if cell == self._goal_cell or self._g[cell] == INF:
+            return None
+        best = self._best_successor(cell)
+        if best is None:
+            return None
+        return Position(best // self._cols, best % self._cols)
+
+    def path(self, pos=None):
+        """
+        Full shortest path from pos (default: current start) to the goal.
+
+        Args:
+            pos (Position, optional): Position to plan from
+
+        Returns:
+            list or None: List of Position objects, or None if unreachable
+        """
+        self._replan(pos if pos is not None else self.start)
+        cell = self._start_cell
+        if self._g[cell] == INF and cell != self._goal_cell:
+            return None
+
+        cols = self._cols
+        cells = [cell]
+        while cell != self._goal_cell:
+            cell = self._best_successor(cell)
+            if cell is None:
+                return None
+            cells.append(cell)
+        return [Position(c // cols, c % cols) for c in cells]
+
+    def _on_wall_change(self, pos, is_wall):
+        """World listener: record a wall change for the next replan."""
+        if 0 <= pos.row <= self._last_row and 0 <= pos.col < self._cols:
+            cell = self._cell(pos)
+            self._blocked[cell] = 1 if is_wall else 0
+            self._pending.append(cell)
+
+    def _replan(self, pos):
+        """Move the start to pos, apply pending changes and repair the plan."""
+        cell = self._cell(pos)
+        if cell == self._start_cell and not self._pending:
+            return
+        self.start = pos
+        self._start_cell = cell
+        self._km += self._h(self._last_cell)
+        self._last_cell = cell
+
+        pending = self._pending
+        self._pending = []
+        for changed in pending:
+            self._update(changed)
+            for neighbor in self._neighbors(changed):
+                self._update(neighbor)
+        self._compute()
+
+    def _cell(self, pos):
+        """Flat cell id of a position."""
+        return pos.row * self._cols + pos.col
+
+    def _h(self, cell):
+        """Manhattan distance from the current start to cell."""
+        cols = self._cols
+        start = self._start_cell
+        return abs(cell // cols - start // cols) + abs(cell % cols - start % cols)
+
+    def _key(self, cell):
+        """D* Lite priority of a cell."""
+        best = min(self._g[cell], self._rhs[cell])
+        return (best + self._h(cell) + self._km, best)
+
+    def _push(self, cell):
+        """Insert or reprioritize a cell in the open list."""
+        key = self._key(cell)
+        self._open[cell] = key
+        heapq.heappush(self._heap, (key[0], key[1], cell))
+
+    def _neighbors(self, cell):
+        """In-bounds neighbor cell ids, in neighbors_4() order."""
+        cols = self._cols
+        col = cell % cols
+        if cell >= cols:
+            yield cell - cols
+        if cell // cols < self._last_row:
+            yield cell + cols
+        if col > 0:
+            yield cell - 1
+        if col < cols - 1:
+            yield cell + 1
+
+    def _best_successor(self, cell):
+        """Open neighbor with the smallest g, or None if all are blocked."""
+        best = None
+        best_g = INF
+        for neighbor in self._neighbors(cell):
+            if not self._blocked[neighbor] and self._g[neighbor] < best_g:
+                best = neighbor
+                best_g = self._g[neighbor]
+        return best
+
+    def _update(self, cell):
+        """Recompute rhs(cell) and its place in the open list."""
+        if cell != self._goal_cell:
+            best = INF
+            if not self._blocked[cell]:
+                g = self._g
+                blocked = self._blocked
+                for neighbor in self._neighbors(cell):
+                    if not blocked[neighbor] and g[neighbor] + 1 < best:
+                        best = g[neighbor] + 1
+            self._rhs[cell] = best
+        self._open.pop(cell, None)
+        if self._g[cell] != self._rhs[cell]:
+            self._push(cell)
+
+    def _top(self):
+        """Smallest live key in the heap, dropping stale entries."""
+        heap = self._heap
+        while heap:
+            k1, k2, cell = heap[0]
+            if self._open.get(cell) == (k1, k2):
+                return (k1, k2), cell
+            heapq.heappop(heap)
+        return None, None
+
+    def _compute(self):
+        """Expand nodes until the start's distance is locally consistent."""
+        g = self._g
+        rhs = self._rhs
+        start = self._start_cell
+        expanded = 0
+
+        while True:
+            key, cell = self._top()
+            if key is None:
+                break
+            if not (key < self._key(start) or rhs[start] != g[start]):
+                break
+            heapq.heappop(self._heap)
+            new_key = self._key(cell)
+            if key < new_key:
+                self._push(cell)
+                continue
+
+            del self._open[cell]
+            expanded += 1
+            if g[cell] > rhs[cell]:
+                g[cell] = rhs[cell]
+            else:
+                g[cell] = INF
+                self._update(cell)
+            for neighbor in self._neighbors(cell):
+                self._update(neighbor)
+
+        self.nodes_expanded = expanded
+        self.total_expanded += expanded
@@ -0,0 +1,165 @@
+"""Single-source distance fields and flow fields over a grid world."""
+
+import numpy as np
+from agent import DIRECTIONS, DELTAS
+from position import Position
+
+# Code stored in a flow field for cells with no move (goal, walls, unreachable)
+NO_DIRECTION = -1
+
+
+def distance_field(world, goal):
+    """
+    BFS distance from every cell to goal, as a NumPy array.
+
+    The search is a vectorized wavefront: each BFS level is an array of
+    cell ids, and its neighbors are generated, filtered and deduplicated
+    with whole-array operations, so the Python loop runs once per level
+    rather than once per cell.
+
+    Args:
+        world (GridWorld): World with an occupancy buffer
+        goal (Position): Source cell of the field
+
+    Returns:
+        np.ndarray: ``int32`` array of shape ``(rows, cols)``; steps to the
+            goal, or -1 for walls and unreachable cells
+    """
+    rows = world.rows
+    cols = world.cols
+    n = rows * cols
+    free = np.frombuffer(world.occupancy(), dtype=np.uint8) == 0
+    dist = np.full(n, -1, dtype=np.int32)
+
+    if not world.in_bounds(goal) or not free[goal.row * cols + goal.col]:
+        return dist.reshape(rows, cols)
+
+    frontier = np.array([goal.row * cols + goal.col], dtype=np.int64)
+    dist[frontier] = 0
+    level = 0
+    while frontier.size:
+        level += 1
+        col = frontier % cols
+        candidates = np.concatenate((
+            frontier[frontier >= cols] - cols,
+            frontier[frontier < n - cols] + cols,
+            frontier[col > 0] - 1,
+            frontier[col < cols - 1] + 1,
+        ))
+        candidates = candidates[free[candidates] & (dist[candidates] < 0)]
+        frontier = np.unique(candidates)
+        dist[frontier] = level
+
+    return dist.reshape(rows, cols)
+
+
+def flow_directions(dist):
+    """
+    Per-cell direction code toward the goal of a distance field.
+
+    Each reachable cell points at a neighbor one step closer to the goal,
+    preferring up, down, left, right in that order (the same order BFS
+    explores Position.neighbors_4()).
+
+    Args:
+        dist (np.ndarray): Distance field from distance_field()
+
+    Returns:
+        np.ndarray: ``int8`` array of indexes into agent.DIRECTIONS, or
+            NO_DIRECTION where there is no move
+    """
+    rows, cols = dist.shape
+    directions = np.full(dist.shape, NO_DIRECTION, dtype=np.int8)
+    target = dist - 1
+    reachable = dist > 0
+    # A -2 border never matches a target, so edge cells need no special case
+    padded = np.pad(dist, 1, constant_values=-2)
+
+    for code, name in enumerate(DIRECTIONS):
+        dr, dc = DELTAS[name]
+        neighbor = padded[1 + dr:1 + dr + rows, 1 + dc:1 + dc + cols]
+        pick = reachable & (directions == NO_DIRECTION) & (neighbor == target)
+        directions[pick] = code
+
+    return directions
+
+
+class FlowField:
+    """
+    Distance field plus next-direction field toward one goal.
+
+    Any number of agents can read their next move in O(1) instead of
+    running their own search. FlowField has the same ``next_step(pos)``
+    method as the planners, so ``Agent.follow(field)`` works.
+
+    Attributes:
+        goal (Position): Goal the field leads to
+        version (int): World version the field was computed for
+        distances (np.ndarray): Steps to the goal per cell, -1 if none
+        directions (np.ndarray): Direction code per cell, NO_DIRECTION if none
+    """
+
+    def __init__(self, world, goal=None):
+        """
+        Compute the fields for a world.
+
+        Args:
+            world (GridWorld): World with an occupancy buffer
+            goal (Position, optional): Goal position (default: world.goal)
+        """
+        self.goal = goal if goal is not None else world.goal
+        self.version = getattr(world, "version", None)
+        self.distances = distance_field(world, self.goal)
+        self.directions = flow_directions(self.distances)
+
+    def _in_bounds(self, pos):
+        """Check pos lies inside the field."""
+        rows, cols = self.distances.shape
+        return 0 <= pos.row < rows and 0 <= pos.col < cols
+
+    def distance(self, pos):
+        """
+        Steps from pos to the goal.
+
+        Args:
+            pos (Position): Position to look up
+
+        Returns:
+            int or None: Distance, or None if the goal is unreachable
+        """
+        if not self._in_bounds(pos):
+            return None
+        d = int(self.distances[pos.row, pos.col])
+        return d if d >= 0 else None
+
+    def direction(self, pos):
+        """
+        Direction to move from pos.
+
+        Args:
+            pos (Position): Position to look up
+
+        Returns:
+            str or None: 'up', 'down', 'left' or 'right', or None at the
+                goal and at cells that cannot reach it
+        """
+        if not self._in_bounds(pos):
+            return None
+        code = self.directions[pos.row, pos.col]
+        return DIRECTIONS[code] if code != NO_DIRECTION else None
+
+    def next_step(self, pos):
+        """
+        Next position from pos toward the goal.
+
+        Args:
+            pos (Position): Current position
+
+        Returns:
+            Position or None: Adjacent position, or None if there is no move
+        """
+        name = self.direction(pos)
+        if name is None:
+            return None
+        dr, dc = DELTAS[name]
+        return Position(pos.row + dr, pos.col + dc)
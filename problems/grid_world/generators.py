@@ -0,0 +1,164 @@
+"""Seeded map generators for tests and benchmarks."""
+
+import random
+from grid_world import GridWorld
+from occupancy import OccupancyGrid
+from position import Position
+
+
+def _threshold_table(density):
+    """Byte -> cell table marking a ``density`` share of byte values as walls."""
+    cutoff = round(density * 256)
+    return bytes(1 if value < cutoff else 0 for value in range(256))
+
+
+def _world(rows, cols, cells, start, goal):
+    """Compact world over cells with start and goal cleared."""
+    cells[start.row * cols + start.col] = 0
+    cells[goal.row * cols + goal.col] = 0
+    return GridWorld(rows, cols, walls=OccupancyGrid(rows, cols, cells),
+                     start=start, goal=goal)
+
+
+def random_fill(rows, cols, density=0.25, seed=0):
+    """
+    Independent random walls.
+
+    Args:
+        rows (int): Number of rows
+        cols (int): Number of columns
+        density (float): Share of cells that are walls (default: 0.25)
+        seed (int): Random seed
+
+    Returns:
+        GridWorld: Compact world, start (0, 0) and goal (rows-1, cols-1)
+    """
+    rng = random.Random(seed)
+    cells = bytearray(rng.randbytes(rows * cols)).translate(_threshold_table(density))
+    return _world(rows, cols, cells, Position(0, 0), Position(rows - 1, cols - 1))
+
+
+def maze(rows, cols, seed=0):
+    """
+    Perfect maze carved by a recursive backtracker.
+
+    Rooms sit on even coordinates and walls between them are knocked
+    out by a depth-first walk (with an explicit stack), so there is
+    exactly one path between any two rooms.
+
+    Args:
+        rows (int): Number of rows
+        cols (int): Number of columns
+        seed (int): Random seed
+
+    Returns:
+        GridWorld: Compact world, start (0, 0) and goal the room nearest
+            (rows-1, cols-1)
+    """
+    rng = random.Random(seed)
+    cells = bytearray(b"\x01") * (rows * cols)
+    room_rows = (rows + 1) // 2
+    room_cols = (cols + 1) // 2
+    visited = bytearray(room_rows * room_cols)
+    steps = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+    visited[0] = 1
+    cells[0] = 0
+    stack = [(0, 0)]
+    while stack:
+        r, c = stack[-1]
+        options = [(r + dr, c + dc) for dr, dc in steps
+                   if 0 <= r + dr < room_rows and 0 <= c + dc < room_cols
+                   and not visited[(r + dr) * room_cols + c + dc]]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc = options[rng.randrange(len(options))]
+        visited[nr * room_cols + nc] = 1
+        cells[(r + nr) * cols + (c + nc)] = 0
+        cells[2 * nr * cols + 2 * nc] = 0
+        stack.append((nr, nc))
+
+    goal = Position(2 * (room_rows - 1), 2 * (room_cols - 1))
+    return _world(rows, cols, cells, Position(0, 0), goal)
+
+
+def _spans(walls, length):
+    """(first, stop) ranges of the open stretches between wall lines."""
+    bounds = [-1, *walls, length]
+    return [(a + 1, b) for a, b in zip(bounds, bounds[1:])]
+
+
+def rooms(rows, cols, room_size=10, seed=0):
+    """
+    Rectangular rooms separated by one-cell walls with a door per side.
+
+    Args:
+        rows (int): Number of rows
+        cols (int): Number of columns
+        room_size (int): Distance between parallel walls (default: 10)
+        seed (int): Random seed
+
+    Returns:
+        GridWorld: Compact world, start (0, 0) and goal (rows-1, cols-1)
+    """
+    rng = random.Random(seed)
+    cells = bytearray(rows * cols)
+    # Walls stop short of the last row/column so every room has floor
+    wall_rows = range(room_size, rows - 1, room_size)
+    wall_cols = range(room_size, cols - 1, room_size)
+    for r in wall_rows:
+        cells[r * cols:(r + 1) * cols] = b"\x01" * cols
+    for c in wall_cols:
+        for r in range(rows):
+            cells[r * cols + c] = 1
+
+    # One door in each wall segment between two rooms
+    col_spans = _spans(wall_cols, cols)
+    row_spans = _spans(wall_rows, rows)
+    for r in wall_rows:
+        for first, last in col_spans:
+            cells[r * cols + rng.randrange(first, last)] = 0
+    for c in wall_cols:
+        for first, last in row_spans:
+            cells[rng.randrange(first, last) * cols + c] = 0
+
+    return _world(rows, cols, cells, Position(0, 0), Position(rows - 1, cols - 1))
+
+
+def open_field(rows, cols, obstacles=None, seed=0):
+    """
+    Mostly open ground with scattered rectangular obstacles.
+
+    Args:
+        rows (int): Number of rows
+        cols (int): Number of columns
+        obstacles (int, optional): Number of obstacles (default: about
+            one per 400 cells)
+        seed (int): Random seed
+
+    Returns:
+        GridWorld: Compact world, start (0, 0) and goal (rows-1, cols-1)
+    """
+    rng = random.Random(seed)
+    if obstacles is None:
+        obstacles = rows * cols // 400
+    cells = bytearray(rows * cols)
+    for _ in range(obstacles):
+        height = rng.randint(1, 6)
+        width = rng.randint(1, 6)
+        top = rng.randrange(rows)
+        left = rng.randrange(cols)
+        span = min(width, cols - left)
+        for r in range(top, min(top + height, rows)):
+            cells[r * cols + left:r * cols + left + span] = b"\x01" * span
+    return _world(rows, cols, cells, Position(0, 0), Position(rows - 1, cols - 1))
+
+
+# Generator name -> function(rows, cols, seed=...)
+GENERATORS = {
+    "random": random_fill,
+    "maze": maze,
+    "rooms": rooms,
+    "open": open_field,
+}
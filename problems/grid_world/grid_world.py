@@ -1,6 +1,7 @@
 """Grid world environment for navigation."""
 
-from position import Position
+from position import Position, PositionPool
+from occupancy import OccupancyGrid, BitOccupancyGrid, WallSet
 
 
 class GridWorld:
@@ -10,27 +11,261 @@ class GridWorld:
     Attributes:
         rows (int): Number of rows
         cols (int): Number of columns
-        walls (set): Set of Position objects representing walls
+        walls (WallSet, OccupancyGrid or BitOccupancyGrid): Wall positions;
+            editing it directly counts as a wall change, like place_wall
         start (Position): Starting position
         goal (Position): Goal position
+        pool (PositionPool or None): Shared Position instances, if interning
+        costs (bytearray or None): Cost of entering each cell (1-255),
+            row-major; None while every cell costs 1
+        version (int): Modification counter, bumped whenever a wall is
+            placed or removed (through place_wall/remove_wall or directly
+            on ``walls``), or a cost changes
+        component_index (ComponentIndex or None): Connected-component
+            labelling, once built with build_component_index()
     """
 
-    def __init__(self, rows, cols, walls=None, start=None, goal=None):
+    def __init__(self, rows, cols, walls=None, start=None, goal=None,
+                 compact=False, intern=False):
         """
         Initialize a grid world.
 
         Args:
             rows (int): Number of rows
             cols (int): Number of columns
-            walls (set, optional): Set of wall positions
+            walls (set, optional): Wall positions; a plain set is copied
+                into a WallSet
             start (Position, optional): Starting position (default: (0, 0))
             goal (Position, optional): Goal position (default: (rows-1, cols-1))
+            compact (bool): Store walls in a one-byte-per-cell OccupancyGrid
+                instead of a set (default: False)
+            intern (bool): Keep a PositionPool so positions handed out by
+                the world share one instance per cell (default: False)
         """
         self.rows = rows
         self.cols = cols
-        self.walls = walls if walls is not None else set()
+        if compact and not isinstance(walls, OccupancyGrid):
+            walls = OccupancyGrid.from_positions(rows, cols, walls or ())
+        self._occupancy_cache = None
+        self._listeners = []
+        self.version = 0
+        self._walls = self._track(walls if walls is not None else ())
         self.start = start if start is not None else Position(0, 0)
         self.goal = goal if goal is not None else Position(rows - 1, cols - 1)
+        self.pool = PositionPool(rows, cols) if intern else None
+        self.costs = None
+        self._fields = {}
+        self.component_index = None
+
+    @property
+    def walls(self):
+        """
+        Wall store of the world.
+
+        Returns:
+            WallSet, OccupancyGrid or BitOccupancyGrid: Wall positions
+        """
+        return self._walls
+
+    @walls.setter
+    def walls(self, walls):
+        """
+        Replace the wall store and start tracking its changes.
+
+        Subscribers are told about every cell whose wall state differs
+        between the old and the new store, one call per cell, exactly as
+        if the walls had been changed one at a time. The old store stops
+        reporting to this world. Assigning the current store back, as
+        augmented assignment does, changes nothing.
+
+        Args:
+            walls: OccupancyGrid or BitOccupancyGrid, used as is, or an
+                iterable of wall positions, copied into a WallSet
+        """
+        if walls is self._walls:
+            return
+        before = bytes(self.occupancy()) if self._listeners else None
+        self._walls.on_change = None
+        self._walls = self._track(walls)
+        self._occupancy_cache = None
+        self.version += 1
+        if before is not None:
+            self._notify_changes(before, self.occupancy())
+
+    def _notify_changes(self, before, after):
+        """Call listeners for every cell that differs between two buffers."""
+        n = len(before)
+        changed = (int.from_bytes(before, "big") ^ int.from_bytes(after, "big")).to_bytes(n, "big")
+        cols = self.cols
+        cell = changed.find(1)
+        while cell != -1:
+            pos = Position(cell // cols, cell % cols)
+            is_wall = after[cell] == 1
+            for listener in list(self._listeners):
+                listener(pos, is_wall)
+            cell = changed.find(1, cell + 1)
+
+    def _track(self, walls):
+        """Wrap walls in a store that reports changes to this world."""
+        if not isinstance(walls, (OccupancyGrid, BitOccupancyGrid, WallSet)):
+            walls = WallSet(walls)
+        walls.on_change = self._wall_changed
+        return walls
+
+    def _wall_changed(self, pos, is_wall):
+        """Record a change made to the wall store and notify listeners."""
+        self.version += 1
+        cells = self._occupancy_cache
+        if cells is not None:
+            row = pos.row
+            col = pos.col
+            if 0 <= row < self.rows and 0 <= col < self.cols:
+                cells[row * self.cols + col] = 1 if is_wall else 0
+        for listener in self._listeners:
+            listener(pos, is_wall)
+
+    @classmethod
+    def from_array(cls, array, start=None, goal=None):
+        """
+        Build a compact world from a 2D array (nonzero = wall).
+
+        Args:
+            array: NumPy array or sequence of rows
+            start (Position, optional): Starting position
+            goal (Position, optional): Goal position
+
+        Returns:
+            GridWorld: World backed by an OccupancyGrid
+        """
+        grid = OccupancyGrid.from_array(array)
+        return cls(grid.rows, grid.cols, walls=grid, start=start, goal=goal)
+
+    @classmethod
+    def from_ascii(cls, text):
+        """
+        Build a compact world from an ASCII map using the render legend.
+
+        ``#`` is a wall, ``S`` the start, ``G`` the goal; ``.``, ``*`` and
+        ``A`` are open cells. Blank lines are ignored.
+
+        Args:
+            text (str): Map text, one line per row
+
+        Returns:
+            GridWorld: World backed by an OccupancyGrid
+        """
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        rows = len(lines)
+        cols = len(lines[0]) if rows else 0
+        cells = bytearray(rows * cols)
+        start = goal = None
+
+        for r, line in enumerate(lines):
+            if len(line) != cols:
+                raise ValueError(f"row {r} has {len(line)} cells, expected {cols}")
+            for c, ch in enumerate(line):
+                if ch == "#":
+                    cells[r * cols + c] = 1
+                elif ch == "S":
+                    start = Position(r, c)
+                elif ch == "G":
+                    goal = Position(r, c)
+                elif ch not in ".*A":
+                    raise ValueError(f"unknown map character {ch!r} at ({r},{c})")
+
+        grid = OccupancyGrid(rows, cols, cells)
+        return cls(rows, cols, walls=grid, start=start, goal=goal)
+
+    def occupancy(self):
+        """
+        Row-major wall buffer, one byte per cell (1 = wall).
+
+        For a compact world this is the live buffer; for set-backed and
+        bit-packed worlds it is built once per wall store and then patched
+        cell by cell as walls change, so it is live as well. Either way it
+        must not be modified.
+
+        Returns:
+            bytearray: ``rows * cols`` cells indexed by ``row * cols + col``
+        """
+        walls = self._walls
+        if isinstance(walls, OccupancyGrid):
+            return walls.cells
+        cells = self._occupancy_cache
+        if cells is None:
+            if hasattr(walls, "unpack"):
+                cells = walls.unpack()
+            else:
+                cells = OccupancyGrid.from_positions(self.rows, self.cols, walls).cells
+            self._occupancy_cache = cells
+        return cells
+
+    def distance_field(self, goal=None):
+        """
+        BFS distance from every cell to goal as a NumPy array.
+
+        Args:
+            goal (Position, optional): Goal position (default: self.goal)
+
+        Returns:
+            np.ndarray: ``int32`` array of shape ``(rows, cols)``, -1 for
+                walls and cells that cannot reach the goal
+        """
+        return self.flow_field(goal).distances
+
+    def flow_field(self, goal=None):
+        """
+        Distance and next-direction fields toward goal, cached per version.
+
+        Requires NumPy.
+
+        Args:
+            goal (Position, optional): Goal position (default: self.goal)
+
+        Returns:
+            FlowField: Fields that answer ``next_step(pos)`` in O(1)
+        """
+        from fields import FlowField
+
+        goal = goal if goal is not None else self.goal
+        field = self._fields.get(goal)
+        if field is None or field.version != self.version:
+            if field is None and self._fields:
+                # Drop fields computed for older wall layouts
+                self._fields = {g: f for g, f in self._fields.items()
+                                if f.version == self.version}
+            field = self._fields[goal] = FlowField(self, goal)
+        return field
+
+    def build_component_index(self):
+        """
+        Label connected components and keep them updated on wall changes.
+
+        Once built, Pathfinder answers queries between different
+        components with None without searching.
+
+        Returns:
+            ComponentIndex: The world's component index
+        """
+        if self.component_index is None:
+            from components import ComponentIndex
+            self.component_index = ComponentIndex(self)
+        return self.component_index
+
+    def position(self, row, col):
+        """
+        Position for a cell, shared through the pool when interning.
+
+        Args:
+            row (int): Row index
+            col (int): Column index
+
+        Returns:
+            Position: Position at (row, col)
+        """
+        if self.pool is not None:
+            return self.pool.get(row, col)
+        return Position(row, col)
 
     def in_bounds(self, pos):
         """
@@ -68,6 +303,77 @@ class GridWorld:
         """
         return pos == self.goal
 
+    def cost(self, pos):
+        """
+        Cost of entering a cell.
+
+        Args:
+            pos (Position): Position inside the grid
+
+        Returns:
+            int: Terrain cost, 1 unless set otherwise
+        """
+        if self.costs is None:
+            return 1
+        return self.costs[pos.row * self.cols + pos.col]
+
+    def set_cost(self, pos, cost):
+        """
+        Set the cost of entering a cell.
+
+        Args:
+            pos (Position): Position inside the grid
+            cost (int): Terrain cost from 1 to 255
+
+        Raises:
+            ValueError: If pos is out of bounds or cost is out of range
+        """
+        if not self.in_bounds(pos):
+            raise ValueError(f"{pos} is outside the grid")
+        if not 1 <= cost <= 255:
+            raise ValueError("cost must be between 1 and 255")
+        if self.costs is None:
+            if cost == 1:
+                return
+            self.costs = bytearray(b"\x01") * (self.rows * self.cols)
+        i = pos.row * self.cols + pos.col
+        if self.costs[i] != cost:
+            self.costs[i] = cost
+            self.version += 1
+
+    def set_costs(self, costs):
+        """
+        Replace every cell's cost at once.
+
+        Args:
+            costs: 2D NumPy array or sequence of rows of integer costs
+                from 1 to 255, or a flat row-major bytes-like buffer;
+                None resets every cost to 1
+
+        Raises:
+            ValueError: If the shape or any value is out of range
+        """
+        if costs is None:
+            buffer = None
+        elif hasattr(costs, "shape") and hasattr(costs, "tobytes"):
+            if tuple(costs.shape) != (self.rows, self.cols):
+                raise ValueError(f"costs must have shape ({self.rows}, {self.cols})")
+            if costs.size and (costs.min() < 1 or costs.max() > 255):
+                raise ValueError("costs must be between 1 and 255")
+            buffer = bytearray(costs.astype("uint8").tobytes())
+        elif isinstance(costs, (bytes, bytearray, memoryview)):
+            buffer = bytearray(costs)
+            if len(buffer) != self.rows * self.cols:
+                raise ValueError("costs must have rows * cols entries")
+        else:
+            if len(costs) != self.rows or any(len(row) != self.cols for row in costs):
+                raise ValueError(f"costs must have {self.rows} rows of {self.cols}")
+            buffer = bytearray(value for row in costs for value in row)
+        if buffer is not None and buffer.count(0):
+            raise ValueError("costs must be between 1 and 255")
+        self.costs = buffer
+        self.version += 1
+
     def place_wall(self, pos):
         """
         Add a wall at the specified position.
@@ -75,7 +381,7 @@ class GridWorld:
         Args:
             pos (Position): Position to place wall
         """
-        self.walls.add(pos)
+        self._walls.add(pos)
 
     def remove_wall(self, pos):
         """
@@ -84,7 +390,29 @@ class GridWorld:
         Args:
             pos (Position): Position to remove wall
         """
-        self.walls.discard(pos)
+        self._walls.discard(pos)
+
+    def subscribe(self, listener):
+        """
+        Register a callback for wall changes.
+
+        The callback is called as ``listener(pos, is_wall)`` after
+        place_wall (is_wall=True), remove_wall (is_wall=False) or a direct
+        edit of ``walls`` changes a cell.
+
+        Args:
+            listener (callable): Function taking (Position, bool)
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        """
+        Remove a callback registered with subscribe.
+
+        Args:
+            listener (callable): Previously registered function
+        """
+        self._listeners.remove(listener)
 
     def render(self, path=None, agent=None):
         """
@@ -102,25 +430,5 @@ class GridWorld:
             path (list, optional): List of Position objects forming a path
             agent (Position, optional): Current agent position
         """
-        path_set = set(path) if path is not None else set()
-
-        for row in range(self.rows):
-            line = ""
-            for col in range(self.cols):
-                pos = Position(row, col)
-
-                # Priority: agent > start/goal > path > wall > empty
-                if agent is not None and pos == agent:
-                    line += "A"
-                elif pos == self.start:
-                    line += "S"
-                elif pos == self.goal:
-                    line += "G"
-                elif pos in path_set:
-                    line += "*"
-                elif pos in self.walls:
-                    line += "#"
-                else:
-                    line += "."
-
-            print(line)
+        from render import Renderer
+        Renderer(self).render(path, agent)
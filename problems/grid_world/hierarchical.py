@@ -0,0 +1,483 @@
+"""Hierarchical pathfinding (HPA*) for very large grid worlds."""
+
+import heapq
+import time
+from position import Position
+
+# Border segments at least this long get two entrances, one at each end
+LONG_ENTRANCE = 6
+
+# Wall buffer bytes -> ASCII digits of an open-cell bitmask
+_OPEN_DIGITS = bytes.maketrans(b"\x00\x01", b"10")
+
+# Abstract ids of the temporary start and goal nodes during a query
+_START = -1
+_GOAL = -2
+
+
+class HierarchicalPathfinder:
+    """
+    HPA* pathfinder: cluster-level abstract graph plus local refinement.
+
+    The grid is cut into square clusters. Wherever two neighboring
+    clusters touch through open cells, entrance cells are placed on both
+    sides of the border and joined by a cost-1 edge; entrances inside one
+    cluster are joined by their in-cluster BFS distance. A query connects
+    start and goal to the entrances of their clusters, runs A* on the
+    abstract graph and expands each abstract edge back into grid cells.
+
+    Paths are near-optimal, not guaranteed shortest. Wall changes made
+    through the world mark the touched clusters dirty, and only those
+    clusters (and their border neighbors) are rebuilt before the next
+    query.
+
+    Attributes:
+        world (GridWorld): The grid world environment
+        cluster_size (int): Side length of a cluster in cells
+        build_time (float): Seconds spent on the initial build
+        rebuild_time (float): Seconds spent on the most recent rebuild
+        rebuilt_clusters (int): Clusters refreshed by the most recent rebuild
+        query_time (float): Seconds spent on the most recent query
+        nodes_expanded (int): Abstract nodes expanded by the most recent query
+        suboptimality_bound (float or None): Path length divided by the
+            Manhattan distance of the most recent query, an upper bound on
+            its ratio to the optimal length
+    """
+
+    def __init__(self, world, cluster_size=16):
+        """
+        Build the abstract graph for a world.
+
+        Args:
+            world (GridWorld): World with an occupancy buffer
+            cluster_size (int): Side length of a cluster (default: 16)
+        """
+        if cluster_size < 2:
+            raise ValueError("cluster_size must be at least 2")
+        self.world = world
+        self.cluster_size = cluster_size
+        self.rows = world.rows
+        self.cols = world.cols
+        self._cluster_rows = -(-self.rows // cluster_size)
+        self._cluster_cols = -(-self.cols // cluster_size)
+        self._blocked = bytearray(world.occupancy())
+
+        # Border key (cluster, 0 = east / 1 = south) -> entrance cell pairs
+        self._borders = {}
+        # Entrance cell -> entrance cells across a border
+        self._inter = {}
+        # Cluster -> {entrance cell: {entrance cell: in-cluster distance}}
+        self._intra = {}
+        self._dirty = set()
+
+        self.rebuild_time = 0.0
+        self.rebuilt_clusters = 0
+        self.query_time = 0.0
+        self.nodes_expanded = 0
+        self.suboptimality_bound = None
+
+        began = time.perf_counter()
+        self._rebuild(range(self._cluster_rows * self._cluster_cols))
+        self.build_time = time.perf_counter() - began
+
+        world.subscribe(self._on_wall_change)
+
+    def close(self):
+        """Stop listening to wall changes."""
+        self.world.unsubscribe(self._on_wall_change)
+
+    @property
+    def abstract_nodes(self):
+        """Number of entrance cells in the abstract graph."""
+        return sum(len(nodes) for nodes in self._intra.values())
+
+    @property
+    def abstract_edges(self):
+        """Number of directed edges in the abstract graph."""
+        intra = sum(len(edges) for nodes in self._intra.values() for edges in nodes.values())
+        return intra + sum(len(partners) for partners in self._inter.values())
+
+    def find_path(self, start, goal):
+        """
+        Find a near-optimal path from start to goal.
+
+        Args:
+            start (Position): Starting position
+            goal (Position): Goal position
+
+        Returns:
+            list or None: List of Position objects from start to goal,
+                         or None if no path exists
+        """
+        began = time.perf_counter()
+        self.nodes_expanded = 0
+        self.suboptimality_bound = None
+        if self._dirty:
+            self._rebuild(self._dirty)
+
+        cells = self._query(start, goal)
+        self.query_time = time.perf_counter() - began
+        if cells is None:
+            return None
+
+        manhattan = abs(start.row - goal.row) + abs(start.col - goal.col)
+        self.suboptimality_bound = (len(cells) - 1) / manhattan if manhattan else 1.0
+        cols = self.cols
+        return [Position(cell // cols, cell % cols) for cell in cells]
+
+    def suboptimality(self, start, goal):
+        """
+        Exact ratio of the hierarchical path length to the BFS optimum.
+
+        Runs a full flat search, so this is meant for measurement rather
+        than for serving queries.
+
+        Args:
+            start (Position): Starting position
+            goal (Position): Goal position
+
+        Returns:
+            float or None: Ratio >= 1, or None if no path exists
+        """
+        from path import Pathfinder
+
+        path = self.find_path(start, goal)
+        optimal = Pathfinder(self.world).find_path(start, goal)
+        if path is None or optimal is None:
+            return None
+        if len(optimal) == 1:
+            return 1.0
+        return (len(path) - 1) / (len(optimal) - 1)
+
+    # -- incremental maintenance -------------------------------------------
+
+    def _on_wall_change(self, pos, is_wall):
+        """World listener: update the wall copy and mark the cluster dirty."""
+        if 0 <= pos.row < self.rows and 0 <= pos.col < self.cols:
+            self._blocked[pos.row * self.cols + pos.col] = 1 if is_wall else 0
+            self._dirty.add(self._cluster_of(pos.row, pos.col))
+
+    def _cluster_of(self, row, col):
+        """Cluster index containing (row, col)."""
+        size = self.cluster_size
+        return (row // size) * self._cluster_cols + col // size
+
+    def _cluster_bounds(self, cluster):
+        """Half-open (row0, col0, row1, col1) bounds of a cluster."""
+        size = self.cluster_size
+        cr, cc = divmod(cluster, self._cluster_cols)
+        return (cr * size, cc * size,
+                min((cr + 1) * size, self.rows), min((cc + 1) * size, self.cols))
+
+    def _cluster_borders(self, cluster):
+        """Keys of the (up to four) borders around a cluster."""
+        cr, cc = divmod(cluster, self._cluster_cols)
+        keys = []
+        if cc + 1 < self._cluster_cols:
+            keys.append((cluster, 0))
+        if cr + 1 < self._cluster_rows:
+            keys.append((cluster, 1))
+        if cc > 0:
+            keys.append((cluster - 1, 0))
+        if cr > 0:
+            keys.append((cluster - self._cluster_cols, 1))
+        return keys
+
+    def _scan_border(self, key):
+        """
+        Entrance pairs along one border.
+
+        Each maximal run of open cell pairs across the border gets one
+        entrance in its middle, or one at each end if it is long.
+
+        Args:
+            key (tuple): (cluster, 0) for its east border, (cluster, 1) for south
+
+        Returns:
+            list: (cell inside cluster, cell across the border) pairs
+        """
+        cluster, side = key
+        row0, col0, row1, col1 = self._cluster_bounds(cluster)
+        cols = self.cols
+        blocked = self._blocked
+        if side == 0:
+            inner = [r * cols + col1 - 1 for r in range(row0, row1)]
+            step = 1
+        else:
+            inner = [(row1 - 1) * cols + c for c in range(col0, col1)]
+            step = cols
+
+        pairs = []
+        run = []
+        for cell in inner + [None]:
+            if cell is not None and not blocked[cell] and not blocked[cell + step]:
+                run.append(cell)
+                continue
+            if run:
+                if len(run) >= LONG_ENTRANCE:
+                    chosen = (run[0], run[-1])
+                else:
+                    chosen = (run[len(run) // 2],)
+                pairs.extend((a, a + step) for a in chosen)
+                run = []
+        return pairs
+
+    def _rebuild(self, clusters):
+        """
+        Refresh the borders and intra-cluster edges around some clusters.
+
+        Args:
+            clusters (iterable): Cluster indexes whose cells changed
+        """
+        began = time.perf_counter()
+        clusters = set(clusters)
+        borders = set()
+        for cluster in clusters:
+            borders.update(self._cluster_borders(cluster))
+
+        touched = set(clusters)
+        for key in borders:
+            for a, b in self._borders.get(key, ()):
+                self._unlink(a, b)
+            pairs = self._scan_border(key)
+            self._borders[key] = pairs
+            for a, b in pairs:
+                self._inter.setdefault(a, set()).add(b)
+                self._inter.setdefault(b, set()).add(a)
+                touched.add(self._cluster_of(a // self.cols, a % self.cols))
+                touched.add(self._cluster_of(b // self.cols, b % self.cols))
+
+        for cluster in touched:
+            nodes = self._entrances(cluster)
+            old = self._intra.get(cluster)
+            if cluster not in clusters and old is not None and set(old) == nodes:
+                continue
+            self._intra[cluster] = self._cluster_edges(cluster, nodes)
+
+        self._dirty = set()
+        self.rebuilt_clusters = len(touched)
+        self.rebuild_time = time.perf_counter() - began
+
+    def _unlink(self, a, b):
+        """Remove a cross-border edge pair."""
+        for x, y in ((a, b), (b, a)):
+            partners = self._inter.get(x)
+            if partners is not None:
+                partners.discard(y)
+                if not partners:
+                    del self._inter[x]
+
+    def _entrances(self, cluster):
+        """Entrance cells lying inside a cluster."""
+        cols = self.cols
+        nodes = set()
+        for key in self._cluster_borders(cluster):
+            for a, b in self._borders.get(key, ()):
+                for cell in (a, b):
+                    if self._cluster_of(cell // cols, cell % cols) == cluster:
+                        nodes.add(cell)
+        return nodes
+
+    # -- local search ------------------------------------------------------
+
+    def _local_bfs(self, source, cluster, target=None):
+        """
+        BFS from source restricted to one cluster.
+
+        Args:
+            source (int): Cell id inside the cluster
+            cluster (int): Cluster index
+            target (int, optional): Stop as soon as this cell is reached
+
+        Returns:
+            tuple: (dict cell -> distance, dict cell -> parent cell)
+        """
+        row0, col0, row1, col1 = self._cluster_bounds(cluster)
+        cols = self.cols
+        blocked = self._blocked
+        dist = {source: 0}
+        parent = {source: None}
+        queue = [source]
+        head = 0
+        while head < len(queue):
+            current = queue[head]
+            head += 1
+            if current == target:
+                break
+            row, col = divmod(current, cols)
+            depth = dist[current] + 1
+            for ok, nxt in ((row > row0, current - cols), (row < row1 - 1, current + cols),
+                            (col > col0, current - 1), (col < col1 - 1, current + 1)):
+                if ok and not blocked[nxt] and nxt not in dist:
+                    dist[nxt] = depth
+                    parent[nxt] = current
+                    queue.append(nxt)
+        return dist, parent
+
+    def _cluster_edges(self, cluster, nodes):
+        """
+        In-cluster distances between every pair of entrance cells.
+
+        The cluster's open cells are packed into one int, one bit per cell
+        in rows of ``width + 1`` bits; the extra bit per row is a wall, so
+        shifting by one never wraps into the next row. A BFS from each
+        entrance then advances a whole frontier per step with four shifts
+        and a mask, and stops once every other entrance has been reached.
+
+        Args:
+            cluster (int): Cluster index
+            nodes (set): Entrance cells inside the cluster
+
+        Returns:
+            dict: entrance cell -> {entrance cell: distance}
+        """
+        row0, col0, row1, col1 = self._cluster_bounds(cluster)
+        stride = col1 - col0 + 1
+        cols = self.cols
+        blocked = self._blocked
+        rows = [blocked[row * cols + col0:row * cols + col1] + b"\x01" for row in range(row0, row1)]
+        # Bit i of the int is local cell i, so the digits go in reversed
+        open_cells = int(b"".join(rows).translate(_OPEN_DIGITS)[::-1], 2)
+
+        index = {}
+        entrances = 0
+        for node in nodes:
+            bit = (node // cols - row0) * stride + node % cols - col0
+            index[bit] = node
+            entrances |= 1 << bit
+
+        edges = {}
+        for bit, node in index.items():
+            frontier = 1 << bit
+            unvisited = open_cells & ~frontier
+            targets = entrances & ~frontier
+            found = {}
+            depth = 0
+            while frontier and targets:
+                depth += 1
+                frontier = ((frontier << 1) | (frontier >> 1) | (frontier << stride)
+                            | (frontier >> stride)) & unvisited
+                unvisited ^= frontier
+                hit = frontier & targets
+                if hit:
+                    targets ^= hit
+                    while hit:
+                        low = hit & -hit
+                        found[index[low.bit_length() - 1]] = depth
+                        hit ^= low
+            edges[node] = found
+        return edges
+
+    def _local_path(self, a, b, cluster):
+        """Cell ids of a shortest in-cluster path from a to b."""
+        _, parent = self._local_bfs(a, cluster, target=b)
+        cells = []
+        node = b
+        while node is not None:
+            cells.append(node)
+            node = parent[node]
+        cells.reverse()
+        return cells
+
+    # -- queries -----------------------------------------------------------
+
+    def _query(self, start, goal):
+        """Abstract search plus refinement; returns cell ids or None."""
+        world = self.world
+        if not world.in_bounds(start) or not world.in_bounds(goal):
+            return None
+        cols = self.cols
+        s = start.row * cols + start.col
+        g = goal.row * cols + goal.col
+        if s == g:
+            return [s]
+        if self._blocked[s] or self._blocked[g]:
+            return None
+
+        s_cluster = self._cluster_of(start.row, start.col)
+        g_cluster = self._cluster_of(goal.row, goal.col)
+        s_dist, _ = self._local_bfs(s, s_cluster)
+        g_dist, _ = self._local_bfs(g, g_cluster)
+
+        direct = s_dist.get(g) if s_cluster == g_cluster else None
+        s_edges = {node: s_dist[node] for node in self._intra[s_cluster] if node in s_dist}
+        g_edges = {node: g_dist[node] for node in self._intra[g_cluster] if node in g_dist}
+
+        abstract = self._abstract_search(s_edges, g_edges, goal, direct)
+        if abstract is None:
+            if direct is None:
+                return None
+            return self._local_path(s, g, s_cluster)
+
+        cells = [s]
+        nodes = [s] + abstract + [g]
+        for a, b in zip(nodes, nodes[1:]):
+            a_cluster = self._cluster_of(a // cols, a % cols)
+            if a_cluster != self._cluster_of(b // cols, b % cols):
+                cells.append(b)
+            else:
+                cells.extend(self._local_path(a, b, a_cluster)[1:])
+        return cells
+
+    def _abstract_search(self, s_edges, g_edges, goal, bound):
+        """
+        A* over entrance cells between the temporary start and goal nodes.
+
+        Args:
+            s_edges (dict): Entrance cell -> distance from the start
+            g_edges (dict): Entrance cell -> distance to the goal
+            goal (Position): Goal, for the Manhattan heuristic
+            bound (int or None): Length of a direct in-cluster path; the
+                abstract path is only used if it is shorter
+
+        Returns:
+            list or None: Entrance cells between start and goal, or None
+        """
+        cols = self.cols
+        goal_row = goal.row
+        goal_col = goal.col
+
+        def h(cell):
+            return abs(cell // cols - goal_row) + abs(cell % cols - goal_col)
+
+        best = {}
+        parent = {}
+        heap = []
+        for node, d in s_edges.items():
+            best[node] = d
+            parent[node] = _START
+            heapq.heappush(heap, (d + h(node), -d, node))
+
+        closed = set()
+        while heap:
+            f, neg_d, node = heapq.heappop(heap)
+            if bound is not None and f >= bound:
+                break
+            if node == _GOAL:
+                chain = []
+                node = parent[_GOAL]
+                while node != _START:
+                    chain.append(node)
+                    node = parent[node]
+                chain.reverse()
+                return chain
+            if node in closed:
+                continue
+            closed.add(node)
+            self.nodes_expanded += 1
+            d = -neg_d
+
+            cluster = self._cluster_of(node // cols, node % cols)
+            edges = list(self._intra[cluster].get(node, {}).items())
+            edges.extend((other, 1) for other in self._inter.get(node, ()))
+            if node in g_edges:
+                edges.append((_GOAL, g_edges[node]))
+
+            for other, cost in edges:
+                new_d = d + cost
+                if other not in closed and new_d < best.get(other, float("inf")):
+                    best[other] = new_d
+                    parent[other] = node
+                    estimate = 0 if other == _GOAL else h(other)
+                    heapq.heappush(heap, (new_d + estimate, -new_d, other))
+        return None
@@ -0,0 +1,202 @@
+"""Per-search statistics and hooks for observing Pathfinder queries."""
+
+import bisect
+
+# Why a search ended
+FOUND = "found"              # reached the goal
+EXHAUSTED = "exhausted"      # ran out of cells without reaching the goal
+CACHE_HIT = "cache_hit"      # answered from Pathfinder's cache
+UNREACHABLE = "unreachable"  # ruled out by the world's component index
+REASONS = (FOUND, EXHAUSTED, CACHE_HIT, UNREACHABLE)
+
+
+class SearchStats:
+    """
+    Record of one Pathfinder.find_path call.
+
+    Attributes:
+        algorithm (str): Search algorithm used
+        start (Position): Starting position
+        goal (Position): Goal position
+        seconds (float): Wall time of the call
+        nodes_expanded (int): Cells expanded
+        visited (int or None): Cells reached (expanded or queued)
+        max_frontier (int or None): Largest open list / queue size; None
+            where measuring it would slow the search down (plain BFS
+            outside profile mode)
+        path_length (int or None): Cells in the path, None if no path
+        reason (str): Why the search ended, one of REASONS
+    """
+
+    __slots__ = ("algorithm", "start", "goal", "seconds", "nodes_expanded",
+                 "visited", "max_frontier", "path_length", "reason")
+
+    def __init__(self, algorithm, start, goal, seconds, nodes_expanded,
+                 visited, max_frontier, path_length, reason):
+        """
+        Initialize a record.
+
+        Args:
+            algorithm (str): Search algorithm used
+            start (Position): Starting position
+            goal (Position): Goal position
+            seconds (float): Wall time of the call
+            nodes_expanded (int): Cells expanded
+            visited (int or None): Cells reached
+            max_frontier (int or None): Largest frontier size
+            path_length (int or None): Cells in the path
+            reason (str): One of REASONS
+        """
+        self.algorithm = algorithm
+        self.start = start
+        self.goal = goal
+        self.seconds = seconds
+        self.nodes_expanded = nodes_expanded
+        self.visited = visited
+        self.max_frontier = max_frontier
+        self.path_length = path_length
+        self.reason = reason
+
+    def to_dict(self):
+        """
+        Plain-data form, e.g. for JSON export.
+
+        Returns:
+            dict: Field name -> value, positions as (row, col) lists
+        """
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["start"] = [self.start.row, self.start.col]
+        data["goal"] = [self.goal.row, self.goal.col]
+        return data
+
+    def __repr__(self):
+        """
+        String representation of SearchStats.
+
+        Returns:
+            str: Summary of the main fields
+        """
+        return (f"SearchStats({self.algorithm} {self.start}->{self.goal}: "
+                f"{self.reason}, {self.seconds * 1e3:.3f} ms, "
+                f"expanded={self.nodes_expanded}, visited={self.visited}, "
+                f"max_frontier={self.max_frontier}, path_length={self.path_length})")
+
+
+class LatencyHistogram:
+    """
+    Aggregated search latencies in exponentially growing buckets.
+
+    An instance is itself a hook: pass it as ``Pathfinder(hook=...)`` and
+    every search's wall time is recorded.
+
+    Attributes:
+        bounds (list): Upper bound in seconds of each bucket but the last,
+            which collects everything slower
+        counts (list): Searches per bucket
+        count (int): Searches recorded
+        total (float): Sum of recorded seconds
+    """
+
+    def __init__(self, smallest=1e-6, factor=2.0, buckets=32):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            smallest (float): Upper bound of the first bucket, in seconds
+            factor (float): Ratio between consecutive bounds
+            buckets (int): Number of bounded buckets
+        """
+        self.bounds = [smallest * factor ** i for i in range(buckets)]
+        self.counts = [0] * (buckets + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def __call__(self, stats):
+        """
+        Hook entry point: record one search.
+
+        Args:
+            stats (SearchStats): Record of the search
+        """
+        self.record(stats.seconds)
+
+    def record(self, seconds):
+        """
+        Add one latency.
+
+        Args:
+            seconds (float): Duration to record
+        """
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def percentile(self, q):
+        """
+        Upper bound of the bucket holding the q-th percentile.
+
+        Args:
+            q (float): Percentile from 0 to 100
+
+        Returns:
+            float or None: Bound in seconds (inf for the overflow bucket),
+                None if nothing was recorded
+        """
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= rank:
+                return self.bounds[i] if i < len(self.bounds) else float("inf")
+        return float("inf")
+
+    def to_dict(self):
+        """
+        Plain-data form, e.g. for JSON export.
+
+        Returns:
+            dict: bounds, counts, count and total
+        """
+        return {"bounds": list(self.bounds), "counts": list(self.counts),
+                "count": self.count, "total": self.total}
+
+
+class SamplingHook:
+    """
+    Forwards every n-th search to another hook.
+
+    Keeps expensive observers, such as exporters or profilers, off most
+    queries.
+
+    Attributes:
+        hook (callable): Observer receiving the sampled SearchStats
+        every (int): Sampling interval
+        seen (int): Searches seen so far
+    """
+
+    def __init__(self, hook, every=100):
+        """
+        Initialize a sampler.
+
+        Args:
+            hook (callable): Observer taking a SearchStats
+            every (int): Forward one search out of this many
+        """
+        if every < 1:
+            raise ValueError("every must be >= 1")
+        self.hook = hook
+        self.every = every
+        self.seen = 0
+
+    def __call__(self, stats):
+        """
+        Hook entry point: forward the search if it is sampled.
+
+        Args:
+            stats (SearchStats): Record of the search
+        """
+        self.seen += 1
+        if self.seen % self.every == 0:
+            self.hook(stats)
@@ -0,0 +1,132 @@
+"""Binary map files and the text .map benchmark format."""
+
+import mmap
+import struct
+from grid_world import GridWorld
+from occupancy import BitOccupancyGrid, OccupancyGrid, pack_bits
+from position import Position
+
+MAGIC = b"GWM1"
+
+# magic, rows, cols, start row/col, goal row/col, padding to 32 bytes
+HEADER = struct.Struct("<4sIIiiii4x")
+
+# .map terrain: ground ('.' and 'G') and swamp ('S') are passable;
+# out of bounds ('@', 'O'), trees ('T') and water ('W') are blocked
+_MOVINGAI_PASSABLE = b".GS"
+_MOVINGAI_CELLS = bytes(0 if ch in _MOVINGAI_PASSABLE else 1 for ch in range(256))
+
+
+def save_map(world, path):
+    """
+    Write a world to a binary map file.
+
+    The file is a 32-byte header (magic, rows, cols, start, goal) followed
+    by the walls packed one bit per cell in row-major order, most
+    significant bit first.
+
+    Args:
+        world (GridWorld): World to save
+        path (str): Destination file path
+    """
+    if isinstance(world.walls, BitOccupancyGrid):
+        payload = world.walls.packed()
+    else:
+        payload = pack_bits(world.occupancy())
+    header = HEADER.pack(MAGIC, world.rows, world.cols,
+                         world.start.row, world.start.col,
+                         world.goal.row, world.goal.col)
+    with open(path, "wb") as f:
+        f.write(header)
+        f.write(payload)
+
+
+def load_map(path):
+    """
+    Open a binary map file written by save_map.
+
+    The payload is memory-mapped copy-on-write rather than read, so
+    opening is constant time and wall lookups only page in the parts of
+    the file they touch. Walls placed or removed afterwards change the
+    in-memory world only, never the file.
+
+    Args:
+        path (str): Map file path
+
+    Returns:
+        GridWorld: World backed by a BitOccupancyGrid over the mapping
+
+    Raises:
+        ValueError: If the file is not a map file or is truncated
+    """
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{path}: too short to be a map file")
+        magic, rows, cols, start_row, start_col, goal_row, goal_col = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a map file (magic {magic!r})")
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    walls = BitOccupancyGrid(rows, cols, buffer, offset=HEADER.size)
+    if len(buffer) < HEADER.size + walls.nbytes:
+        raise ValueError(f"{path}: truncated, expected {walls.nbytes} payload bytes")
+    return GridWorld(rows, cols, walls=walls,
+                     start=Position(start_row, start_col),
+                     goal=Position(goal_row, goal_col))
+
+
+def load_movingai(path, start=None, goal=None):
+    """
+    Import a map in the text .map benchmark format.
+
+    The file starts with ``type``, ``height`` and ``width`` lines and a
+    ``map`` line, followed by one line of terrain per row. ``.``, ``G``
+    and ``S`` are passable; every other character is a wall.
+
+    Args:
+        path (str): .map file path
+        start (Position, optional): Starting position
+        goal (Position, optional): Goal position
+
+    Returns:
+        GridWorld: World backed by an OccupancyGrid
+
+    Raises:
+        ValueError: If the header or the grid is malformed
+    """
+    with open(path, "rb") as f:
+        lines = f.read().splitlines()
+
+    fields = {}
+    for i, line in enumerate(lines):
+        words = line.split()
+        if not words:
+            continue
+        if words[0] == b"map":
+            body = lines[i + 1:]
+            break
+        if len(words) != 2:
+            raise ValueError(f"{path}: bad header line {line!r}")
+        fields[words[0].decode("ascii")] = words[1]
+    else:
+        raise ValueError(f"{path}: missing 'map' line")
+
+    try:
+        rows = int(fields["height"])
+        cols = int(fields["width"])
+    except (KeyError, ValueError):
+        raise ValueError(f"{path}: header needs integer height and width") from None
+
+    body = [line.rstrip() for line in body]
+    while body and not body[-1]:
+        body.pop()
+    if len(body) != rows:
+        raise ValueError(f"{path}: expected {rows} rows, found {len(body)}")
+    for r, line in enumerate(body):
+        if len(line) != cols:
+            raise ValueError(f"{path}: row {r} has {len(line)} cells, expected {cols}")
+
+    cells = b"".join(body).translate(_MOVINGAI_CELLS)
+    grid = OccupancyGrid(rows, cols, cells)
+    return GridWorld(rows, cols, walls=grid, start=start, goal=goal)
@@ -0,0 +1,495 @@
+"""Wall stores for GridWorld: compact occupancy grids and a tracked set."""
+
+from position import Position
+
+# Maps any nonzero byte to 1, so buffers from outside hold only 0/1
+_NORMALIZE = bytes([0]) + bytes([1]) * 255
+
+
+class OccupancyGrid:
+    """
+    Flat byte-per-cell wall store indexed by ``row * cols + col``.
+
+    Behaves like the ``set`` of wall positions GridWorld uses by default
+    (``in``, ``add``, ``discard``, ``len``, iteration), but lookups are a
+    single index into a ``bytearray`` instead of a hash of a Position.
+
+    Attributes:
+        rows (int): Number of rows
+        cols (int): Number of columns
+        cells (bytearray): 1 for a wall, 0 for an open cell
+        on_change (callable or None): Called as ``on_change(pos, is_wall)``
+            after add or discard changes a cell; set by the owning GridWorld
+    """
+
+    def __init__(self, rows, cols, cells=None):
+        """
+        Initialize an occupancy grid.
+
+        Args:
+            rows (int): Number of rows
+            cols (int): Number of columns
+            cells (bytes-like, optional): Existing row-major cell buffer;
+                any nonzero byte is a wall and is stored as 1
+        """
+        self.rows = rows
+        self.cols = cols
+        if cells is None:
+            self.cells = bytearray(rows * cols)
+        else:
+            if len(cells) != rows * cols:
+                raise ValueError("cells must have rows * cols entries")
+            self.cells = bytearray(cells).translate(_NORMALIZE)
+        self._count = len(self.cells) - self.cells.count(0)
+        self.on_change = None
+
+    @classmethod
+    def from_positions(cls, rows, cols, walls):
+        """
+        Build a grid from an iterable of wall positions.
+
+        Args:
+            rows (int): Number of rows
+            cols (int): Number of columns
+            walls (iterable): Position objects marking walls
+
+        Returns:
+            OccupancyGrid: Grid with the given walls set
+        """
+        grid = cls(rows, cols)
+        for pos in walls:
+            grid.add(pos)
+        return grid
+
+    @classmethod
+    def from_array(cls, array):
+        """
+        Build a grid from a 2D array of truthy (wall) / falsy (open) values.
+
+        Accepts a NumPy array or any sequence of equal-length rows.
+
+        Args:
+            array: 2D array-like, nonzero entries are walls
+
+        Returns:
+            OccupancyGrid: Grid matching the array
+        """
+        if hasattr(array, "shape") and hasattr(array, "tobytes"):
+            rows, cols = array.shape
+            return cls(rows, cols, (array != 0).astype("uint8").tobytes())
+
+        rows = len(array)
+        cols = len(array[0]) if rows else 0
+        cells = bytearray(rows * cols)
+        for r, line in enumerate(array):
+            if len(line) != cols:
+                raise ValueError("all rows must have the same length")
+            base = r * cols
+            for c, value in enumerate(line):
+                if value:
+                    cells[base + c] = 1
+        return cls(rows, cols, cells)
+
+    def index(self, pos):
+        """
+        Flat cell index of a position.
+
+        Args:
+            pos (Position): Position inside the grid
+
+        Returns:
+            int: ``pos.row * cols + pos.col``
+        """
+        return pos.row * self.cols + pos.col
+
+    def add(self, pos):
+        """
+        Mark a position as a wall. Out-of-bounds positions are ignored.
+
+        Args:
+            pos (Position): Position to mark
+        """
+        if 0 <= pos.row < self.rows and 0 <= pos.col < self.cols:
+            i = pos.row * self.cols + pos.col
+            if not self.cells[i]:
+                self.cells[i] = 1
+                self._count += 1
+                if self.on_change is not None:
+                    self.on_change(pos, True)
+
+    def discard(self, pos):
+        """
+        Clear a wall if present.
+
+        Args:
+            pos (Position): Position to clear
+        """
+        if 0 <= pos.row < self.rows and 0 <= pos.col < self.cols:
+            i = pos.row * self.cols + pos.col
+            if self.cells[i]:
+                self.cells[i] = 0
+                self._count -= 1
+                if self.on_change is not None:
+                    self.on_change(pos, False)
+
+    def as_numpy(self):
+        """
+        Zero-copy NumPy view of the cells with shape ``(rows, cols)``.
+
+        Returns:
+            np.ndarray: ``uint8`` array sharing memory with ``cells``
+        """
+        import numpy as np
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(self.rows, self.cols)
+
+    def __contains__(self, pos):
+        """
+        Check whether a position is a wall.
+
+        Args:
+            pos (Position): Position to check
+
+        Returns:
+            bool: True if pos is inside the grid and marked as a wall
+        """
+        row = pos.row
+        col = pos.col
+        return (0 <= row < self.rows and 0 <= col < self.cols
+                and self.cells[row * self.cols + col] == 1)
+
+    def __len__(self):
+        """
+        Number of walls.
+
+        Returns:
+            int: Count of wall cells
+        """
+        return self._count
+
+    def __iter__(self):
+        """
+        Iterate over wall positions in row-major order.
+
+        Yields:
+            Position: Each wall position
+        """
+        cols = self.cols
+        i = self.cells.find(1)
+        while i != -1:
+            yield Position(i // cols, i % cols)
+            i = self.cells.find(1, i + 1)
+
+
+class WallSet(set):
+    """
+    Set of wall positions that reports every change.
+
+    GridWorld keeps plain-set walls in a WallSet so that editing
+    ``world.walls`` directly (``add``, ``discard``, ``update``, ...) bumps
+    the world's version and notifies its listeners just like place_wall
+    and remove_wall. Lookups are inherited from ``set`` unchanged.
+
+    Attributes:
+        on_change (callable or None): Called as ``on_change(pos, is_wall)``
+            after each position is added or removed
+    """
+
+    def __init__(self, walls=(), on_change=None):
+        """
+        Initialize a wall set.
+
+        Args:
+            walls (iterable, optional): Initial wall positions
+            on_change (callable, optional): Change callback
+        """
+        super().__init__(walls)
+        self.on_change = on_change
+
+    def _changed(self, pos, is_wall):
+        """Report one changed position."""
+        if self.on_change is not None:
+            self.on_change(pos, is_wall)
+
+    def add(self, pos):
+        """
+        Add a wall position.
+
+        Args:
+            pos (Position): Position to add
+        """
+        if pos not in self:
+            super().add(pos)
+            self._changed(pos, True)
+
+    def discard(self, pos):
+        """
+        Remove a wall position if present.
+
+        Args:
+            pos (Position): Position to remove
+        """
+        if pos in self:
+            super().discard(pos)
+            self._changed(pos, False)
+
+    def remove(self, pos):
+        """
+        Remove a wall position.
+
+        Args:
+            pos (Position): Position to remove
+
+        Raises:
+            KeyError: If pos is not a wall
+        """
+        if pos not in self:
+            raise KeyError(pos)
+        self.discard(pos)
+
+    def pop(self):
+        """
+        Remove and return an arbitrary wall position.
+
+        Returns:
+            Position: The removed position
+        """
+        pos = super().pop()
+        self._changed(pos, False)
+        return pos
+
+    def clear(self):
+        """Remove every wall."""
+        for pos in list(self):
+            self.discard(pos)
+
+    def update(self, *others):
+        """Add the positions of every iterable given."""
+        for other in others:
+            for pos in other:
+                self.add(pos)
+
+    def difference_update(self, *others):
+        """Remove the positions of every iterable given."""
+        for other in others:
+            for pos in other:
+                self.discard(pos)
+
+    def intersection_update(self, *others):
+        """Keep only positions found in every iterable given."""
+        keep = set(self).intersection(*others)
+        for pos in [pos for pos in self if pos not in keep]:
+            self.discard(pos)
+
+    def symmetric_difference_update(self, other):
+        """Toggle every position of an iterable."""
+        for pos in set(other):
+            if pos in self:
+                self.discard(pos)
+            else:
+                self.add(pos)
+
+    def __ior__(self, other):
+        """In-place operator form of update."""
+        self.update(other)
+        return self
+
+    def __isub__(self, other):
+        """In-place operator form of difference_update."""
+        self.difference_update(other)
+        return self
+
+    def __iand__(self, other):
+        """In-place operator form of intersection_update."""
+        self.intersection_update(other)
+        return self
+
+    def __ixor__(self, other):
+        """In-place operator form of symmetric_difference_update."""
+        self.symmetric_difference_update(other)
+        return self
+
+
+class BitOccupancyGrid:
+    """
+    Bit-packed wall store over any indexable byte buffer.
+
+    Cell ``i = row * cols + col`` is bit ``7 - i % 8`` of byte
+    ``offset + i // 8`` (most significant bit first). The buffer can be an
+    ``mmap``, so only the pages that lookups touch are ever read. It
+    supports the same set-like interface as OccupancyGrid.
+
+    Attributes:
+        rows (int): Number of rows
+        cols (int): Number of columns
+        buffer: Byte buffer holding the packed bits
+        offset (int): Byte offset of the first cell in buffer
+        on_change (callable or None): Called as ``on_change(pos, is_wall)``
+            after add or discard changes a cell; set by the owning GridWorld
+    """
+
+    def __init__(self, rows, cols, buffer=None, offset=0):
+        """
+        Initialize a bit-packed grid.
+
+        Args:
+            rows (int): Number of rows
+            cols (int): Number of columns
+            buffer (optional): Writable byte buffer (default: new, all open)
+            offset (int): Byte offset of the first cell in buffer
+        """
+        self.rows = rows
+        self.cols = cols
+        self.nbytes = (rows * cols + 7) // 8
+        self.buffer = buffer if buffer is not None else bytearray(self.nbytes)
+        self.offset = offset
+        self._count = None
+        self.on_change = None
+
+    @classmethod
+    def pack(cls, rows, cols, cells):
+        """
+        Pack a byte-per-cell buffer into a new bit grid.
+
+        Args:
+            rows (int): Number of rows
+            cols (int): Number of columns
+            cells (bytes-like): 1 for a wall, 0 for an open cell
+
+        Returns:
+            BitOccupancyGrid: Grid backed by a new bytearray
+        """
+        return cls(rows, cols, bytearray(pack_bits(cells)))
+
+    def packed(self):
+        """
+        The packed bits as bytes.
+
+        Returns:
+            bytes: ``ceil(rows * cols / 8)`` bytes
+        """
+        return bytes(self.buffer[self.offset:self.offset + self.nbytes])
+
+    def unpack(self):
+        """
+        Expand to a byte-per-cell buffer, as used by the search engines.
+
+        Returns:
+            bytearray: ``rows * cols`` cells, 1 for a wall
+        """
+        return unpack_bits(self.packed(), self.rows * self.cols)
+
+    def add(self, pos):
+        """
+        Mark a position as a wall. Out-of-bounds positions are ignored.
+
+        Args:
+            pos (Position): Position to mark
+        """
+        if 0 <= pos.row < self.rows and 0 <= pos.col < self.cols and pos not in self:
+            i = pos.row * self.cols + pos.col
+            byte = self.offset + (i >> 3)
+            self.buffer[byte] = self.buffer[byte] | (0x80 >> (i & 7))
+            if self._count is not None:
+                self._count += 1
+            if self.on_change is not None:
+                self.on_change(pos, True)
+
+    def discard(self, pos):
+        """
+        Clear a wall if present.
+
+        Args:
+            pos (Position): Position to clear
+        """
+        if pos in self:
+            i = pos.row * self.cols + pos.col
+            byte = self.offset + (i >> 3)
+            self.buffer[byte] = self.buffer[byte] & ~(0x80 >> (i & 7)) & 0xFF
+            if self._count is not None:
+                self._count -= 1
+            if self.on_change is not None:
+                self.on_change(pos, False)
+
+    def __contains__(self, pos):
+        """
+        Check whether a position is a wall.
+
+        Args:
+            pos (Position): Position to check
+
+        Returns:
+            bool: True if pos is inside the grid and marked as a wall
+        """
+        row = pos.row
+        col = pos.col
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return False
+        i = row * self.cols + col
+        return bool(self.buffer[self.offset + (i >> 3)] & (0x80 >> (i & 7)))
+
+    def __len__(self):
+        """
+        Number of walls (counted on first use).
+
+        Returns:
+            int: Count of wall cells
+        """
+        if self._count is None:
+            self._count = bin(int.from_bytes(self.packed(), "big")).count("1")
+        return self._count
+
+    def __iter__(self):
+        """
+        Iterate over wall positions in row-major order.
+
+        Yields:
+            Position: Each wall position
+        """
+        cells = self.unpack()
+        cols = self.cols
+        i = cells.find(1)
+        while i != -1:
+            yield Position(i // cols, i % cols)
+            i = cells.find(1, i + 1)
+
+
+# Byte-per-cell values <-> ASCII binary digits, for int-based bit packing
+_CELLS_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_DIGITS_TO_CELLS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def pack_bits(cells):
+    """
+    Pack a byte-per-cell buffer into bits, most significant bit first.
+
+    Goes through one big int, so the work is done by C-level conversions
+    rather than a Python loop over cells.
+
+    Args:
+        cells (bytes-like): 0/1 values
+
+    Returns:
+        bytes: ``ceil(len(cells) / 8)`` bytes, zero-padded at the end
+    """
+    nbytes = (len(cells) + 7) // 8
+    if not nbytes:
+        return b""
+    digits = bytes(cells).translate(_CELLS_TO_DIGITS) + b"0" * (nbytes * 8 - len(cells))
+    return int(digits, 2).to_bytes(nbytes, "big")
+
+
+def unpack_bits(data, count):
+    """
+    Inverse of pack_bits.
+
+    Args:
+        data (bytes-like): Packed bits
+        count (int): Number of cells to return
+
+    Returns:
+        bytearray: ``count`` 0/1 values
+    """
+    if not count:
+        return bytearray()
+    digits = format(int.from_bytes(data, "big"), f"0{len(data) * 8}b")[:count]
+    return bytearray(digits.encode("ascii").translate(_DIGITS_TO_CELLS))
@@ -1,31 +1,942 @@
 """Pathfinding algorithms for grid world navigation."""
 
-from collections import deque
+import heapq
+import multiprocessing
+import os
+import time
+from array import array
+from collections import OrderedDict, deque
 from position import Position
+from compact_path import CompactPath
+from instrumentation import (SearchStats, FOUND, EXHAUSTED, CACHE_HIT,
+                             UNREACHABLE)
+
+ALGORITHMS = ("bfs", "astar", "weighted_astar", "bidirectional", "dijkstra")
+
+# Largest per-cell cost; Dijkstra's bucket ring has one slot per value
+MAX_COST = 255
+
+_ORTHOGONAL = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_DIAGONAL = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+_SQRT2 = 2 ** 0.5
+
+# g value of a cell no search has reached yet
+_UNSET = 2 ** 62
+
+# Expansions between clock reads in AStarSearch.run; perf_counter costs
+# about as much as expanding a cell, so reading it every time would
+# halve throughput
+_CLOCK_EVERY = 64
+
+
+class _SearchBuffers:
+    """
+    Per-cell arrays shared by the cell-id engines across queries.
+
+    ``marks`` starts as a copy of the occupancy buffer (1 = wall); the
+    engines use it as their seen/closed flags, so one lookup covers both
+    passable and visited. ``dist`` holds g values, _UNSET where no
+    search has been. After a search the engine hands back the cells it
+    touched and only those are reset, so a query costs time
+    proportional to the cells it visits, not to the size of the grid.
+    ``parent`` is never reset: every engine writes a cell's parent
+    before reading it.
+
+    Attributes:
+        n (int): Number of cells
+        marks (bytearray or None): Seen/closed flags, walls set
+        dist (array): g value per cell
+        parent (array): Parent cell id per cell
+    """
+
+    def __init__(self, n):
+        """
+        Allocate buffers for a grid of n cells.
+
+        Args:
+            n (int): Number of cells
+        """
+        self.n = n
+        self.marks = None
+        self.dist = array('q', [_UNSET]) * n
+        self.parent = array('l', [-1]) * n
+        self._source = None
+        self._version = None
+        self._clean = False
+
+    def sync(self, occupancy, version=None):
+        """
+        Make ``marks`` match the walls, copying only when they may differ.
+
+        The copy is kept while the same buffer is passed with the same
+        non-None version and the last search finished cleanly.
+
+        Args:
+            occupancy (bytes-like): 1 for a wall, 0 for an open cell
+            version (int, optional): World version the buffer belongs to
+        """
+        if (self._clean and occupancy is self._source and version is not None
+                and version == self._version):
+            return
+        if not self._clean and self.marks is not None:
+            # A search was interrupted; its g values are unknown
+            self.dist = array('q', [_UNSET]) * self.n
+        if self.marks is None:
+            self.marks = bytearray(occupancy)
+        else:
+            self.marks[:] = occupancy
+        self._source = occupancy
+        self._version = version
+        self._clean = True
+
+    def begin(self):
+        """
+        Start a search.
+
+        Returns:
+            bytearray: The marks buffer, walls set and nothing else
+        """
+        self._clean = False
+        return self.marks
+
+    def end(self, touched, occupancy):
+        """
+        Reset the cells a search touched, ready for the next one.
+
+        Args:
+            touched (iterable): Every cell whose mark or g value was set
+            occupancy (bytes-like): The buffer marks was copied from
+        """
+        marks = self.marks
+        dist = self.dist
+        for cell in touched:
+            marks[cell] = occupancy[cell]
+            dist[cell] = _UNSET
+        self._clean = True
+
+
+def _buffers_for(buffers, occupancy, n):
+    """Buffers ready for a search: the ones given, or fresh ones."""
+    if buffers is None:
+        buffers = _SearchBuffers(n)
+        buffers.sync(occupancy)
+    return buffers
+
+
+def _bfs_cells(occupancy, rows, cols, start, goal, stats=None, buffers=None):
+    """
+    BFS over flat cell ids of a row-major occupancy buffer.
+
+    Neighbors are visited in the same order as Position.neighbors_4()
+    (up, down, left, right), so paths and expansion counts match the
+    Position-based search exactly.
+
+    The largest frontier is worked out after the search from the queue,
+    and only when ``stats`` asks for it with a "max_frontier" key, so the
+    loop itself carries no bookkeeping.
+
+    Args:
+        occupancy (bytes-like): 1 for a wall, 0 for an open cell
+        rows (int): Number of rows
+        cols (int): Number of columns
+        start (int): Start cell id
+        goal (int): Goal cell id
+        stats (dict, optional): Filled with "visited" and "max_frontier"
+        buffers (_SearchBuffers, optional): Reusable buffers synced to
+            occupancy (default: allocate fresh ones)
+
+    Returns:
+        tuple: (list of cell ids from start to goal or None, nodes expanded)
+    """
+    buffers = _buffers_for(buffers, occupancy, rows * cols)
+    # Walls start out "seen", so one lookup covers passable and visited
+    seen = buffers.begin()
+    parent = buffers.parent
+    seen[start] = 1
+    parent[start] = -1
+    queue = [start]
+    push = queue.append
+    head = 0
+    last_row = (rows - 1) * cols
+    last_col = cols - 1
+
+    while head < len(queue):
+        current = queue[head]
+        head += 1
+
+        if current == goal:
+            if stats is not None:
+                _queue_stats(stats, queue, parent)
+            path = _trace_cells(parent, current)
+            buffers.end(queue, occupancy)
+            return path, head
+
+        col = current % cols
+        if current >= cols:
+            nxt = current - cols
+            if not seen[nxt]:
+                seen[nxt] = 1
+                parent[nxt] = current
+                push(nxt)
+        if current < last_row:
+            nxt = current + cols
+            if not seen[nxt]:
+                seen[nxt] = 1
+                parent[nxt] = current
+                push(nxt)
+        if col > 0:
+            nxt = current - 1
+            if not seen[nxt]:
+                seen[nxt] = 1
+                parent[nxt] = current
+                push(nxt)
+        if col < last_col:
+            nxt = current + 1
+            if not seen[nxt]:
+                seen[nxt] = 1
+                parent[nxt] = current
+                push(nxt)
+
+    if stats is not None:
+        _queue_stats(stats, queue, parent)
+    buffers.end(queue, occupancy)
+    return None, head
+
+
+def _nearest_cells(occupancy, rows, cols, sources, is_goal, stats=None, buffers=None):
+    """
+    Multi-source BFS that stops at the first goal cell reached.
+
+    Every source is queued at distance 0, so the goal found first is the
+    one nearest to any source, and the returned path starts at the
+    source it is nearest to. The loop is _bfs_cells' with the single
+    goal comparison replaced by an ``is_goal[cell]`` lookup.
+
+    Args:
+        occupancy (bytes-like): 1 for a wall, 0 for an open cell
+        rows (int): Number of rows
+        cols (int): Number of columns
+        sources (iterable): Source cell ids; walls are skipped
+        is_goal: Indexable by cell id, truthy for goal cells (e.g. a
+            bytearray bitmap)
+        stats (dict, optional): Filled with "visited" and "max_frontier"
+        buffers (_SearchBuffers, optional): Reusable buffers synced to
+            occupancy (default: allocate fresh ones)
+
+    Returns:
+        tuple: (list of cell ids from a source to the nearest goal or
+            None, nodes expanded)
+    """
+    buffers = _buffers_for(buffers, occupancy, rows * cols)
+    seen = buffers.begin()
+    parent = buffers.parent
+    queue = []
+    for cell in sources:
+        if not seen[cell]:
+            seen[cell] = 1
+            parent[cell] = -1
+            queue.append(cell)
+    push = queue.append
+    head = 0
+    last_row = (rows - 1) * cols
+    last_col = cols - 1
+
+    while head < len(queue):
+        current = queue[head]
+        head += 1
+
+        if is_goal[current]:
+            if stats is not None:
+                _queue_stats(stats, queue, parent)
+            path = _trace_cells(parent, current)
+            buffers.end(queue, occupancy)
+            return path, head
+
+        col = current % cols
+        if current >= cols:
+            nxt = current - cols
+            if not seen[nxt]:
+                seen[nxt] = 1
+                parent[nxt] = current
+                push(nxt)
+        if current < last_row:
+            nxt = current + cols
+            if not seen[nxt]:
+                seen[nxt] = 1
+                parent[nxt] = current
+                push(nxt)
+        if col > 0:
+            nxt = current - 1
+            if not seen[nxt]:
+                seen[nxt] = 1
+                parent[nxt] = current
+                push(nxt)
+        if col < last_col:
+            nxt = current + 1
+            if not seen[nxt]:
+                seen[nxt] = 1
+                parent[nxt] = current
+                push(nxt)
+
+    if stats is not None:
+        _queue_stats(stats, queue, parent)
+    buffers.end(queue, occupancy)
+    return None, head
+
+
+class _CellPredicate:
+    """Adapts a Position predicate to the ``is_goal[cell]`` lookup."""
+
+    __slots__ = ("predicate", "cols")
+
+    def __init__(self, predicate, cols):
+        """Wrap predicate for a grid ``cols`` cells wide."""
+        self.predicate = predicate
+        self.cols = cols
+
+    def __getitem__(self, cell):
+        """Whether the cell's Position satisfies the predicate."""
+        return self.predicate(Position(cell // self.cols, cell % self.cols))
+
+
+def _queue_stats(stats, queue, parent):
+    """
+    Visited count and, if requested, largest frontier of a finished BFS.
+
+    Each queue entry was pushed while its parent was being expanded; at
+    that moment the unexpanded part of the queue ran from just after the
+    parent to the new entry, so the frontier peaks at the largest gap
+    between an entry's queue index and its parent's. Roots (parent -1)
+    are all queued up front, so the first frontier holds every one.
+
+    Args:
+        stats (dict): Receives "visited" (and "max_frontier" if present)
+        queue (list): BFS queue in push order, roots first
+        parent (array): Parent cell id per cell
+    """
+    stats["visited"] = len(queue)
+    if "max_frontier" in stats:
+        index = {cell: i for i, cell in enumerate(queue)}
+        peak = 1
+        for i in range(1, len(queue)):
+            before = parent[queue[i]]
+            gap = i - index[before] if before != -1 else i + 1
+            if gap > peak:
+                peak = gap
+        stats["max_frontier"] = peak
+
+
+class AStarSearch:
+    """
+    Resumable A* over flat cell ids with a Manhattan heuristic.
+
+    The open list is a binary heap ordered by ``(f, -g)``, so among equal
+    f values the deepest node is expanded first. With ``epsilon > 1`` this
+    is weighted A* (``f = g + epsilon * h``), whose paths are at most
+    epsilon times longer than optimal.
+
+    The open list, g values and parents persist between run() calls, so
+    a search can stop at an expansion or time budget and continue later.
+    Pathfinder's "astar" and "weighted_astar" engines run one search to
+    the end; AnytimeSearch runs it in slices. Per-cell state lives in
+    reusable buffers, and reset() clears only the cells the previous
+    search touched, so starting over does not cost O(rows * cols).
+
+    Attributes:
+        rows (int): Number of rows
+        cols (int): Number of columns
+        epsilon (float): Heuristic weight, >= 1
+        heap (list): Open list of ``(f, -g, cell)`` entries
+        found (int or None): Goal cell once it has been expanded
+        done (bool): True once the goal was reached or the open list ran out
+        expanded (int): Cells expanded since the last reset()
+        peak (int): Largest open list length seen (stale entries included)
+        best (int): Expanded cell with the smallest Manhattan distance to
+            the goal, -1 before the first expansion
+    """
+
+    def __init__(self, rows, cols, epsilon=1.0, buffers=None):
+        """
+        Initialize an idle search; call reset() to start one.
+
+        Args:
+            rows (int): Number of rows
+            cols (int): Number of columns
+            epsilon (float): Heuristic weight, >= 1 (default: 1.0)
+            buffers (_SearchBuffers, optional): Buffers the caller keeps
+                synced to the occupancy it passes to reset() (default:
+                own buffers, synced by reset())
+        """
+        self.rows = rows
+        self.cols = cols
+        self.epsilon = epsilon
+        self._owned = buffers is None
+        self._buffers = buffers if buffers is not None else _SearchBuffers(rows * cols)
+        self._occupancy = None
+        self._touched = []
+        self.heap = []
+        self.found = None
+        self.done = True
+        self.expanded = 0
+        self.peak = 0
+        self.best = -1
+        self._best_h = 0
+
+    def reset(self, occupancy, start, goal, version=None):
+        """
+        Abandon the current search and start one from start to goal.
+
+        Args:
+            occupancy (bytes-like): 1 for a wall, 0 for an open cell
+            start (int): Start cell id
+            goal (int): Goal cell id
+            version (int, optional): World version of occupancy, lets own
+                buffers skip recopying the walls
+        """
+        self.release()
+        buffers = self._buffers
+        if self._owned:
+            buffers.sync(occupancy, version)
+        # Walls start out closed, so they are never pushed
+        closed = buffers.begin()
+        closed[start] = 0
+        buffers.dist[start] = 0
+        buffers.parent[start] = -1
+        self._occupancy = occupancy
+        self._touched = [start]
+        self._goal = goal
+        row, col = divmod(start, self.cols)
+        goal_row, goal_col = divmod(goal, self.cols)
+        h = abs(row - goal_row) + abs(col - goal_col)
+        self.heap = [(self.epsilon * h, 0, start)]
+        self.found = None
+        self.done = False
+        self.expanded = 0
+        self.peak = 1
+        self.best = -1
+        self._best_h = self.rows + self.cols
+
+    def run(self, limit=-1, deadline=None):
+        """
+        Expand cells until the search is done or a budget runs out.
+
+        Args:
+            limit (int): Most cells to expand in this call, -1 for no limit
+            deadline (float, optional): ``time.perf_counter()`` value at
+                which to stop; the clock is read every _CLOCK_EVERY
+                expansions
+
+        Returns:
+            int: Cells expanded during this call
+        """
+        if self.done:
+            return 0
+        buffers = self._buffers
+        closed = buffers.marks
+        best_g = buffers.dist
+        parent = buffers.parent
+        mark = self._touched.append
+        heap = self.heap
+        push = heapq.heappush
+        pop = heapq.heappop
+        cols = self.cols
+        last_row = self.rows - 1
+        last_col = cols - 1
+        goal = self._goal
+        goal_row, goal_col = divmod(goal, cols)
+        epsilon = self.epsilon
+        clock = time.perf_counter
+        tick = _CLOCK_EVERY
+        peak = self.peak
+        best = self.best
+        best_h = self._best_h
+        expanded = 0
+
+        while heap:
+            if expanded == limit:
+                break
+            if deadline is not None:
+                tick -= 1
+                if not tick:
+                    tick = _CLOCK_EVERY
+                    if clock() >= deadline:
+                        break
+            if len(heap) > peak:
+                peak = len(heap)
+            _, neg_g, current = pop(heap)
+            if closed[current]:
+                continue
+            closed[current] = 1
+            expanded += 1
+
+            if current == goal:
+                self.found = current
+                self.done = True
+                break
+
+            g = 1 - neg_g
+            row, col = divmod(current, cols)
+            dr = abs(row - goal_row)
+            dc = abs(col - goal_col)
+            if dr + dc < best_h:
+                best_h = dr + dc
+                best = current
+            # Manhattan distance of each neighbor, in neighbors_4() order
+            candidates = (
+                (row > 0, current - cols, abs(row - 1 - goal_row) + dc),
+                (row < last_row, current + cols, abs(row + 1 - goal_row) + dc),
+                (col > 0, current - 1, dr + abs(col - 1 - goal_col)),
+                (col < last_col, current + 1, dr + abs(col + 1 - goal_col)),
+            )
+            for ok, nxt, h in candidates:
+                if ok and not closed[nxt] and g < best_g[nxt]:
+                    best_g[nxt] = g
+                    parent[nxt] = current
+                    mark(nxt)
+                    push(heap, (g + epsilon * h, -g, nxt))
+        else:
+            self.done = True
+
+        self.peak = peak
+        self.best = best
+        self._best_h = best_h
+        self.expanded += expanded
+        return expanded
+
+    def trace(self, cell):
+        """
+        Cell ids from the start to an expanded cell.
+
+        Only valid until the next reset().
+
+        Args:
+            cell (int): Expanded cell id
+
+        Returns:
+            list: Cell ids, start first
+        """
+        return _trace_cells(self._buffers.parent, cell)
+
+    def release(self):
+        """
+        Reset the cells this search touched so its buffers can be reused.
+
+        Parents are kept, so trace() still works until the next reset().
+        """
+        if self._occupancy is not None:
+            self._buffers.end(self._touched, self._occupancy)
+            self._occupancy = None
+            self._touched = []
+
+
+def _astar_cells(occupancy, rows, cols, start, goal, epsilon=1.0, stats=None, buffers=None):
+    """
+    Run an AStarSearch from start to goal to completion.
+
+    Args:
+        occupancy (bytes-like): 1 for a wall, 0 for an open cell
+        rows (int): Number of rows
+        cols (int): Number of columns
+        start (int): Start cell id
+        goal (int): Goal cell id
+        epsilon (float): Heuristic weight, >= 1
+        stats (dict, optional): Filled with "visited" and "max_frontier"
+        buffers (_SearchBuffers, optional): Reusable buffers synced to
+            occupancy (default: allocate fresh ones)
+
+    Returns:
+        tuple: (list of cell ids from start to goal or None, nodes expanded)
+    """
+    buffers = _buffers_for(buffers, occupancy, rows * cols)
+    search = AStarSearch(rows, cols, epsilon, buffers)
+    search.reset(occupancy, start, goal)
+    search.run()
+    if stats is not None:
+        _open_stats(stats, search.expanded, search.peak,
+                    (entry[2] for entry in search.heap), buffers.marks)
+    path = search.trace(search.found) if search.found is not None else None
+    search.release()
+    return path, search.expanded
+
+
+def _open_stats(stats, expanded, peak, open_cells, closed):
+    """
+    Record visited and frontier counts of a priority-queue search.
+
+    Args:
+        stats (dict): Receives "visited" and "max_frontier"
+        expanded (int): Cells closed by the search
+        peak (int): Largest queue length seen (stale entries included)
+        open_cells (iterable): Cell ids still queued
+        closed (bytes-like): Nonzero for closed cells
+    """
+    stats["visited"] = expanded + len({cell for cell in open_cells if not closed[cell]})
+    stats["max_frontier"] = peak
+
+
+def _bidirectional_cells(occupancy, rows, cols, start, goal, stats=None, buffers=None):
+    """
+    Bidirectional BFS over flat cell ids.
+
+    Expands one whole BFS level at a time, always from the side with the
+    smaller frontier. When a level touches the other side's visited cells
+    the shortest meeting over that level is stitched into a path, which
+    is the same length a one-sided BFS would return.
+
+    Args:
+        occupancy (bytes-like): 1 for a wall, 0 for an open cell
+        rows (int): Number of rows
+        cols (int): Number of columns
+        start (int): Start cell id
+        goal (int): Goal cell id
+        stats (dict, optional): Filled with "visited" and "max_frontier"
+        buffers (_SearchBuffers, optional): Reusable buffers synced to
+            occupancy (default: allocate fresh ones)
+
+    Returns:
+        tuple: (list of cell ids from start to goal or None, nodes expanded)
+    """
+    if start == goal:
+        if stats is not None:
+            stats.update(visited=1, max_frontier=1)
+        return [start], 1
+    if occupancy[goal]:
+        if stats is not None:
+            stats.update(visited=0, max_frontier=0)
+        return None, 0
+
+    buffers = _buffers_for(buffers, occupancy, rows * cols)
+    # 0 = unseen, 1 = wall, 2 = reached from start, 3 = reached from goal
+    side = buffers.begin()
+    parent = buffers.parent
+    dist = buffers.dist
+    side[start] = 2
+    side[goal] = 3
+    parent[start] = parent[goal] = -1
+    dist[start] = dist[goal] = 0
+    forward = [start]
+    backward = [goal]
+    touched = [start, goal]
+    expanded = 0
+    visited = 2
+    peak = 2
+    last_row = (rows - 1) * cols
+    last_col = cols - 1
+
+    while forward and backward:
+        if len(forward) + len(backward) > peak:
+            peak = len(forward) + len(backward)
+        if len(forward) <= len(backward):
+            frontier, mine, other = forward, 2, 3
+        else:
+            frontier, mine, other = backward, 3, 2
+
+        level = []
+        best = None
+        for current in frontier:
+            expanded += 1
+            col = current % cols
+            depth = dist[current] + 1
+            for ok, nxt in ((current >= cols, current - cols),
+                            (current < last_row, current + cols),
+                            (col > 0, current - 1),
+                            (col < last_col, current + 1)):
+                if not ok:
+                    continue
+                state = side[nxt]
+                if state == 0:
+                    side[nxt] = mine
+                    parent[nxt] = current
+                    dist[nxt] = depth
+                    level.append(nxt)
+                elif state == other:
+                    length = depth + dist[nxt]
+                    if best is None or length < best[0]:
+                        best = (length, current, nxt)
+
+        visited += len(level)
+        touched += level
+        if best is not None:
+            if stats is not None:
+                stats.update(visited=visited, max_frontier=peak)
+            _, a, b = best
+            if mine == 3:
+                a, b = b, a
+            # a is on the start side, b on the goal side
+            cells = _trace_cells(parent, a)
+            while b != -1:
+                cells.append(b)
+                b = parent[b]
+            buffers.end(touched, occupancy)
+            return cells, expanded
+
+        if mine == 2:
+            forward = level
+        else:
+            backward = level
+
+    if stats is not None:
+        stats.update(visited=visited, max_frontier=peak)
+    buffers.end(touched, occupancy)
+    return None, expanded
+
+
+def _dijkstra_cells(occupancy, costs, rows, cols, start, goal, stats=None, buffers=None):
+    """
+    Minimum-cost search over flat cell ids with per-cell entry costs.
+
+    Uses Dial's bucket queue: with integer costs in 1..MAX_COST every
+    tentative distance lies within MAX_COST of the one being expanded, so
+    a ring of MAX_COST + 1 lists replaces the binary heap and each push
+    and pop is O(1). Without costs every step costs 1 and BFS is used.
+
+    Args:
+        occupancy (bytes-like): 1 for a wall, 0 for an open cell
+        costs (bytes-like or None): Cost of entering each cell
+        rows (int): Number of rows
+        cols (int): Number of columns
+        start (int): Start cell id
+        goal (int): Goal cell id
+        stats (dict, optional): Filled with "visited" and "max_frontier"
+        buffers (_SearchBuffers, optional): Reusable buffers synced to
+            occupancy (default: allocate fresh ones)
+
+    Returns:
+        tuple: (list of cell ids from start to goal or None, nodes expanded)
+    """
+    if costs is None:
+        return _bfs_cells(occupancy, rows, cols, start, goal, stats, buffers)
+
+    buffers = _buffers_for(buffers, occupancy, rows * cols)
+    # Walls start out "done", so one lookup covers passable and settled
+    done = buffers.begin()
+    dist = buffers.dist
+    parent = buffers.parent
+    touched = [start]
+    mark = touched.append
+    width = MAX_COST + 1
+    buckets = [[] for _ in range(width)]
+    dist[start] = 0
+    parent[start] = -1
+    buckets[0].append(start)
+    pending = 1
+    peak = 1
+    expanded = 0
+    d = 0
+    last_row = (rows - 1) * cols
+    last_col = cols - 1
+
+    while pending:
+        bucket = buckets[d % width]
+        while not bucket:
+            d += 1
+            bucket = buckets[d % width]
+
+        # Costs are >= 1, so nothing is pushed onto the bucket being drained
+        while bucket:
+            if pending > peak:
+                peak = pending
+            current = bucket.pop()
+            pending -= 1
+            if done[current]:
+                continue
+            done[current] = 1
+            expanded += 1
+            if current == goal:
+                if stats is not None:
+                    queued = (cell for queue in buckets for cell in queue)
+                    _open_stats(stats, expanded, peak, queued, done)
+                path = _trace_cells(parent, current)
+                buffers.end(touched, occupancy)
+                return path, expanded
+
+            col = current % cols
+            for ok, nxt in ((current >= cols, current - cols),
+                            (current < last_row, current + cols),
+                            (col > 0, current - 1),
+                            (col < last_col, current + 1)):
+                if ok and not done[nxt]:
+                    nd = d + costs[nxt]
+                    if nd < dist[nxt]:
+                        dist[nxt] = nd
+                        parent[nxt] = current
+                        mark(nxt)
+                        buckets[nd % width].append(nxt)
+                        pending += 1
+        d += 1
+
+    if stats is not None:
+        _open_stats(stats, expanded, peak, (), done)
+    buffers.end(touched, occupancy)
+    return None, expanded
+
+
+def _run_search(algorithm, occupancy, rows, cols, start, goal, epsilon, costs=None,
+                stats=None, buffers=None):
+    """
+    Dispatch a cell-id search to the engine for an algorithm name.
+
+    Args:
+        algorithm (str): One of ALGORITHMS
+        occupancy (bytes-like): 1 for a wall, 0 for an open cell
+        rows (int): Number of rows
+        cols (int): Number of columns
+        start (int): Start cell id
+        goal (int): Goal cell id
+        epsilon (float): Heuristic weight for weighted A*
+        costs (bytes-like, optional): Per-cell entry costs, used by Dijkstra
+        stats (dict, optional): Passed to the engine to collect counters
+        buffers (_SearchBuffers, optional): Reusable buffers synced to
+            occupancy
+
+    Returns:
+        tuple: (list of cell ids from start to goal or None, nodes expanded)
+    """
+    if algorithm == "bfs":
+        return _bfs_cells(occupancy, rows, cols, start, goal, stats, buffers)
+    if algorithm == "astar":
+        return _astar_cells(occupancy, rows, cols, start, goal, 1.0, stats, buffers)
+    if algorithm == "bidirectional":
+        return _bidirectional_cells(occupancy, rows, cols, start, goal, stats, buffers)
+    if algorithm == "dijkstra":
+        return _dijkstra_cells(occupancy, costs, rows, cols, start, goal, stats, buffers)
+    return _astar_cells(occupancy, rows, cols, start, goal, epsilon, stats, buffers)
+
+
+# Search inputs shared by batch worker processes, set once per batch
+_BATCH_STATE = None
+
+
+def _init_batch_worker(state):
+    """
+    Pool initializer for find_paths workers.
+
+    Under the "fork" start method the state is inherited from the parent
+    and ``state`` is None; otherwise it arrives here once per worker.
+
+    Args:
+        state (tuple or None): (occupancy, rows, cols, algorithm, epsilon,
+            costs)
+    """
+    global _BATCH_STATE
+    if state is not None:
+        _BATCH_STATE = state
+
+
+def _solve_batch_chunk(chunk):
+    """
+    Answer a chunk of cell-id queries in a worker process.
+
+    Args:
+        chunk (list): (start cell, goal cell) pairs
+
+    Returns:
+        list: (array of cell ids or None, nodes expanded) per query
+    """
+    occupancy, rows, cols, algorithm, epsilon, costs = _BATCH_STATE
+    results = []
+    for start, goal in chunk:
+        cells, expanded = _run_search(algorithm, occupancy, rows, cols,
+                                      start, goal, epsilon, costs)
+        results.append((array('l', cells) if cells is not None else None, expanded))
+    return results
+
+
+def _trace_cells(parent, cell):
+    """
+    Follow a parent buffer back to the root.
+
+    Args:
+        parent (array): Parent cell id per cell, -1 at the root
+        cell (int): Cell to trace from
+
+    Returns:
+        list: Cell ids from the root to cell
+    """
+    cells = []
+    while cell != -1:
+        cells.append(cell)
+        cell = parent[cell]
+    cells.reverse()
+    return cells
 
 
 class Pathfinder:
     """
-    Pathfinding using Breadth-First Search (BFS).
+    Pathfinding using Breadth-First Search (BFS), bidirectional BFS,
+    A*, weighted A* or Dijkstra.
+
+    On worlds that expose an occupancy buffer the search runs over flat
+    integer cell ids; other worlds fall back to a Position-based BFS.
+    Only Dijkstra takes per-cell terrain costs into account; the other
+    algorithms minimize the number of moves.
 
     Attributes:
         world (GridWorld): The grid world environment
+        algorithm (str): Search algorithm, one of ALGORITHMS
+        epsilon (float): Heuristic weight used by weighted A*
         nodes_expanded (int): Number of nodes explored in last search
+            (0 when the result came from the cache)
+        path_cost (int or None): Total terrain cost of the last path found
+            (its number of moves on worlds without costs), None if none
+        last_stats (SearchStats or None): Record of the last find_path call
+        profile (bool): Also measure counters that cost extra work
+        hook (callable or None): Called with each find_path's SearchStats
+        cache_size (int): Maximum number of cached results (0 disables)
+        cache_hits (int): Queries answered from the cache
+        cache_misses (int): Queries that had to run a search
     """
 
-    def __init__(self, world):
+    def __init__(self, world, algorithm="bfs", epsilon=1.5, cache_size=0,
+                 profile=False, hook=None):
         """
         Initialize pathfinder for a grid world.
 
         Args:
             world (GridWorld): The grid world environment
+            algorithm (str): "bfs", "bidirectional", "astar",
+                "weighted_astar" or "dijkstra"
+            epsilon (float): Heuristic weight for "weighted_astar" (>= 1)
+            cache_size (int): Keep up to this many results in an LRU cache
+                keyed by (world.version, start, goal) (default: 0, off)
+            profile (bool): Measure max_frontier for BFS too, at the cost
+                of an extra pass over its queue (default: False)
+            hook (callable, optional): Observer called as hook(stats)
+                after every find_path, e.g. a LatencyHistogram
         """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"unknown algorithm {algorithm!r}, expected one of {ALGORITHMS}")
+        if epsilon < 1:
+            raise ValueError("epsilon must be >= 1")
+        if cache_size < 0:
+            raise ValueError("cache_size must be >= 0")
         self.world = world
+        self.algorithm = algorithm
+        self.epsilon = epsilon
         self.nodes_expanded = 0
+        self.path_cost = None
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache = OrderedDict()
+        self.profile = profile
+        self.hook = hook
+        self.last_stats = None
+        self._counters = {}
+        self._reason = None
+        self._buffers = None
 
     def find_path(self, start, goal):
         """
-        Find shortest path from start to goal using BFS.
+        Find a path from start to goal with the configured algorithm.
+
+        BFS, bidirectional BFS and A* return a shortest path; weighted
+        A* returns a path at most epsilon times the shortest length;
+        Dijkstra returns a minimum-cost path. The path's total cost is
+        stored in ``path_cost`` and a SearchStats record of the call in
+        ``last_stats``, which is also passed to ``hook`` if one is set.
+        With a cache, repeated queries against an unchanged world are
+        answered without searching.
 
         Args:
             start (Position): Starting position
@@ -35,21 +946,370 @@ class Pathfinder:
             list or None: List of Position objects from start to goal,
                          or None if no path exists
         """
+        return self._find(start, goal, False)
+
+    def find_compact_path(self, start, goal):
+        """
+        Like find_path, but return the path as a CompactPath.
+
+        On worlds with an occupancy buffer the path is encoded straight
+        from the search's cell ids, so no Position list is ever built.
+
+        Args:
+            start (Position): Starting position
+            goal (Position): Goal position
+
+        Returns:
+            CompactPath or None: Path from start to goal, or None if no
+                path exists
+        """
+        return self._find(start, goal, True)
+
+    def _find(self, start, goal, compact):
+        """
+        Search, record stats and notify the hook.
+
+        Args:
+            start (Position): Starting position
+            goal (Position): Goal position
+            compact (bool): Return a CompactPath instead of a list
+
+        Returns:
+            list, CompactPath or None: Path from start to goal, or None
+        """
+        started = time.perf_counter()
+        path = self._cached_search(start, goal, compact)
+        self.path_cost = self._path_cost(path)
+        counters = self._counters
+        self.last_stats = SearchStats(
+            self.algorithm, start, goal, time.perf_counter() - started,
+            self.nodes_expanded, counters.get("visited"), counters.get("max_frontier"),
+            len(path) if path is not None else None, self._reason)
+        if self.hook is not None:
+            self.hook(self.last_stats)
+        return path
+
+    def _cached_search(self, start, goal, compact=False):
+        """
+        Answer a query from the cache, searching on a miss.
+
+        Args:
+            start (Position): Starting position
+            goal (Position): Goal position
+            compact (bool): Return a CompactPath instead of a list
+
+        Returns:
+            list, CompactPath or None: Path from start to goal, or None if
+                no path exists
+        """
+        version = getattr(self.world, "version", None)
+        if not self.cache_size or version is None:
+            return self._search(start, goal, compact)
+
+        cache = self._cache
+        key = (version, start, goal, compact)
+        if key in cache:
+            cache.move_to_end(key)
+            self.cache_hits += 1
+            self.nodes_expanded = 0
+            self._counters = {}
+            self._reason = CACHE_HIT
+            path = cache[key]
+            # CompactPaths are immutable and can be shared
+            return list(path) if isinstance(path, tuple) else path
+
+        self.cache_misses += 1
+        path = self._search(start, goal, compact)
+        if cache and next(iter(cache))[0] != version:
+            # Every entry is keyed to an older world; drop them all
+            cache.clear()
+        cache[key] = tuple(path) if isinstance(path, list) else path
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return path
+
+    def find_paths(self, queries, workers=None, chunksize=256):
+        """
+        Answer many independent (start, goal) queries, optionally in parallel.
+
+        The world's occupancy buffer is handed to each worker process once
+        (inherited through fork where available, otherwise sent once per
+        worker by the pool initializer); queries are sent in chunks of cell
+        ids. Queries ruled out by the world's component index are answered
+        without searching. The cache is not consulted.
+
+        Args:
+            queries (iterable): (start, goal) Position pairs
+            workers (int, optional): Worker processes (default: CPU count);
+                1 runs everything in this process
+            chunksize (int): Queries per task sent to a worker
+
+        Returns:
+            list: (path or None, nodes_expanded) per query, in input order
+        """
+        queries = list(queries)
+        results = [None] * len(queries)
+        world = self.world
+        index = getattr(world, "component_index", None)
+        jobs = []
+
+        for i, (start, goal) in enumerate(queries):
+            if index is not None and not index.may_reach(start, goal):
+                results[i] = (None, 0)
+            elif (hasattr(world, "occupancy")
+                    and world.in_bounds(start) and world.in_bounds(goal)):
+                cols = world.cols
+                jobs.append((i, start.row * cols + start.col, goal.row * cols + goal.col))
+            else:
+                path = self._search(start, goal)
+                results[i] = (path, self.nodes_expanded)
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if not jobs:
+            return results
+
+        state = (world.occupancy(), world.rows, world.cols, self.algorithm, self.epsilon,
+                 getattr(world, "costs", None))
+        if workers <= 1 or len(jobs) <= chunksize:
+            occupancy, rows, cols, algorithm, epsilon, costs = state
+            buffers = self._cell_buffers(occupancy)
+            for i, start, goal in jobs:
+                cells, expanded = _run_search(algorithm, occupancy, rows, cols,
+                                              start, goal, epsilon, costs, None, buffers)
+                results[i] = (self._to_positions(cells), expanded)
+            return results
+
+        global _BATCH_STATE
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+            _BATCH_STATE = state
+            initargs = (None,)
+        else:
+            context = multiprocessing.get_context()
+            initargs = (state,)
+
+        chunks = [jobs[i:i + chunksize] for i in range(0, len(jobs), chunksize)]
+        try:
+            with context.Pool(workers, _init_batch_worker, initargs) as pool:
+                answers = pool.imap(_solve_batch_chunk,
+                                    [[(s, g) for _, s, g in chunk] for chunk in chunks])
+                for chunk, chunk_answers in zip(chunks, answers):
+                    for (i, _, _), (cells, expanded) in zip(chunk, chunk_answers):
+                        results[i] = (self._to_positions(cells), expanded)
+        finally:
+            _BATCH_STATE = None
+        return results
+
+    def find_nearest(self, sources, goals):
+        """
+        Find the goal nearest to any of several sources in one BFS pass.
+
+        Every source starts the search at distance 0, so the first goal
+        reached is the closest one in moves (terrain costs are ignored,
+        as in BFS) and its path starts at the source nearest to it. Goal
+        positions are marked in a bitmap, so each membership check is a
+        single lookup. The cache is not consulted.
+
+        Args:
+            sources (Position or iterable): Starting position(s)
+            goals: Iterable of goal Positions, or a callable taking a
+                Position and returning True for goal cells
+
+        Returns:
+            tuple: (goal Position, list of Positions from a source to it),
+                or (None, None) if no goal is reachable
+        """
+        world = self.world
+        if isinstance(sources, Position):
+            sources = [sources]
+        self._counters = counters = {"max_frontier": None} if self.profile else {}
+
+        if not hasattr(world, "occupancy"):
+            is_goal = goals if callable(goals) else set(goals).__contains__
+            path = self._bfs_generic(list(sources), is_goal)
+        else:
+            rows, cols = world.rows, world.cols
+            if callable(goals):
+                is_goal = _CellPredicate(goals, cols)
+            else:
+                is_goal = bytearray(rows * cols)
+                for pos in goals:
+                    if world.in_bounds(pos):
+                        is_goal[pos.row * cols + pos.col] = 1
+            cells = [pos.row * cols + pos.col for pos in sources if world.in_bounds(pos)]
+            occupancy = world.occupancy()
+            found, self.nodes_expanded = _nearest_cells(
+                occupancy, rows, cols, cells, is_goal, counters,
+                self._cell_buffers(occupancy))
+            path = self._to_positions(found)
+
+        self.path_cost = self._path_cost(path)
+        if path is None:
+            return None, None
+        return path[-1], path
+
+    def clear_cache(self):
+        """Drop all cached results and reset the hit/miss counters."""
+        self._cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _search(self, start, goal, compact=False):
+        """
+        Run the configured search without consulting the cache.
+
+        Args:
+            start (Position): Starting position
+            goal (Position): Goal position
+            compact (bool): Return a CompactPath instead of a list
+
+        Returns:
+            list, CompactPath or None: Path from start to goal, or None if
+                no path exists
+        """
+        world = self.world
+        self._counters = counters = {"max_frontier": None} if self.profile else {}
+        index = getattr(world, "component_index", None)
+        if index is not None and not index.may_reach(start, goal):
+            self.nodes_expanded = 0
+            self._reason = UNREACHABLE
+            return None
+
+        if (not hasattr(world, "occupancy")
+                or not world.in_bounds(start) or not world.in_bounds(goal)):
+            path = self._find_path_generic(start, goal)
+            if compact and path is not None:
+                path = CompactPath.from_positions(path)
+        else:
+            cols = world.cols
+            occupancy = world.occupancy()
+            cells, self.nodes_expanded = _run_search(
+                self.algorithm, occupancy, world.rows, cols,
+                start.row * cols + start.col, goal.row * cols + goal.col,
+                self.epsilon, getattr(world, "costs", None), counters,
+                self._cell_buffers(occupancy))
+            if cells is None:
+                path = None
+            elif compact:
+                path = CompactPath.from_cells(cells, cols)
+            else:
+                path = self._to_positions(cells)
+
+        self._reason = FOUND if path is not None else EXHAUSTED
+        return path
+
+    def _cell_buffers(self, occupancy):
+        """
+        Search buffers for the world's grid, kept between queries.
+
+        Args:
+            occupancy (bytes-like): The world's current wall buffer
+
+        Returns:
+            _SearchBuffers: Buffers synced to occupancy
+        """
+        world = self.world
+        n = world.rows * world.cols
+        buffers = self._buffers
+        if buffers is None or buffers.n != n:
+            buffers = self._buffers = _SearchBuffers(n)
+        buffers.sync(occupancy, getattr(world, "version", None))
+        return buffers
+
+    def _path_cost(self, path):
+        """
+        Total cost of entering every cell of a path after the first.
+
+        Args:
+            path (list, CompactPath or None): Path from start to goal
+
+        Returns:
+            int or None: Path cost, or None if path is None
+        """
+        if path is None:
+            return None
+        costs = getattr(self.world, "costs", None)
+        if costs is None:
+            return len(path) - 1
+        cols = self.world.cols
+        cells = iter(path)
+        next(cells)
+        return sum(costs[pos.row * cols + pos.col] for pos in cells)
+
+    def _to_positions(self, cells):
+        """
+        Convert cell ids to Position objects (pooled when interning).
+
+        Args:
+            cells (sequence or None): Cell ids from a search engine
+
+        Returns:
+            list or None: Position objects, or None if cells is None
+        """
+        if cells is None:
+            return None
+        world = self.world
+        cols = world.cols
+        make = world.position if getattr(world, "pool", None) is not None else Position
+        return [make(cell // cols, cell % cols) for cell in cells]
+
+    def _find_path_generic(self, start, goal):
+        """
+        BFS using only the world's in_bounds/passable interface.
+
+        Args:
+            start (Position): Starting position
+            goal (Position): Goal position
+
+        Returns:
+            list or None: List of Position objects from start to goal,
+                         or None if no path exists
+        """
+        return self._bfs_generic([start], goal.__eq__)
+
+    def _bfs_generic(self, sources, is_goal):
+        """
+        Multi-source BFS using only the world's in_bounds/passable interface.
+
+        Args:
+            sources (list): Starting positions, all at distance 0
+            is_goal (callable): Returns True for a goal Position
+
+        Returns:
+            list or None: List of Position objects from a source to the
+                         first goal reached, or None if none is reachable
+        """
         # Reset expansion counter
         self.nodes_expanded = 0
 
+        # Pooled positions make neighbors_4() reuse shared instances
+        pool = getattr(self.world, "pool", None)
+        if pool is not None:
+            sources = [pool.intern(pos) for pos in sources]
+
         # BFS initialization
-        queue = deque([start])
-        visited = {start}
-        parent = {start: None}
+        queue = deque()
+        visited = set()
+        parent = {}
+        for pos in sources:
+            if pos not in visited:
+                visited.add(pos)
+                parent[pos] = None
+                queue.append(pos)
+        counters = self._counters
+        counters["max_frontier"] = len(queue)
 
         # BFS loop
         while queue:
+            if len(queue) > counters["max_frontier"]:
+                counters["max_frontier"] = len(queue)
             current = queue.popleft()
             self.nodes_expanded += 1
 
-            # Check if we reached the goal
-            if current == goal:
+            # Check if we reached a goal
+            if is_goal(current):
+                counters["visited"] = len(visited)
                 # Reconstruct path by backtracking through parents
                 path = []
                 node = current
@@ -71,4 +1331,337 @@ class Pathfinder:
                     queue.append(neighbor)
 
         # No path found
+        counters["visited"] = len(visited)
+        return None
+
+
+def _scan_line(cells, lines, width, line, pos, step, goal):
+    """
+    Straight jump-point scan along one line of a row-major 0/1 buffer.
+
+    Walks from ``pos`` (exclusive) in direction ``step`` and returns the
+    first cell that is the goal or has a forced neighbor: a cell on an
+    adjacent line that is open while the cell before it is a wall. The
+    walls ahead, the goal and the forced neighbors are each found with a
+    single ``bytearray.find``/``rfind`` over the buffer, so the scan runs
+    in C rather than testing cells one by one in Python.
+
+    Args:
+        cells (bytearray): ``lines * width`` cells, 1 for a wall
+        lines (int): Number of lines (rows of the buffer)
+        width (int): Cells per line
+        line (int): Line being scanned
+        pos (int): Starting position on the line
+        step (int): 1 or -1
+        goal (int or None): Goal position if the goal is on this line
+
+    Returns:
+        int: Position of the jump point on the line, or -1 if the scan
+            hits a wall or the edge first
+    """
+    base = line * width
+    above = (line - 1) * width if line > 0 else -1
+    below = (line + 1) * width if line + 1 < lines else -1
+    if step > 0:
+        if pos + 1 >= width or cells[base + pos + 1]:
+            return -1
+        wall = cells.find(1, base + pos + 1, base + width)
+        end = wall - base if wall != -1 else width
+        best = goal if goal is not None and pos < goal < end else end
+        for nb in (above, below):
+            if nb != -1:
+                # Wall then open cell: the open one is forced
+                i = cells.find(b"\x01\x00", nb + pos, nb + best)
+                if i != -1:
+                    best = i - nb + 1
+    else:
+        if pos == 0 or cells[base + pos - 1]:
+            return -1
+        wall = cells.rfind(1, base, base + pos)
+        end = wall - base if wall != -1 else -1
+        best = goal if goal is not None and end < goal < pos else end
+        for nb in (above, below):
+            if nb != -1:
+                i = cells.rfind(b"\x00\x01", nb + best + 1, nb + pos + 1)
+                if i != -1:
+                    best = i - nb
+    return best if best != end else -1
+
+
+class JumpPointSearch:
+    """
+    Jump Point Search (JPS) for uniform-cost grids.
+
+    A* over "jump points" only: straight (and, with diagonal movement,
+    diagonal) runs of symmetric cells are skipped by scanning ahead until
+    a cell with a forced neighbor or the goal is found. The default
+    4-connected mode matches Position.neighbors_4() movement and returns
+    the same path lengths as BFS. With ``diagonal=True`` moves may also
+    go diagonally (cost sqrt(2)) as long as neither adjacent orthogonal
+    cell is a wall. Requires a world with an occupancy buffer.
+
+    Attributes:
+        world (GridWorld): The grid world environment
+        diagonal (bool): Allow 8-connected movement
+        nodes_expanded (int): Number of jump points expanded in last search
+        jump_points (list): Jump points on the last path, start to goal
+    """
+
+    def __init__(self, world, diagonal=False):
+        """
+        Initialize Jump Point Search for a grid world.
+
+        Args:
+            world (GridWorld): The grid world environment
+            diagonal (bool): Allow 8-connected movement (default: False)
+        """
+        self.world = world
+        self.diagonal = diagonal
+        self.nodes_expanded = 0
+        self.jump_points = []
+        self._columns = None
+
+    def _transposed(self, occupancy):
+        """
+        Column-major copy of the occupancy buffer for vertical scans.
+
+        Rebuilt only when the world's version or buffer changes.
+
+        Args:
+            occupancy (bytearray): Row-major wall buffer of the world
+
+        Returns:
+            bytearray: ``cols * rows`` cells indexed by ``col * rows + row``
+        """
+        version = getattr(self.world, "version", None)
+        cached = self._columns
+        if cached is None or cached[0] is not occupancy or cached[1] != version:
+            cols = self.world.cols
+            columns = bytearray(b"".join(occupancy[c::cols] for c in range(cols)))
+            cached = self._columns = (occupancy, version, columns)
+        return cached[2]
+
+    def find_path(self, start, goal):
+        """
+        Find a shortest path from start to goal.
+
+        Args:
+            start (Position): Starting position
+            goal (Position): Goal position
+
+        Returns:
+            list or None: List of every Position from start to goal,
+                         or None if no path exists
+        """
+        self.nodes_expanded = 0
+        self.jump_points = []
+        world = self.world
+        if not world.in_bounds(start) or not world.in_bounds(goal):
+            return None
+        if start == goal:
+            self.nodes_expanded = 1
+            self.jump_points = [start]
+            return [start]
+
+        rows = world.rows
+        cols = world.cols
+        occupancy = world.occupancy()
+        goal_cell = (goal.row, goal.col)
+
+        def is_open(r, c):
+            return 0 <= r < rows and 0 <= c < cols and not occupancy[r * cols + c]
+
+        if self.diagonal:
+            jump, successors, heuristic = self._diagonal_rules(
+                occupancy, self._transposed(occupancy), rows, cols, is_open, goal_cell)
+        else:
+            jump, successors, heuristic = self._orthogonal_rules(
+                occupancy, rows, cols, is_open, goal_cell)
+
+        start_cell = (start.row, start.col)
+        best_g = {start_cell: 0}
+        parent = {start_cell: None}
+        closed = set()
+        heap = [(heuristic(start_cell), 0, start_cell, None)]
+
+        while heap:
+            _, neg_g, node, direction = heapq.heappop(heap)
+            if node in closed:
+                continue
+            closed.add(node)
+            self.nodes_expanded += 1
+
+            if node == goal_cell:
+                return self._expand(parent, node)
+
+            g = -neg_g
+            for dr, dc in successors(node, direction):
+                point = jump(node[0], node[1], dr, dc)
+                if point is None or point in closed:
+                    continue
+                steps = max(abs(point[0] - node[0]), abs(point[1] - node[1]))
+                new_g = g + (steps * _SQRT2 if dr and dc else steps)
+                if new_g < best_g.get(point, float("inf")):
+                    best_g[point] = new_g
+                    parent[point] = node
+                    heapq.heappush(heap, (new_g + heuristic(point), -new_g, point, (dr, dc)))
+
         return None
+
+    def _orthogonal_rules(self, occupancy, rows, cols, is_open, goal):
+        """
+        Jump, successor and heuristic functions for 4-connected movement.
+
+        Canonical paths take vertical moves before horizontal ones, so a
+        vertical scan stops wherever a horizontal scan would find a jump
+        point, and a horizontal scan stops where a vertical neighbor is
+        only reachable through it (the cell diagonally behind is a wall).
+        Horizontal scans run over the occupancy buffer with _scan_line.
+        """
+        goal_row, goal_col = goal
+
+        def jump_horizontal(r, c, dc):
+            x = _scan_line(occupancy, rows, cols, r, c, dc, goal_col if r == goal_row else None)
+            return (r, x) if x != -1 else None
+
+        def jump(r, c, dr, dc):
+            if dc:
+                return jump_horizontal(r, c, dc)
+            while True:
+                r += dr
+                if not 0 <= r < rows or occupancy[r * cols + c]:
+                    return None
+                if r == goal_row:
+                    if c == goal_col:
+                        return (r, c)
+                    on_row = goal_col
+                else:
+                    on_row = None
+                if (_scan_line(occupancy, rows, cols, r, c, 1, on_row) != -1
+                        or _scan_line(occupancy, rows, cols, r, c, -1, on_row) != -1):
+                    return (r, c)
+
+        def successors(node, direction):
+            if direction is None:
+                return _ORTHOGONAL
+            dr, dc = direction
+            if dr:
+                return ((dr, 0), (0, -1), (0, 1))
+            r, c = node
+            moves = [(0, dc)]
+            for side in (-1, 1):
+                if is_open(r + side, c) and not is_open(r + side, c - dc):
+                    moves.append((side, 0))
+            return moves
+
+        def heuristic(node):
+            return abs(node[0] - goal[0]) + abs(node[1] - goal[1])
+
+        return jump, successors, heuristic
+
+    def _diagonal_rules(self, occupancy, transposed, rows, cols, is_open, goal):
+        """
+        Jump, successor and heuristic functions for 8-connected movement.
+
+        Diagonal moves may not cut corners, so straight scans stop at
+        cells whose side neighbor opens up behind a wall, and diagonal
+        scans stop where either straight component finds a jump point.
+        Horizontal scans run over the occupancy buffer and vertical ones
+        over its column-major copy, both with _scan_line.
+        """
+        goal_row, goal_col = goal
+
+        def jump_straight(r, c, dr, dc):
+            if dc:
+                x = _scan_line(occupancy, rows, cols, r, c, dc,
+                               goal_col if r == goal_row else None)
+                return (r, x) if x != -1 else None
+            y = _scan_line(transposed, cols, rows, c, r, dr,
+                           goal_row if c == goal_col else None)
+            return (y, c) if y != -1 else None
+
+        def jump(r, c, dr, dc):
+            if not (dr and dc):
+                return jump_straight(r, c, dr, dc)
+            while True:
+                r += dr
+                c += dc
+                if not (0 <= r < rows and 0 <= c < cols) or occupancy[r * cols + c]:
+                    return None
+                if r == goal_row and c == goal_col:
+                    return (r, c)
+                if (_scan_line(transposed, cols, rows, c, r, dr,
+                               goal_row if c == goal_col else None) != -1
+                        or _scan_line(occupancy, rows, cols, r, c, dc,
+                                      goal_col if r == goal_row else None) != -1):
+                    return (r, c)
+                if not (is_open(r + dr, c) and is_open(r, c + dc)):
+                    return None
+
+        def successors(node, direction):
+            r, c = node
+            if direction is None:
+                moves = list(_ORTHOGONAL)
+                for dr, dc in _DIAGONAL:
+                    if is_open(r + dr, c) and is_open(r, c + dc):
+                        moves.append((dr, dc))
+                return moves
+            dr, dc = direction
+            if dr and dc:
+                moves = [(dr, 0), (0, dc)]
+                if is_open(r + dr, c) and is_open(r, c + dc):
+                    moves.append((dr, dc))
+                return moves
+            if dc:
+                ahead = is_open(r, c + dc)
+                moves = [(0, dc)]
+                for side in (-1, 1):
+                    if is_open(r + side, c):
+                        moves.append((side, 0))
+                        if ahead:
+                            moves.append((side, dc))
+                return moves
+            ahead = is_open(r + dr, c)
+            moves = [(dr, 0)]
+            for side in (-1, 1):
+                if is_open(r, c + side):
+                    moves.append((0, side))
+                    if ahead:
+                        moves.append((dr, side))
+            return moves
+
+        def heuristic(node):
+            dr = abs(node[0] - goal[0])
+            dc = abs(node[1] - goal[1])
+            return max(dr, dc) + (_SQRT2 - 1) * min(dr, dc)
+
+        return jump, successors, heuristic
+
+    def _expand(self, parent, node):
+        """
+        Turn the chain of jump points ending at node into a full path.
+
+        Args:
+            parent (dict): Parent jump point of each jump point
+            node (tuple): Final (row, col) jump point
+
+        Returns:
+            list: Every Position from the start to node
+        """
+        points = []
+        while node is not None:
+            points.append(node)
+            node = parent[node]
+        points.reverse()
+        self.jump_points = [Position(r, c) for r, c in points]
+
+        path = [self.jump_points[0]]
+        for (r0, c0), (r1, c1) in zip(points, points[1:]):
+            dr = (r1 > r0) - (r1 < r0)
+            dc = (c1 > c0) - (c1 < c0)
+            r, c = r0, c0
+            while (r, c) != (r1, c1):
+                r += dr
+                c += dc
+                path.append(Position(r, c))
+        return path
@@ -1,39 +1,60 @@
 """Position representation for grid world navigation."""
 
+from operator import itemgetter
 
-class Position:
+
+class Position(tuple):
     """
-    Represents a position in a 2D grid.
+    Represents an immutable position in a 2D grid.
+
+    A Position is a ``(row, col)`` tuple subclass with no per-instance
+    ``__dict__``: construction, hashing and element access all run in
+    C, and an instance is no larger than the pair itself. Positions only
+    compare equal to other Positions, never to plain tuples.
 
     Attributes:
         row (int): Row index
         col (int): Column index
     """
 
-    def __init__(self, row, col):
+    __slots__ = ()
+
+    # Set on the classes of positions handed out by a PositionPool
+    _pool = None
+
+    def __new__(cls, row, col):
         """
-        Initialize a position.
+        Create a position.
 
         Args:
             row (int): Row index
             col (int): Column index
         """
-        self.row = row
-        self.col = col
+        return _tuple_new(cls, (row, col))
+
+    row = property(itemgetter(0), doc="Row index")
+    col = property(itemgetter(1), doc="Column index")
 
     def neighbors_4(self):
         """
         Get the four neighboring positions (up, down, left, right).
 
+        Positions handed out by a PositionPool return shared pooled
+        neighbors instead of allocating new ones.
+
         Returns:
             tuple: Four Position objects (up, down, left, right)
         """
-        up = Position(self.row - 1, self.col)
-        down = Position(self.row + 1, self.col)
-        left = Position(self.row, self.col - 1)
-        right = Position(self.row, self.col + 1)
+        row, col = self
+        pool = self._pool
+        if pool is not None:
+            get = pool.get
+            return (get(row - 1, col), get(row + 1, col),
+                    get(row, col - 1), get(row, col + 1))
 
-        return (up, down, left, right)
+        new = _tuple_new
+        return (new(Position, (row - 1, col)), new(Position, (row + 1, col)),
+                new(Position, (row, col - 1)), new(Position, (row, col + 1)))
 
     def __eq__(self, other):
         """
@@ -45,18 +66,31 @@ class Position:
         Returns:
             bool: True if positions are equal
         """
-        if not isinstance(other, Position):
-            return False
-        return self.row == other.row and self.col == other.col
+        return isinstance(other, Position) and _tuple_eq(self, other)
 
-    def __hash__(self):
+    def __ne__(self, other):
         """
-        Make Position hashable for use in sets and dicts.
+        Check inequality with another Position.
+
+        Args:
+            other (Position): Another position object
 
         Returns:
-            int: Hash value
+            bool: True unless other is an equal Position
+        """
+        return not self.__eq__(other)
+
+    # Defining __eq__ would otherwise disable hashing
+    __hash__ = tuple.__hash__
+
+    def __reduce__(self):
         """
-        return hash((self.row, self.col))
+        Pickle support; pooled positions unpickle as plain ones.
+
+        Returns:
+            tuple: Constructor and arguments
+        """
+        return (Position, tuple(self))
 
     def __repr__(self):
         """
@@ -65,4 +99,78 @@ class Position:
         Returns:
             str: String like "(2,3)"
         """
-        return f"({self.row},{self.col})"
+        return f"({self[0]},{self[1]})"
+
+
+_tuple_new = tuple.__new__
+_tuple_eq = tuple.__eq__
+
+
+class PositionPool:
+    """
+    Interning pool of Position objects for one grid.
+
+    Each in-bounds cell gets a single shared Position, created on first
+    use. Pooled positions return pooled neighbors from neighbors_4(), so
+    searches that walk the grid stop allocating once cells are warm.
+    Out-of-bounds positions are created fresh and are not pooled. Pooled
+    positions belong to a Position subclass made for the pool, so the
+    link back to the pool costs nothing per instance.
+
+    Attributes:
+        rows (int): Number of rows
+        cols (int): Number of columns
+    """
+
+    def __init__(self, rows, cols):
+        """
+        Initialize an empty pool.
+
+        Args:
+            rows (int): Number of rows
+            cols (int): Number of columns
+        """
+        self.rows = rows
+        self.cols = cols
+        self._cells = [None] * (rows * cols)
+        self._type = type("_PooledPosition", (Position,), {"__slots__": (), "_pool": self})
+
+    def get(self, row, col):
+        """
+        Shared Position for a cell.
+
+        Args:
+            row (int): Row index
+            col (int): Column index
+
+        Returns:
+            Position: The pooled instance, or a fresh one if out of bounds
+        """
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return Position(row, col)
+        index = row * self.cols + col
+        pos = self._cells[index]
+        if pos is None:
+            pos = self._cells[index] = _tuple_new(self._type, (row, col))
+        return pos
+
+    def intern(self, pos):
+        """
+        Pooled equivalent of an existing Position.
+
+        Args:
+            pos (Position): Any position
+
+        Returns:
+            Position: Shared instance equal to pos
+        """
+        return self.get(pos.row, pos.col)
+
+    def __len__(self):
+        """
+        Number of positions created so far.
+
+        Returns:
+            int: Count of pooled positions
+        """
+        return len(self._cells) - self._cells.count(None)
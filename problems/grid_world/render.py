@@ -0,0 +1,228 @@
+"""ASCII rendering of grid worlds to streams, strings and ANSI terminals."""
+
+import sys
+from position import Position
+
+# Occupancy byte -> glyph: 0 = open '.', anything else a wall '#'
+_GLYPHS = bytes([ord(".")]) + bytes([ord("#")]) * 255
+
+# ANSI escapes: clear screen and home the cursor; move to a 1-based cell
+_CLEAR = "\x1b[2J\x1b[H"
+_MOVE = "\x1b[{};{}H"
+
+
+class Renderer:
+    """
+    Draws a world with the GridWorld.render legend.
+
+    Rows are built by translating slices of the world's occupancy buffer
+    into glyphs, then the few overlay cells (path, start, goal, agent)
+    are patched in, so no Position is created for plain cells. Frames go
+    to any writable text stream or to a string.
+
+    draw() is the incremental mode for ANSI terminals: the first call
+    paints the whole viewport, later calls move the cursor to and repaint
+    only the cells whose glyph changed, i.e. overlay cells that appeared
+    or disappeared plus cells whose wall state changed in between.
+
+    Legend:
+        # = wall
+        . = empty space
+        S = start
+        G = goal
+        A = agent
+        * = path
+
+    Attributes:
+        world (GridWorld): The world to draw
+        stream: Writable text stream (default: sys.stdout at draw time)
+        viewport (tuple or None): ``(top, left, height, width)`` window,
+            None for the whole grid
+        cells_drawn (int): Cells written by the most recent draw()
+    """
+
+    def __init__(self, world, stream=None, viewport=None):
+        """
+        Initialize a renderer.
+
+        Args:
+            world (GridWorld): The world to draw
+            stream (optional): Writable text stream (default: sys.stdout)
+            viewport (tuple, optional): ``(top, left, height, width)``;
+                required for unbounded worlds
+        """
+        self.world = world
+        self.stream = stream
+        self.viewport = viewport
+        self.cells_drawn = 0
+        self._shown = None
+        self._shown_view = None
+        self._dirty = set()
+        self._subscribed = False
+
+    def close(self):
+        """Stop listening to wall changes."""
+        if self._subscribed:
+            self.world.unsubscribe(self._on_wall_change)
+            self._subscribed = False
+
+    def center(self, pos):
+        """
+        Move the viewport so pos is as close to its center as the grid allows.
+
+        Args:
+            pos (Position): Position to keep in view
+        """
+        _, _, height, width = self._view()
+        self.viewport = (pos.row - height // 2, pos.col - width // 2, height, width)
+
+    def to_string(self, path=None, agent=None):
+        """
+        Render a frame to a string.
+
+        Args:
+            path (list, optional): List of Position objects forming a path
+            agent (Position, optional): Current agent position
+
+        Returns:
+            str: One line per viewport row, each ending in a newline
+        """
+        view = self._view()
+        rows = self._rows(view, self._overlay(path, agent))
+        if not rows:
+            return ""
+        return (b"\n".join(rows) + b"\n").decode("ascii")
+
+    def render(self, path=None, agent=None):
+        """
+        Write a full frame to the stream.
+
+        Args:
+            path (list, optional): List of Position objects forming a path
+            agent (Position, optional): Current agent position
+        """
+        self._write(self.to_string(path, agent))
+
+    def draw(self, path=None, agent=None):
+        """
+        Update an ANSI terminal, repainting only changed cells.
+
+        The first call, and any call after the viewport moved, clears the
+        screen and paints every cell.
+
+        Args:
+            path (list, optional): List of Position objects forming a path
+            agent (Position, optional): Current agent position
+
+        Returns:
+            int: Number of cells written
+        """
+        if not self._subscribed:
+            self.world.subscribe(self._on_wall_change)
+            self._subscribed = True
+
+        view = self._view()
+        top, left, height, width = view
+        overlay = self._overlay(path, agent)
+
+        if self._shown is None or view != self._shown_view:
+            rows = self._rows(view, overlay)
+            out = _CLEAR + b"\n".join(rows).decode("ascii")
+            drawn = height * width
+        else:
+            shown = self._shown
+            changed = set(self._dirty)
+            for cell, glyph in overlay.items():
+                if shown.get(cell) != glyph:
+                    changed.add(cell)
+            for cell in shown:
+                if cell not in overlay:
+                    changed.add(cell)
+
+            parts = []
+            walls = self.world.walls
+            drawn = 0
+            for row, col in sorted(changed):
+                if top <= row < top + height and left <= col < left + width:
+                    glyph = overlay.get((row, col))
+                    if glyph is None:
+                        glyph = "#" if Position(row, col) in walls else "."
+                    parts.append(_MOVE.format(row - top + 1, col - left + 1) + glyph)
+                    drawn += 1
+            out = "".join(parts)
+
+        # Park the cursor below the frame
+        self._write(out + _MOVE.format(height + 1, 1))
+        self._shown = overlay
+        self._shown_view = view
+        self._dirty.clear()
+        self.cells_drawn = drawn
+        return drawn
+
+    def _view(self):
+        """Viewport clipped to the grid, as (top, left, height, width)."""
+        world = self.world
+        rows = world.rows
+        cols = world.cols
+        if self.viewport is None:
+            if rows is None:
+                raise ValueError("an unbounded world needs a viewport to render")
+            return (0, 0, rows, cols)
+        top, left, height, width = self.viewport
+        if rows is None:
+            return (top, left, height, width)
+        height = min(height, rows)
+        width = min(width, cols)
+        top = max(0, min(top, rows - height))
+        left = max(0, min(left, cols - width))
+        return (top, left, height, width)
+
+    def _overlay(self, path, agent):
+        """Glyphs that replace the wall/empty glyph, keyed by (row, col)."""
+        # Later entries win: agent > start/goal > path
+        overlay = {}
+        if path is not None:
+            for pos in path:
+                overlay[(pos.row, pos.col)] = "*"
+        goal = self.world.goal
+        if goal is not None:
+            overlay[(goal.row, goal.col)] = "G"
+        start = self.world.start
+        overlay[(start.row, start.col)] = "S"
+        if agent is not None:
+            overlay[(agent.row, agent.col)] = "A"
+        return overlay
+
+    def _rows(self, view, overlay):
+        """Glyph rows of the viewport as bytearrays."""
+        top, left, height, width = view
+        world = self.world
+        if hasattr(world, "occupancy"):
+            cells = world.occupancy()
+            cols = world.cols
+            rows = []
+            for row in range(top, top + height):
+                base = row * cols + left
+                rows.append(bytearray(cells[base:base + width]).translate(_GLYPHS))
+        else:
+            walls = world.walls
+            rows = [bytearray(_GLYPHS[Position(row, col) in walls]
+                              for col in range(left, left + width))
+                    for row in range(top, top + height)]
+
+        for (row, col), glyph in overlay.items():
+            if top <= row < top + height and left <= col < left + width:
+                rows[row - top][col - left] = ord(glyph)
+        return rows
+
+    def _write(self, text):
+        """Write to the stream and flush it if it supports flushing."""
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write(text)
+        flush = getattr(stream, "flush", None)
+        if flush is not None:
+            flush()
+
+    def _on_wall_change(self, pos, is_wall):
+        """World listener: repaint the cell on the next draw()."""
+        self._dirty.add((pos.row, pos.col))
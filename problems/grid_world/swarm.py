@@ -0,0 +1,165 @@
+"""Vectorized simulation of many agents moving through one grid world."""
+
+import numpy as np
+from agent import DIRECTIONS, DELTAS
+from fields import NO_DIRECTION
+
+# Row/col deltas indexed by direction code; code -1 (stay) hits the
+# trailing zero entry
+_DROW = np.array([DELTAS[d][0] for d in DIRECTIONS] + [0], dtype=np.int64)
+_DCOL = np.array([DELTAS[d][1] for d in DIRECTIONS] + [0], dtype=np.int64)
+
+
+def move_agents(occupancy, rows, cols, agent_rows, agent_cols, directions,
+                collide=True):
+    """
+    Apply one move per agent with whole-array operations.
+
+    A move succeeds when its target is in bounds and not a wall, the same
+    rule as Agent.step. With ``collide`` set, agents also may not end on
+    the same cell or swap cells with each other. Agents that stay (code
+    -1 or a blocked move) keep their cell and beat any agent moving in;
+    among agents moving onto one cell the lowest index wins; of two
+    agents trying to swap, the higher index stays. Losing movers stay
+    put, which can block agents behind them, so conflicts are resolved
+    in rounds until none remain.
+
+    Args:
+        occupancy (np.ndarray): Flat ``uint8`` cells, nonzero = wall
+        rows (int): Number of rows
+        cols (int): Number of columns
+        agent_rows (np.ndarray): Current row of each agent
+        agent_cols (np.ndarray): Current column of each agent
+        directions (np.ndarray): Direction code per agent, an index into
+            agent.DIRECTIONS or -1 to stay
+        collide (bool): Resolve agent-agent collisions (default: True)
+
+    Returns:
+        tuple: (new rows, new cols, success mask); the mask is True for
+            agents that moved and for agents that chose to stay
+    """
+    directions = np.asarray(directions)
+    if directions.shape != agent_rows.shape:
+        raise ValueError("need one direction code per agent")
+    if directions.size and (directions.min() < NO_DIRECTION or directions.max() >= len(DIRECTIONS)):
+        raise ValueError(f"direction codes must be -1..{len(DIRECTIONS) - 1}")
+
+    target_rows = agent_rows + _DROW[directions]
+    target_cols = agent_cols + _DCOL[directions]
+    wants = directions != NO_DIRECTION
+    moving = (wants & (target_rows >= 0) & (target_rows < rows)
+              & (target_cols >= 0) & (target_cols < cols))
+    moving[moving] = occupancy[target_rows[moving] * cols + target_cols[moving]] == 0
+
+    if collide and moving.any():
+        cells = agent_rows * cols + agent_cols
+        targets = target_rows * cols + target_cols
+        index = np.arange(cells.size)
+
+        # Swaps: my target is held by an agent whose target is my cell
+        order = np.argsort(cells, kind="stable")
+        sorted_cells = cells[order]
+        movers = np.flatnonzero(moving)
+        slot = np.minimum(np.searchsorted(sorted_cells, targets[movers]), cells.size - 1)
+        other = order[slot]
+        swap = ((sorted_cells[slot] == targets[movers]) & moving[other]
+                & (targets[other] == cells[movers]) & (other < movers))
+        moving[movers[swap]] = False
+
+        # Same final cell: stayers first, then the lowest index
+        final = np.where(moving, targets, cells)
+        order = np.lexsort((index, moving, final))
+        ordered = final[order]
+        losers = order[1:][ordered[1:] == ordered[:-1]]
+        losers = losers[moving[losers]]
+
+        # A loser stays put, so movers heading into its cell lose too
+        while losers.size:
+            moving[losers] = False
+            movers = np.flatnonzero(moving)
+            losers = movers[np.isin(targets[movers], cells[losers])]
+
+    new_rows = np.where(moving, target_rows, agent_rows)
+    new_cols = np.where(moving, target_cols, agent_cols)
+    return new_rows, new_cols, moving | ~wants
+
+
+class AgentSwarm:
+    """
+    Many agents in one world, stored as NumPy coordinate arrays.
+
+    step() moves every agent at once from an array of direction codes
+    (indices into agent.DIRECTIONS, -1 to stay) and checks bounds, walls
+    and agent collisions with array operations rather than per-agent
+    Python calls.
+
+    Attributes:
+        world (GridWorld): The grid world environment
+        rows (np.ndarray): Current row of each agent
+        cols (np.ndarray): Current column of each agent
+        collide (bool): Whether agents block each other
+    """
+
+    def __init__(self, world, positions, collide=True):
+        """
+        Initialize a swarm.
+
+        Args:
+            world (GridWorld): World with an occupancy buffer
+            positions: Position objects, or an ``(n, 2)`` array of
+                (row, col) pairs
+            collide (bool): Agents may not share or swap cells
+                (default: True)
+        """
+        self.world = world
+        self.collide = collide
+        if hasattr(positions, "shape"):
+            coords = np.asarray(positions, dtype=np.int64).reshape(-1, 2)
+        else:
+            coords = np.array([(p.row, p.col) for p in positions], dtype=np.int64).reshape(-1, 2)
+        self._initial = coords.copy()
+        self.rows = coords[:, 0].copy()
+        self.cols = coords[:, 1].copy()
+
+    def __len__(self):
+        """
+        Number of agents.
+
+        Returns:
+            int: Swarm size
+        """
+        return self.rows.size
+
+    @property
+    def positions(self):
+        """
+        Current positions as an ``(n, 2)`` array of (row, col).
+
+        Returns:
+            np.ndarray: Copy of the agents' coordinates
+        """
+        return np.stack((self.rows, self.cols), axis=1)
+
+    def step(self, directions):
+        """
+        Move every agent one step.
+
+        Args:
+            directions: Array of direction codes, one per agent; indices
+                into agent.DIRECTIONS, -1 to stay
+
+        Returns:
+            np.ndarray: Boolean mask, True where the move succeeded (or
+                the agent chose to stay), False where it was blocked
+        """
+        world = self.world
+        occupancy = np.frombuffer(world.occupancy(), dtype=np.uint8)
+        self.rows, self.cols, success = move_agents(
+            occupancy, world.rows, world.cols, self.rows, self.cols,
+            directions, self.collide)
+        return success
+
+    def reset(self):
+        """Return every agent to its initial position."""
+        self.rows = self._initial[:, 0].copy()
+        self.cols = self._initial[:, 1].copy()
@@ -6,6 +6,7 @@ sys.path.append('..')
 from position import Position
 from grid_world import GridWorld
 from agent import Agent
+from dstar_lite import DStarLite
 
 
 class TestAgent(unittest.TestCase):
@@ -107,6 +108,25 @@ class TestAgent(unittest.TestCase):
         self.agent.reset(new_pos)
         self.assertEqual(self.agent.at, new_pos)
 
+    def test_advance_without_planner(self):
+        """Test that advance does nothing without a planner."""
+        self.assertIsNone(self.agent.next_step())
+        self.assertFalse(self.agent.advance())
+
+    def test_follow_planner_to_goal(self):
+        """Test agent reaches the goal following a replanning planner."""
+        planner = DStarLite(self.world)
+        self.agent.follow(planner)
+
+        self.agent.advance()
+        self.world.place_wall(Position(2, 2))
+        for _ in range(20):
+            if not self.agent.advance():
+                break
+
+        self.assertEqual(self.agent.at, self.world.goal)
+        planner.close()
+
 
 if __name__ == "__main__":
     unittest.main()
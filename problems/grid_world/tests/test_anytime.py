@@ -0,0 +1,128 @@
+"""Unit tests for AnytimeSearch class."""
+
+import time
+import unittest
+import sys
+sys.path.append('..')
+from position import Position
+from grid_world import GridWorld
+from path import Pathfinder
+from generators import random_fill
+from anytime import AnytimeSearch
+
+
+class TestAnytimeSearch(unittest.TestCase):
+    """Test cases for AnytimeSearch class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.world = random_fill(40, 40, density=0.2, seed=3)
+
+    def test_unlimited_run_matches_astar(self):
+        """Test a run without budget returns A*'s path."""
+        result = AnytimeSearch(self.world).run()
+        expected = Pathfinder(self.world, algorithm="astar").find_path(
+            self.world.start, self.world.goal)
+
+        self.assertTrue(result.complete)
+        self.assertEqual(result.path, expected)
+
+    def test_expansion_budget_gives_partial_path(self):
+        """Test a small budget returns an incomplete path from the start."""
+        search = AnytimeSearch(self.world)
+        result = search.run(max_expansions=10)
+
+        self.assertFalse(result.complete)
+        self.assertEqual(result.nodes_expanded, 10)
+        self.assertEqual(result.path[0], self.world.start)
+        self.assertNotEqual(result.path[-1], self.world.goal)
+        for a, b in zip(result.path, result.path[1:]):
+            self.assertIn(b, a.neighbors_4())
+
+    def test_resume_continues_search(self):
+        """Test slices add up to the expansions of one full run."""
+        full = AnytimeSearch(self.world).run()
+        search = AnytimeSearch(self.world)
+        result = search.run(max_expansions=5)
+        while not result.complete:
+            result = search.run(max_expansions=5)
+
+        self.assertEqual(result.path, full.path)
+        self.assertEqual(search.total_expanded, full.total_expanded)
+
+    def test_partial_path_gets_closer(self):
+        """Test later slices end no farther from the goal."""
+        search = AnytimeSearch(self.world)
+        goal = self.world.goal
+        distances = []
+        for _ in range(5):
+            end = search.run(max_expansions=20).path[-1]
+            distances.append(abs(end.row - goal.row) + abs(end.col - goal.col))
+        self.assertEqual(distances, sorted(distances, reverse=True))
+
+    def test_deadline_in_past_stops_early(self):
+        """Test an expired deadline stops after at most one clock check."""
+        world = GridWorld(rows=200, cols=200)
+        result = AnytimeSearch(world).run(deadline=time.perf_counter())
+
+        self.assertFalse(result.complete)
+        self.assertLessEqual(result.nodes_expanded, 64)
+
+    def test_unreachable_goal_completes_with_none(self):
+        """Test an enclosed goal finishes with no path."""
+        world = GridWorld(rows=5, cols=5, walls={Position(3, 4), Position(4, 3)})
+        result = AnytimeSearch(world).run()
+
+        self.assertTrue(result.complete)
+        self.assertIsNone(result.path)
+
+    def test_wall_goal_completes_with_none(self):
+        """Test a goal on a wall is answered without expanding."""
+        world = GridWorld(rows=5, cols=5, walls={Position(4, 4)})
+        result = AnytimeSearch(world).run()
+
+        self.assertTrue(result.complete)
+        self.assertIsNone(result.path)
+        self.assertEqual(result.nodes_expanded, 0)
+
+    def test_world_change_restarts_search(self):
+        """Test a wall placed between runs is respected."""
+        world = GridWorld(rows=5, cols=5)
+        search = AnytimeSearch(world)
+        search.run(max_expansions=3)
+        for col in range(4):
+            world.place_wall(Position(2, col))
+        result = search.run()
+
+        self.assertTrue(result.complete)
+        self.assertNotIn(Position(2, 0), result.path)
+        self.assertEqual(len(result.path), 9)
+
+    def test_restarts_match_fresh_searches(self):
+        """Test restarted searches agree with Pathfinder after each change."""
+        for epsilon in (1.0, 1.5):
+            world = random_fill(30, 30, density=0.2, seed=5)
+            search = AnytimeSearch(world, epsilon=epsilon)
+            algorithm = "astar" if epsilon == 1.0 else "weighted_astar"
+            for step in range(6):
+                search.run(max_expansions=40)
+                world.remove_wall(Position(step * 5, 10))
+                world.place_wall(Position(step * 5 + 2, 3))
+                result = search.run()
+
+                finder = Pathfinder(world, algorithm=algorithm, epsilon=epsilon)
+                self.assertEqual(result.path, finder.find_path(world.start, world.goal))
+                self.assertEqual(result.total_expanded, finder.nodes_expanded)
+
+    def test_finished_search_is_returned_again(self):
+        """Test running a finished search expands nothing more."""
+        search = AnytimeSearch(self.world)
+        first = search.run()
+        second = search.run()
+
+        self.assertEqual(second.nodes_expanded, 0)
+        self.assertEqual(second.path, first.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Unit tests for the benchmark suite."""
+
+import json
+import os
+import tempfile
+import unittest
+import sys
+sys.path.append('..')
+from benchmark import ENGINES, compare_reports, main, make_report, run_suite
+
+
+class TestBenchmark(unittest.TestCase):
+    """Test cases for the benchmark suite."""
+
+    def test_run_suite_records_every_engine(self):
+        """Test each engine reports time, expansions, length and memory."""
+        results = run_suite([12], maps=["rooms"], repeat=1)
+        self.assertEqual([r["engine"] for r in results], list(ENGINES))
+        lengths = {r["path_length"] for r in results if r["engine"] != "weighted_astar"}
+        self.assertEqual(len(lengths), 1)
+        for result in results:
+            self.assertGreater(result["seconds"], 0)
+            self.assertGreater(result["peak_bytes"], 0)
+
+    def test_compare_reports(self):
+        """Test slowdowns and changed path lengths are reported."""
+        old = make_report([{"map": "maze", "size": 10, "engine": "bfs", "seconds": 1.0,
+                            "nodes_expanded": 5, "path_length": 9, "peak_bytes": 1}])
+        same = json.loads(json.dumps(old))
+        self.assertEqual(compare_reports(old, same), [])
+
+        slower = json.loads(json.dumps(old))
+        slower["results"][0]["seconds"] = 2.0
+        slower["results"][0]["path_length"] = 11
+        self.assertEqual(len(compare_reports(old, slower, threshold=1.5)), 2)
+
+    def test_command_line(self):
+        """Test the CLI writes a report and compares against it."""
+        with tempfile.TemporaryDirectory() as tmp:
+            report = os.path.join(tmp, "report.json")
+            argv = ["--sizes", "8", "--maps", "open", "--engines", "bfs", "astar",
+                    "--repeat", "1", "--output", report]
+            self.assertEqual(main(argv), 0)
+            with open(report) as f:
+                self.assertEqual(len(json.load(f)["results"]), 2)
+            self.assertEqual(main(argv + ["--compare", report, "--threshold", "1000"]), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,12 @@
 """Unit tests for Pathfinder class."""
 
+import random
 import unittest
 import sys
 sys.path.append('..')
 from position import Position
 from grid_world import GridWorld
-from path import Pathfinder
+from path import ALGORITHMS, Pathfinder, JumpPointSearch
 
 
 class TestPathfinder(unittest.TestCase):
@@ -117,6 +118,389 @@ class TestPathfinder(unittest.TestCase):
                 (row_diff == 0 and col_diff == 1)
             )
 
+    def test_cell_search_matches_position_search(self):
+        """Test that the cell-id BFS matches the Position-based BFS."""
+        for pos in [Position(1, 1), Position(1, 2), Position(3, 1), Position(2, 3)]:
+            self.world.place_wall(pos)
+        start = Position(0, 0)
+        goal = Position(4, 3)
+
+        path = self.pathfinder.find_path(start, goal)
+        expanded = self.pathfinder.nodes_expanded
+        generic = self.pathfinder._find_path_generic(start, goal)
+
+        self.assertEqual(path, generic)
+        self.assertEqual(expanded, self.pathfinder.nodes_expanded)
+
+    def test_find_path_compact_world(self):
+        """Test pathfinding on a world with the compact wall backend."""
+        world = GridWorld.from_ascii("""
+            S.#..
+            .##..
+            .....
+        """)
+        path = Pathfinder(world).find_path(Position(0, 0), Position(0, 3))
+
+        self.assertIsNotNone(path)
+        self.assertEqual(len(path), 8)
+        for pos in path:
+            self.assertTrue(world.passable(pos))
+
+    def test_astar_matches_bfs_length(self):
+        """Test that A* and bidirectional BFS find shortest paths on random maps."""
+        rng = random.Random(7)
+        for _ in range(20):
+            world = GridWorld(rows=12, cols=12)
+            for _ in range(40):
+                world.place_wall(Position(rng.randrange(12), rng.randrange(12)))
+            world.remove_wall(world.start)
+
+            bfs_path = Pathfinder(world).find_path(world.start, world.goal)
+            for algorithm in ("astar", "bidirectional"):
+                path = Pathfinder(world, algorithm=algorithm).find_path(world.start, world.goal)
+                if bfs_path is None:
+                    self.assertIsNone(path)
+                else:
+                    self.assertEqual(len(path), len(bfs_path))
+                    self.assertEqual(path[0], world.start)
+                    self.assertEqual(path[-1], world.goal)
+
+    def test_astar_expands_fewer_nodes(self):
+        """Test that A* expands fewer nodes than BFS on an open grid."""
+        world = GridWorld(rows=20, cols=20)
+        start = Position(10, 2)
+        goal = Position(10, 17)
+
+        bfs = Pathfinder(world)
+        astar = Pathfinder(world, algorithm="astar")
+        bfs.find_path(start, goal)
+        astar.find_path(start, goal)
+
+        self.assertLess(astar.nodes_expanded, bfs.nodes_expanded)
+
+    def test_bidirectional_expands_fewer_nodes(self):
+        """Test that bidirectional BFS expands fewer nodes than BFS."""
+        world = GridWorld(rows=30, cols=30)
+        start = Position(15, 5)
+        goal = Position(15, 24)
+
+        bfs = Pathfinder(world)
+        bidirectional = Pathfinder(world, algorithm="bidirectional")
+        path = bidirectional.find_path(start, goal)
+        bfs.find_path(start, goal)
+
+        self.assertEqual(len(path), 20)
+        self.assertLess(bidirectional.nodes_expanded, bfs.nodes_expanded)
+
+    def test_bidirectional_edge_cases(self):
+        """Test bidirectional BFS with start == goal and an unreachable goal."""
+        pathfinder = Pathfinder(self.world, algorithm="bidirectional")
+        self.assertEqual(pathfinder.find_path(Position(2, 2), Position(2, 2)), [Position(2, 2)])
+
+        for pos in [Position(1, 2), Position(3, 2), Position(2, 1), Position(2, 3)]:
+            self.world.place_wall(pos)
+        self.assertIsNone(pathfinder.find_path(Position(0, 0), Position(2, 2)))
+
+    def test_weighted_astar_bounded_suboptimality(self):
+        """Test weighted A* path length stays within epsilon of optimal."""
+        self.world.place_wall(Position(1, 1))
+        self.world.place_wall(Position(1, 2))
+        self.world.place_wall(Position(1, 3))
+        pathfinder = Pathfinder(self.world, algorithm="weighted_astar", epsilon=2.0)
+
+        path = pathfinder.find_path(Position(0, 2), Position(2, 2))
+        optimal = self.pathfinder.find_path(Position(0, 2), Position(2, 2))
+
+        self.assertIsNotNone(path)
+        self.assertLessEqual(len(path) - 1, 2.0 * (len(optimal) - 1))
+
+    def test_cache_hits_and_misses(self):
+        """Test that repeated queries are served from the cache."""
+        pathfinder = Pathfinder(self.world, cache_size=4)
+        first = pathfinder.find_path(Position(0, 0), Position(4, 4))
+        second = pathfinder.find_path(Position(0, 0), Position(4, 4))
+
+        self.assertEqual(first, second)
+        self.assertEqual(pathfinder.cache_hits, 1)
+        self.assertEqual(pathfinder.cache_misses, 1)
+        self.assertEqual(pathfinder.nodes_expanded, 0)
+
+    def test_cache_invalidated_by_wall_change(self):
+        """Test that placing a wall invalidates cached paths."""
+        pathfinder = Pathfinder(self.world, cache_size=4)
+        path = pathfinder.find_path(Position(0, 0), Position(0, 4))
+        self.world.place_wall(Position(0, 2))
+        rerouted = pathfinder.find_path(Position(0, 0), Position(0, 4))
+
+        self.assertEqual(pathfinder.cache_misses, 2)
+        self.assertNotIn(Position(0, 2), rerouted)
+        self.assertGreater(len(rerouted), len(path))
+
+    def test_cache_is_bounded(self):
+        """Test that the least recently used entry is evicted."""
+        pathfinder = Pathfinder(self.world, cache_size=2)
+        pathfinder.find_path(Position(0, 0), Position(1, 1))
+        pathfinder.find_path(Position(0, 0), Position(2, 2))
+        pathfinder.find_path(Position(0, 0), Position(1, 1))
+        pathfinder.find_path(Position(0, 0), Position(3, 3))
+        pathfinder.find_path(Position(0, 0), Position(1, 1))
+        pathfinder.find_path(Position(0, 0), Position(2, 2))
+
+        self.assertEqual(pathfinder.cache_hits, 2)
+        self.assertEqual(pathfinder.cache_misses, 4)
+
+    def test_find_paths_serial(self):
+        """Test batch queries return paths and expansions in input order."""
+        self.world.place_wall(Position(1, 1))
+        queries = [(Position(0, 0), Position(4, 4)),
+                   (Position(2, 2), Position(2, 2)),
+                   (Position(0, 0), Position(9, 9))]
+
+        results = self.pathfinder.find_paths(queries, workers=1)
+
+        for (start, goal), (path, expanded) in zip(queries, results):
+            self.assertEqual(path, self.pathfinder.find_path(start, goal))
+            self.assertEqual(expanded, self.pathfinder.nodes_expanded)
+
+    def test_find_paths_process_pool(self):
+        """Test batch queries on worker processes match serial results."""
+        queries = [(Position(r, 0), Position(4 - r, 4)) for r in range(5)] * 2
+        serial = self.pathfinder.find_paths(queries, workers=1)
+        parallel = self.pathfinder.find_paths(queries, workers=2, chunksize=3)
+
+        self.assertEqual(parallel, serial)
+
+    def test_dijkstra_avoids_expensive_terrain(self):
+        """Test Dijkstra detours around costly cells and reports the cost."""
+        for row in range(4):
+            self.world.set_cost(Position(row, 2), 20)
+        pathfinder = Pathfinder(self.world, algorithm="dijkstra")
+
+        path = pathfinder.find_path(Position(0, 0), Position(0, 4))
+        self.assertEqual(len(path), 13)
+        self.assertEqual(pathfinder.path_cost, 12)
+        self.assertIn(Position(4, 2), path)
+
+        # BFS ignores costs and goes straight through
+        self.pathfinder.find_path(Position(0, 0), Position(0, 4))
+        self.assertEqual(self.pathfinder.path_cost, 23)
+
+    def test_dijkstra_matches_heap_dijkstra(self):
+        """Test the bucket queue finds the same costs as a heap Dijkstra."""
+        import heapq
+        rng = random.Random(7)
+        for _ in range(30):
+            world = GridWorld(8, 9)
+            for row in range(8):
+                for col in range(9):
+                    if rng.random() < 0.2:
+                        world.place_wall(Position(row, col))
+                    else:
+                        world.set_cost(Position(row, col), rng.choice((1, 1, 3, 200, 255)))
+            start, goal = Position(0, 0), Position(7, 8)
+            world.remove_wall(start)
+            world.remove_wall(goal)
+
+            dist = {start: 0}
+            heap = [(0, 0, 0)]
+            while heap:
+                d, row, col = heapq.heappop(heap)
+                if d > dist[Position(row, col)]:
+                    continue
+                for nxt in Position(row, col).neighbors_4():
+                    if world.in_bounds(nxt) and world.passable(nxt):
+                        nd = d + world.cost(nxt)
+                        if nd < dist.get(nxt, nd + 1):
+                            dist[nxt] = nd
+                            heapq.heappush(heap, (nd, nxt.row, nxt.col))
+
+            pathfinder = Pathfinder(world, algorithm="dijkstra")
+            path = pathfinder.find_path(start, goal)
+            if goal not in dist:
+                self.assertIsNone(path)
+                self.assertIsNone(pathfinder.path_cost)
+            else:
+                self.assertEqual(pathfinder.path_cost, dist[goal])
+                self.assertEqual(pathfinder.path_cost,
+                                 sum(world.cost(pos) for pos in path[1:]))
+
+    def test_dijkstra_without_costs_is_bfs(self):
+        """Test Dijkstra on a uniform world returns a shortest path."""
+        pathfinder = Pathfinder(self.world, algorithm="dijkstra", cache_size=2)
+        path = pathfinder.find_path(Position(0, 0), Position(4, 4))
+        self.assertEqual(len(path), 9)
+        self.assertEqual(pathfinder.path_cost, 8)
+        pathfinder.find_path(Position(0, 0), Position(4, 4))
+        self.assertEqual(pathfinder.path_cost, 8)
+
+    def test_reused_buffers_match_fresh_searches(self):
+        """Test one Pathfinder answers a query series like fresh ones do."""
+        rng = random.Random(11)
+        world = GridWorld(rows=12, cols=12, compact=True)
+        for algorithm in ALGORITHMS:
+            pathfinder = Pathfinder(world, algorithm=algorithm)
+            for _ in range(40):
+                if rng.random() < 0.5:
+                    world.place_wall(Position(rng.randrange(12), rng.randrange(12)))
+                else:
+                    world.remove_wall(Position(rng.randrange(12), rng.randrange(12)))
+                start = Position(rng.randrange(12), rng.randrange(12))
+                goal = Position(rng.randrange(12), rng.randrange(12))
+                fresh = Pathfinder(world, algorithm=algorithm)
+                self.assertEqual(pathfinder.find_path(start, goal), fresh.find_path(start, goal))
+                self.assertEqual(pathfinder.nodes_expanded, fresh.nodes_expanded)
+
+    def test_invalid_algorithm(self):
+        """Test that unknown algorithms and bad weights are rejected."""
+        with self.assertRaises(ValueError):
+            Pathfinder(self.world, algorithm="dfs")
+        with self.assertRaises(ValueError):
+            Pathfinder(self.world, algorithm="weighted_astar", epsilon=0.5)
+
+
+class TestFindNearest(unittest.TestCase):
+    """Test cases for Pathfinder.find_nearest."""
+
+    def setUp(self):
+        """Set up a random world and candidate goals."""
+        rng = random.Random(4)
+        walls = {Position(rng.randrange(30), rng.randrange(30)) for _ in range(200)}
+        self.world = GridWorld(rows=30, cols=30, walls=walls)
+        self.goals = [Position(rng.randrange(30), rng.randrange(30)) for _ in range(40)]
+        self.goals = [g for g in self.goals if self.world.passable(g)]
+        self.pathfinder = Pathfinder(self.world)
+
+    def shortest(self, source, goal):
+        """Length of the BFS path between two cells, or None."""
+        path = Pathfinder(self.world).find_path(source, goal)
+        return len(path) if path is not None else None
+
+    def test_matches_per_goal_search(self):
+        """Test the result is as close as the best single-goal search."""
+        source = Position(15, 15)
+        goal, path = self.pathfinder.find_nearest(source, self.goals)
+        lengths = [self.shortest(source, g) for g in self.goals]
+
+        self.assertIn(goal, self.goals)
+        self.assertEqual(path[0], source)
+        self.assertEqual(path[-1], goal)
+        self.assertEqual(len(path), min(n for n in lengths if n is not None))
+
+    def test_multiple_sources(self):
+        """Test the path starts at the source nearest to a goal."""
+        world = GridWorld(rows=1, cols=10)
+        goal, path = Pathfinder(world).find_nearest(
+            [Position(0, 0), Position(0, 8)], [Position(0, 5)])
+
+        self.assertEqual(goal, Position(0, 5))
+        self.assertEqual(path, [Position(0, 8), Position(0, 7), Position(0, 6), Position(0, 5)])
+
+    def test_predicate_goals(self):
+        """Test a predicate selects the same goal as the equivalent set."""
+        goal_set = set(self.goals)
+        by_set = self.pathfinder.find_nearest(Position(0, 0), goal_set)
+        by_predicate = self.pathfinder.find_nearest(Position(0, 0), goal_set.__contains__)
+        self.assertEqual(by_set, by_predicate)
+
+    def test_source_on_goal(self):
+        """Test a source that is a goal returns a one-cell path."""
+        goal, path = self.pathfinder.find_nearest(
+            [Position(1, 1), self.goals[0]], self.goals)
+        self.assertEqual(goal, self.goals[0])
+        self.assertEqual(path, [self.goals[0]])
+        self.assertEqual(self.pathfinder.path_cost, 0)
+
+    def test_no_reachable_goal(self):
+        """Test unreachable goals give (None, None)."""
+        world = GridWorld(rows=5, cols=5, walls={Position(3, 4), Position(4, 3)})
+        self.assertEqual(Pathfinder(world).find_nearest(Position(0, 0), [Position(4, 4)]),
+                         (None, None))
+
+    def test_profile_counts_all_sources(self):
+        """Test the frontier starts with every source."""
+        world = GridWorld(rows=5, cols=5)
+        pathfinder = Pathfinder(world, profile=True)
+        sources = [Position(0, c) for c in range(5)]
+        pathfinder.find_nearest(sources, [Position(4, 4)])
+        self.assertGreaterEqual(pathfinder._counters["max_frontier"], 5)
+
+    def test_generic_world_matches_compact(self):
+        """Test worlds without an occupancy buffer give the same answer."""
+        from chunked_world import ChunkedGridWorld
+        chunked = ChunkedGridWorld(rows=30, cols=30, walls=self.world.walls)
+        expected = self.pathfinder.find_nearest(Position(15, 15), self.goals)
+        self.assertEqual(Pathfinder(chunked).find_nearest(Position(15, 15), self.goals),
+                         expected)
+
+
+class TestJumpPointSearch(unittest.TestCase):
+    """Test cases for JumpPointSearch class."""
+
+    def random_world(self, rng, size=12, walls=40):
+        """Build a random world with an open start."""
+        world = GridWorld(rows=size, cols=size, compact=True)
+        for _ in range(walls):
+            world.place_wall(Position(rng.randrange(size), rng.randrange(size)))
+        world.remove_wall(world.start)
+        world.remove_wall(world.goal)
+        return world
+
+    def test_matches_bfs_length(self):
+        """Test that 4-connected JPS finds shortest paths."""
+        rng = random.Random(11)
+        for _ in range(30):
+            world = self.random_world(rng)
+            bfs_path = Pathfinder(world).find_path(world.start, world.goal)
+            jps_path = JumpPointSearch(world).find_path(world.start, world.goal)
+
+            if bfs_path is None:
+                self.assertIsNone(jps_path)
+                continue
+            self.assertEqual(len(jps_path), len(bfs_path))
+            for curr, next_pos in zip(jps_path, jps_path[1:]):
+                self.assertEqual(abs(curr.row - next_pos.row) + abs(curr.col - next_pos.col), 1)
+                self.assertTrue(world.passable(next_pos))
+
+    def test_jump_points_on_open_grid(self):
+        """Test that an open grid needs only a few jump points."""
+        world = GridWorld(rows=20, cols=20, compact=True)
+        jps = JumpPointSearch(world)
+        path = jps.find_path(Position(0, 0), Position(19, 19))
+
+        self.assertEqual(len(path), 39)
+        self.assertEqual(jps.jump_points[0], Position(0, 0))
+        self.assertEqual(jps.jump_points[-1], Position(19, 19))
+        self.assertLess(len(jps.jump_points), 5)
+        self.assertLess(jps.nodes_expanded, 20)
+
+    def test_diagonal_movement(self):
+        """Test 8-connected JPS moves diagonally without cutting corners."""
+        world = GridWorld.from_ascii("""
+            S....
+            .#...
+            ....G
+        """)
+        jps = JumpPointSearch(world, diagonal=True)
+        path = jps.find_path(world.start, world.goal)
+
+        self.assertEqual(path[0], world.start)
+        self.assertEqual(path[-1], world.goal)
+        self.assertEqual(len(path), 5)
+        for curr, next_pos in zip(path, path[1:]):
+            if curr.row != next_pos.row and curr.col != next_pos.col:
+                self.assertTrue(world.passable(Position(curr.row, next_pos.col)))
+                self.assertTrue(world.passable(Position(next_pos.row, curr.col)))
+
+    def test_no_path(self):
+        """Test that a walled-off goal returns None."""
+        world = GridWorld.from_ascii("""
+            S.#.
+            ..#.
+            ..#G
+        """)
+        self.assertIsNone(JumpPointSearch(world).find_path(world.start, world.goal))
+        self.assertIsNone(JumpPointSearch(world, diagonal=True).find_path(world.start, world.goal))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,122 @@
+"""Unit tests for ChunkedGridWorld class."""
+
+import unittest
+import sys
+sys.path.append('..')
+from position import Position
+from grid_world import GridWorld
+from chunked_world import ChunkedGridWorld, ChunkedOccupancy
+from path import Pathfinder
+from agent import Agent
+
+
+class TestChunkedOccupancy(unittest.TestCase):
+    """Test cases for ChunkedOccupancy class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.walls = ChunkedOccupancy(chunk_size=8)
+
+    def test_tiles_created_and_evicted(self):
+        """Test tiles appear on first wall and go when empty."""
+        self.walls.add(Position(1, 1))
+        self.walls.add(Position(2, 2))
+        self.walls.add(Position(100, -3))
+        self.assertEqual(len(self.walls.tiles), 2)
+        self.assertEqual(len(self.walls), 3)
+
+        self.walls.discard(Position(1, 1))
+        self.assertEqual(len(self.walls.tiles), 2)
+        self.walls.discard(Position(2, 2))
+        self.assertEqual(len(self.walls.tiles), 1)
+        self.walls.discard(Position(2, 2))
+        self.assertEqual(len(self.walls), 1)
+
+    def test_membership_and_iteration(self):
+        """Test negative coordinates and iteration over all walls."""
+        cells = {Position(-1, -1), Position(0, 7), Position(0, 8), Position(-9, 20)}
+        for pos in cells:
+            self.walls.add(pos)
+        for pos in cells:
+            self.assertIn(pos, self.walls)
+        self.assertNotIn(Position(0, 0), self.walls)
+        self.assertEqual(set(self.walls), cells)
+
+    def test_chunk_size_validation(self):
+        """Test chunk sizes must be positive multiples of 8."""
+        with self.assertRaises(ValueError):
+            ChunkedOccupancy(chunk_size=10)
+
+
+class TestChunkedGridWorld(unittest.TestCase):
+    """Test cases for ChunkedGridWorld class."""
+
+    def test_bounded_world(self):
+        """Test bounds, defaults and ignored out-of-bounds walls."""
+        world = ChunkedGridWorld(1000, 2000)
+        self.assertEqual(world.goal, Position(999, 1999))
+        self.assertTrue(world.in_bounds(Position(999, 1999)))
+        self.assertFalse(world.in_bounds(Position(1000, 0)))
+        world.place_wall(Position(-1, 0))
+        self.assertEqual(world.version, 0)
+        self.assertEqual(world.chunk_count, 0)
+
+    def test_unbounded_world(self):
+        """Test an unbounded world accepts any coordinates."""
+        world = ChunkedGridWorld()
+        far = Position(-10 ** 9, 10 ** 9)
+        self.assertTrue(world.in_bounds(far))
+        world.place_wall(far)
+        self.assertFalse(world.passable(far))
+        self.assertEqual(world.chunk_count, 1)
+
+    def test_wall_events(self):
+        """Test version and listeners follow real changes only."""
+        world = ChunkedGridWorld(100, 100)
+        events = []
+        world.subscribe(lambda pos, is_wall: events.append((pos, is_wall)))
+        world.place_wall(Position(5, 5))
+        world.place_wall(Position(5, 5))
+        world.remove_wall(Position(5, 5))
+        self.assertEqual(events, [(Position(5, 5), True), (Position(5, 5), False)])
+        self.assertEqual(world.version, 2)
+        self.assertEqual(world.chunk_count, 0)
+
+    def test_direct_wall_edits_are_tracked(self):
+        """Test editing walls directly bumps the version and busts the cache."""
+        world = ChunkedGridWorld(3, 3)
+        events = []
+        world.subscribe(lambda pos, is_wall: events.append((pos, is_wall)))
+        finder = Pathfinder(world, cache_size=4)
+        self.assertEqual(len(finder.find_path(Position(0, 0), Position(0, 2))), 3)
+
+        world.walls.add(Position(0, 1))
+        self.assertEqual(world.version, 1)
+        self.assertEqual(len(finder.find_path(Position(0, 0), Position(0, 2))), 5)
+        world.walls.discard(Position(0, 1))
+        self.assertEqual(events, [(Position(0, 1), True), (Position(0, 1), False)])
+        with self.assertRaises(AttributeError):
+            world.walls = ChunkedOccupancy()
+
+    def test_pathfinder_matches_grid_world(self):
+        """Test Pathfinder gives the same path length as on a GridWorld."""
+        walls = {Position(r, 3) for r in range(6)} | {Position(2, c) for c in range(5, 9)}
+        dense = GridWorld(8, 10, walls=set(walls))
+        sparse = ChunkedGridWorld(8, 10, walls=walls, chunk_size=8)
+        expected = Pathfinder(dense).find_path(dense.start, dense.goal)
+        path = Pathfinder(sparse).find_path(sparse.start, sparse.goal)
+        self.assertEqual(len(path), len(expected))
+        for pos in path:
+            self.assertTrue(sparse.passable(pos))
+
+    def test_agent_moves(self):
+        """Test Agent works unchanged on a chunked world."""
+        world = ChunkedGridWorld(walls={Position(0, 1)})
+        agent = Agent(world)
+        self.assertFalse(agent.step("right"))
+        self.assertTrue(agent.step("up"))
+        self.assertEqual(agent.at, Position(-1, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+"""Unit tests for CompactPath and PathFollower classes."""
+
+import unittest
+import sys
+sys.path.append('..')
+from position import Position
+from grid_world import GridWorld
+from agent import Agent
+from path import Pathfinder
+from generators import maze
+from compact_path import CompactPath, PathFollower, CHECKPOINT_EVERY
+
+
+class TestCompactPath(unittest.TestCase):
+    """Test cases for CompactPath class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.world = maze(61, 61, seed=2)
+        self.path = Pathfinder(self.world).find_path(self.world.start, self.world.goal)
+        self.compact = CompactPath.from_positions(self.path)
+
+    def test_round_trip(self):
+        """Test encoding then expanding gives the original path."""
+        self.assertGreater(len(self.path), CHECKPOINT_EVERY)
+        self.assertEqual(len(self.compact), len(self.path))
+        self.assertEqual(self.compact.to_list(), self.path)
+        self.assertEqual(self.compact, self.path)
+
+    def test_packs_four_moves_per_byte(self):
+        """Test storage is two bits per move."""
+        self.assertEqual(len(self.compact.data), (len(self.path) - 1 + 3) // 4)
+
+    def test_indexing_matches_list(self):
+        """Test every index, negative indices and slices."""
+        for i in range(len(self.path)):
+            self.assertEqual(self.compact[i], self.path[i])
+        self.assertEqual(self.compact[-1], self.path[-1])
+        self.assertEqual(self.compact.end, self.world.goal)
+        self.assertEqual(self.compact[5:300:7], self.path[5:300:7])
+        with self.assertRaises(IndexError):
+            self.compact[len(self.path)]
+
+    def test_from_cells_matches_from_positions(self):
+        """Test encoding cell ids gives the same path."""
+        cols = self.world.cols
+        cells = [pos.row * cols + pos.col for pos in self.path]
+        self.assertEqual(CompactPath.from_cells(cells, cols), self.compact)
+
+    def test_single_cell_path(self):
+        """Test a path with no moves."""
+        path = CompactPath(Position(2, 3))
+        self.assertEqual(len(path), 1)
+        self.assertEqual(list(path), [Position(2, 3)])
+        self.assertEqual(list(path.directions()), [])
+
+    def test_directions(self):
+        """Test moves decode to Agent.step direction names."""
+        path = CompactPath.from_positions(
+            [Position(1, 1), Position(0, 1), Position(0, 2), Position(1, 2), Position(1, 1)])
+        self.assertEqual(list(path.directions()), ["up", "right", "down", "left"])
+
+    def test_rejects_non_adjacent(self):
+        """Test gaps and row wraps are rejected."""
+        with self.assertRaises(ValueError):
+            CompactPath.from_positions([Position(0, 0), Position(0, 2)])
+        with self.assertRaises(ValueError):
+            CompactPath.from_cells([4, 5], 5)
+
+    def test_single_column_cells(self):
+        """Test a one-column grid encodes steps as vertical moves."""
+        path = CompactPath.from_cells([0, 1, 2], 1)
+        self.assertEqual(path.to_list(), [Position(0, 0), Position(1, 0), Position(2, 0)])
+
+
+class TestFindCompactPath(unittest.TestCase):
+    """Test cases for Pathfinder.find_compact_path."""
+
+    def test_matches_find_path(self):
+        """Test each algorithm returns the same cells and cost."""
+        world = maze(41, 41, seed=5)
+        for algorithm in ("bfs", "astar", "bidirectional"):
+            pathfinder = Pathfinder(world, algorithm=algorithm)
+            path = pathfinder.find_path(world.start, world.goal)
+            cost = pathfinder.path_cost
+            compact = pathfinder.find_compact_path(world.start, world.goal)
+            self.assertIsInstance(compact, CompactPath)
+            self.assertEqual(compact, path)
+            self.assertEqual(pathfinder.path_cost, cost)
+            self.assertEqual(pathfinder.last_stats.path_length, len(path))
+
+    def test_no_path(self):
+        """Test an unreachable goal returns None."""
+        world = GridWorld(rows=3, cols=3, walls={Position(1, 2), Position(2, 1)})
+        self.assertIsNone(Pathfinder(world).find_compact_path(world.start, world.goal))
+
+    def test_cached(self):
+        """Test compact and list results are cached separately."""
+        world = GridWorld(rows=5, cols=5)
+        pathfinder = Pathfinder(world, cache_size=4)
+        first = pathfinder.find_compact_path(world.start, world.goal)
+        second = pathfinder.find_compact_path(world.start, world.goal)
+        listed = pathfinder.find_path(world.start, world.goal)
+
+        self.assertIs(second, first)
+        self.assertIsInstance(listed, list)
+        self.assertEqual(pathfinder.cache_hits, 1)
+
+
+class TestPathFollower(unittest.TestCase):
+    """Test cases for PathFollower class."""
+
+    def test_agent_walks_compact_path(self):
+        """Test an agent following a CompactPath reaches the goal."""
+        world = maze(21, 21, seed=1)
+        path = Pathfinder(world).find_compact_path(world.start, world.goal)
+        agent = Agent(world, planner=PathFollower(path))
+        visited = [agent.at]
+        while agent.advance():
+            visited.append(agent.at)
+        self.assertEqual(visited, path.to_list())
+
+    def test_blocked_step_is_offered_again(self):
+        """Test a failed move does not skip ahead along the path."""
+        world = GridWorld(rows=1, cols=3)
+        path = CompactPath.from_positions([Position(0, 0), Position(0, 1), Position(0, 2)])
+        agent = Agent(world, planner=PathFollower(path))
+        world.place_wall(Position(0, 1))
+
+        self.assertFalse(agent.advance())
+        self.assertFalse(agent.advance())
+        world.remove_wall(Position(0, 1))
+        self.assertTrue(agent.advance())
+        self.assertEqual(agent.at, Position(0, 1))
+
+    def test_off_path_returns_none(self):
+        """Test positions not on the path get no step."""
+        follower = PathFollower([Position(0, 0), Position(0, 1)])
+        self.assertIsNone(follower.next_step(Position(3, 3)))
+
+
+if __name__ == '__main__':
+    unittest.main()
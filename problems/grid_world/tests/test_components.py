@@ -0,0 +1,95 @@
+"""Unit tests for ComponentIndex class."""
+
+import unittest
+import sys
+sys.path.append('..')
+from position import Position
+from grid_world import GridWorld
+from path import Pathfinder
+
+
+class TestComponentIndex(unittest.TestCase):
+    """Test cases for ComponentIndex class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.world = GridWorld.from_ascii("""
+            S.#..
+            ..#..
+            .....
+            ..#..
+            ..#.G
+        """)
+        self.index = self.world.build_component_index()
+
+    def tearDown(self):
+        """Unsubscribe the index from the world."""
+        self.index.close()
+
+    def test_initial_labelling(self):
+        """Test open cells start in one component and walls in none."""
+        self.assertEqual(self.index.components, 1)
+        self.assertTrue(self.index.connected(Position(0, 0), Position(4, 4)))
+        self.assertIsNone(self.index.component(Position(0, 2)))
+        self.assertIsNone(self.index.component(Position(9, 9)))
+
+    def test_place_wall_splits(self):
+        """Test closing the only gap splits the world in two."""
+        self.world.place_wall(Position(2, 2))
+
+        self.assertEqual(self.index.components, 2)
+        self.assertFalse(self.index.connected(Position(0, 0), Position(4, 4)))
+        self.assertTrue(self.index.connected(Position(0, 0), Position(4, 1)))
+        self.assertTrue(self.index.connected(Position(0, 3), Position(4, 4)))
+
+    def test_place_wall_without_split(self):
+        """Test a wall that leaves a detour keeps one component."""
+        self.world.place_wall(Position(2, 0))
+        self.assertEqual(self.index.components, 1)
+        self.assertTrue(self.index.connected(Position(1, 0), Position(3, 0)))
+
+    def test_remove_wall_joins(self):
+        """Test reopening a gap merges the components again."""
+        self.world.place_wall(Position(2, 2))
+        self.world.remove_wall(Position(2, 2))
+
+        self.assertEqual(self.index.components, 1)
+        self.assertTrue(self.index.connected(Position(0, 0), Position(4, 4)))
+
+    def test_isolated_cell(self):
+        """Test opening a cell surrounded by walls makes a new component."""
+        world = GridWorld.from_ascii("""
+            ###
+            ###
+            ###
+        """)
+        index = world.build_component_index()
+        world.remove_wall(Position(1, 1))
+        self.assertEqual(index.components, 1)
+        world.place_wall(Position(1, 1))
+        self.assertEqual(index.components, 0)
+        index.close()
+
+    def test_pathfinder_rejects_without_search(self):
+        """Test queries across components return None with no expansions."""
+        self.world.place_wall(Position(2, 2))
+        pathfinder = Pathfinder(self.world)
+
+        self.assertIsNone(pathfinder.find_path(Position(0, 0), Position(4, 4)))
+        self.assertEqual(pathfinder.nodes_expanded, 0)
+        self.assertIsNotNone(pathfinder.find_path(Position(0, 0), Position(4, 1)))
+
+    def test_replaced_walls_are_relabelled(self):
+        """Test assigning a new wall store updates the index."""
+        self.world.place_wall(Position(2, 2))
+        self.world.walls = set()
+
+        self.assertEqual(self.index.components, 1)
+        self.assertIsNotNone(Pathfinder(self.world).find_path(Position(0, 0), Position(4, 4)))
+
+        self.world.walls = {Position(r, 2) for r in range(5)}
+        self.assertEqual(self.index.components, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
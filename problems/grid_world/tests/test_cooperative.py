@@ -0,0 +1,215 @@
+"""Unit tests for ReservationTable and CooperativePlanner classes."""
+
+import random
+import unittest
+import sys
+sys.path.append('..')
+from position import Position
+from grid_world import GridWorld
+from agent import Agent
+from generators import random_fill, maze
+from path import Pathfinder
+from cooperative import CooperativePlanner, ReservationTable, ReverseSearch
+
+
+def assert_collision_free(test, before, after):
+    """Check no two agents share a cell or swap cells in one step."""
+    test.assertEqual(len(set(after)), len(after))
+    moves = {(a, b) for a, b in zip(before, after) if a != b}
+    for a, b in moves:
+        test.assertNotIn((b, a), moves)
+
+
+class TestReservationTable(unittest.TestCase):
+    """Test cases for ReservationTable class."""
+
+    def test_reserve_marks_vertices_and_reverse_edges(self):
+        """Test a reserved path claims its cells and forbids swapping."""
+        table = ReservationTable(cells=9, cols=3)
+        table.reserve([0, 1, 1, 4])
+
+        self.assertFalse(table.is_free(0, 0))
+        self.assertFalse(table.is_free(1, 2))
+        self.assertTrue(table.is_free(1, 0))
+        self.assertEqual(len(table), 4)
+        # Moving 1 -> 0 (left) between t=0 and t=1 would swap with 0 -> 1
+        self.assertIn((0 * 9 + 1) * 4 + 2, table.edges)
+        # Moving 4 -> 1 (up) between t=2 and t=3 would swap with 1 -> 4
+        self.assertIn((2 * 9 + 4) * 4 + 0, table.edges)
+
+    def test_clear(self):
+        """Test clear drops every reservation."""
+        table = ReservationTable(cells=9, cols=3)
+        table.reserve([0, 1])
+        table.clear()
+        self.assertEqual(len(table), 0)
+        self.assertFalse(table.edges)
+
+
+class TestReverseSearch(unittest.TestCase):
+    """Test cases for ReverseSearch class."""
+
+    def test_distances_match_bfs(self):
+        """Test looked-up distances equal shortest path lengths."""
+        world = random_fill(20, 20, density=0.25, seed=4)
+        occupancy = world.occupancy()
+        goal = world.goal.row * 20 + world.goal.col
+        search = ReverseSearch(occupancy, 20, 20, goal, origin=0)
+        finder = Pathfinder(world)
+        for cell in range(0, 400, 7):
+            path = None if occupancy[cell] else finder.find_path(Position(*divmod(cell, 20)),
+                                                                 world.goal)
+            self.assertEqual(search[cell], len(path) - 1 if path else -1)
+
+    def test_lookup_expands_lazily(self):
+        """Test a lookup near the goal expands only part of the grid."""
+        world = GridWorld(rows=30, cols=30)
+        search = ReverseSearch(world.occupancy(), 30, 30, goal=0, origin=2)
+        self.assertEqual(search[2], 2)
+        self.assertLess(search.nodes_expanded, 10)
+
+
+class TestCooperativePlanner(unittest.TestCase):
+    """Test cases for CooperativePlanner class."""
+
+    def test_head_on_agents_pass(self):
+        """Test agents heading at each other in a two-lane corridor pass."""
+        world = GridWorld(rows=2, cols=5)
+        planner = CooperativePlanner(world, [Position(0, 0), Position(0, 4)],
+                                     [Position(0, 4), Position(0, 0)], horizon=16)
+        positions = planner.positions
+        while not planner.done and planner.time < 30:
+            after = planner.step()
+            assert_collision_free(self, positions, after)
+            positions = after
+
+        self.assertTrue(planner.done)
+        self.assertGreater(planner.conflicts, 0)
+        self.assertEqual(planner.failures, 0)
+        self.assertEqual(planner.time, 6)
+
+    def test_boxed_in_agent_counts_failure(self):
+        """Test an agent with no collision-free window waits and is counted."""
+        world = GridWorld.from_ascii("""
+            .....
+            ##.##
+        """)
+        planner = CooperativePlanner(world, [Position(0, 0), Position(0, 4)],
+                                     [Position(0, 4), Position(0, 0)], horizon=16)
+        plans = planner.plan()
+
+        self.assertEqual(planner.failures, 1)
+        self.assertEqual(set(plans[1]), {Position(0, 4)})
+
+    def test_lower_priority_agent_waits(self):
+        """Test crossing agents do not meet; the first keeps its shortest path."""
+        world = GridWorld(rows=3, cols=3)
+        planner = CooperativePlanner(world, [Position(1, 0), Position(0, 1)],
+                                     [Position(1, 2), Position(2, 1)], horizon=8)
+        plans = planner.plan()
+
+        self.assertEqual(plans[0][:3], [Position(1, 0), Position(1, 1), Position(1, 2)])
+        for t in range(len(plans[0])):
+            self.assertNotEqual(plans[0][t], plans[1][t])
+        planner.run()
+        self.assertEqual(planner.time, 3)
+
+    def test_first_agent_matches_single_agent_search(self):
+        """Test the highest-priority agent is unaffected by the others."""
+        world = random_fill(20, 20, density=0.2, seed=3)
+        start, goal = world.start, world.goal
+        shortest = Pathfinder(world).find_path(start, goal)
+        planner = CooperativePlanner(world, [start, Position(10, 10)], [goal, Position(0, 19)],
+                                     horizon=60, heuristic="distance")
+        plan = planner.plan()[0]
+        self.assertEqual(plan.index(goal), len(shortest) - 1)
+
+    def test_many_agents_arrive_without_collisions(self):
+        """Test a crowd reaches distinct goals with no collisions."""
+        world = random_fill(24, 24, density=0.15, seed=8)
+        occupancy = world.occupancy()
+        cells = [c for c in range(24 * 24) if not occupancy[c]]
+        rng = random.Random(5)
+        starts = [Position(*divmod(c, 24)) for c in rng.sample(cells, 30)]
+        goals = [Position(*divmod(c, 24)) for c in rng.sample(cells, 30)]
+        planner = CooperativePlanner(world, starts, goals, horizon=16, heuristic="distance")
+        positions = planner.positions
+        while not planner.done and planner.time < 300:
+            after = planner.step()
+            assert_collision_free(self, positions, after)
+            positions = after
+
+        self.assertTrue(planner.done)
+        self.assertEqual(planner.replans, planner.windows * 30)
+
+    def test_lone_agent_solves_maze(self):
+        """Test the default heuristic leads one agent out of dead ends."""
+        world = maze(41, 41, seed=3)
+        shortest = Pathfinder(world).find_path(world.start, world.goal)
+        planner = CooperativePlanner(world, [world.start], [world.goal])
+        planner.run(max_steps=5000)
+
+        self.assertTrue(planner.done)
+        self.assertEqual(planner.time, len(shortest) - 1)
+
+    def test_parked_agent_steps_aside(self):
+        """Test an agent resting on its goal in a doorway lets others by."""
+        world = GridWorld.from_ascii("""
+            ...
+            #.#
+            ...
+        """)
+        planner = CooperativePlanner(world, [Position(1, 1), Position(0, 1)],
+                                     [Position(1, 1), Position(2, 1)], horizon=8)
+        planner.run(max_steps=20)
+        self.assertTrue(planner.done)
+
+    def test_goal_cache_is_bounded(self):
+        """Test at most cache_goals reverse searches are kept."""
+        world = GridWorld(rows=6, cols=6)
+        starts = [Position(0, c) for c in range(6)]
+        goals = [Position(5, c) for c in range(6)]
+        planner = CooperativePlanner(world, starts, goals, horizon=8, cache_goals=2)
+        planner.run(max_steps=30)
+
+        self.assertTrue(planner.done)
+        self.assertLessEqual(len(planner._searches), 2)
+        self.assertGreater(planner.heuristic_expanded, 0)
+
+    def test_windows_follow_replan_interval(self):
+        """Test a new window is planned every replan_every steps."""
+        world = GridWorld(rows=1, cols=40)
+        planner = CooperativePlanner(world, [Position(0, 0)], [Position(0, 39)],
+                                     horizon=10, replan_every=4)
+        for _ in range(12):
+            planner.step()
+        self.assertEqual(planner.windows, 3)
+        self.assertEqual(planner.positions, [Position(0, 12)])
+
+    def test_updates_agents(self):
+        """Test Agent objects passed as starts are moved."""
+        world = GridWorld(rows=3, cols=3)
+        agent = Agent(world, Position(0, 0))
+        planner = CooperativePlanner(world, [agent], [Position(2, 2)])
+        planner.run()
+        self.assertEqual(agent.at, Position(2, 2))
+
+    def test_rejects_bad_input(self):
+        """Test shared starts, walls and mismatched lists are rejected."""
+        world = GridWorld(rows=3, cols=3, walls={Position(1, 1)})
+        with self.assertRaises(ValueError):
+            CooperativePlanner(world, [Position(0, 0), Position(0, 0)],
+                               [Position(2, 2), Position(2, 1)])
+        with self.assertRaises(ValueError):
+            CooperativePlanner(world, [Position(1, 1)], [Position(2, 2)])
+        with self.assertRaises(ValueError):
+            CooperativePlanner(world, [Position(0, 0)], [])
+        with self.assertRaises(ValueError):
+            CooperativePlanner(world, [Position(0, 0)], [Position(2, 2)], horizon=4,
+                               replan_every=5)
+        with self.assertRaises(ValueError):
+            CooperativePlanner(world, [Position(0, 0)], [Position(2, 2)], cache_goals=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
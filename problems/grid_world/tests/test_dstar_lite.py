@@ -0,0 +1,115 @@
+"""Unit tests for DStarLite class."""
+
+import random
+import unittest
+import sys
+sys.path.append('..')
+from position import Position
+from grid_world import GridWorld
+from path import Pathfinder
+from dstar_lite import DStarLite
+
+
+class TestDStarLite(unittest.TestCase):
+    """Test cases for DStarLite class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.world = GridWorld(rows=5, cols=5)
+        self.planner = DStarLite(self.world)
+
+    def tearDown(self):
+        """Unsubscribe the planner from the world."""
+        self.planner.close()
+
+    def test_initial_path_is_shortest(self):
+        """Test the first plan matches BFS length."""
+        path = self.planner.path()
+
+        self.assertEqual(path[0], self.world.start)
+        self.assertEqual(path[-1], self.world.goal)
+        self.assertEqual(len(path), 9)
+
+    def test_next_step_is_adjacent(self):
+        """Test next_step returns a neighbor of the current position."""
+        step = self.planner.next_step(Position(0, 0))
+        self.assertIn(step, Position(0, 0).neighbors_4())
+
+    def test_replans_around_new_wall(self):
+        """Test the plan avoids a wall placed after planning."""
+        for pos in [Position(3, 0), Position(3, 1), Position(3, 2), Position(3, 3)]:
+            self.world.place_wall(pos)
+
+        path = self.planner.path()
+        for pos in path:
+            self.assertTrue(self.world.passable(pos))
+        self.assertIn(Position(3, 4), path)
+
+    def test_unreachable_goal(self):
+        """Test that a walled-off goal yields no step."""
+        self.world.place_wall(Position(3, 4))
+        self.world.place_wall(Position(4, 3))
+
+        self.assertIsNone(self.planner.next_step(Position(0, 0)))
+        self.assertIsNone(self.planner.path())
+
+        self.world.remove_wall(Position(4, 3))
+        self.assertIsNotNone(self.planner.path())
+
+    def test_replaced_walls_are_seen(self):
+        """Test assigning a new wall store is repaired like single edits."""
+        self.world.place_wall(Position(3, 4))
+        self.world.place_wall(Position(4, 3))
+        self.assertIsNone(self.planner.path())
+
+        self.world.walls = set()
+        self.assertEqual(len(self.planner.path()), 9)
+
+        self.world.walls = {Position(3, c) for c in range(4)}
+        self.assertIn(Position(3, 4), self.planner.path())
+
+    def test_repair_is_local(self):
+        """Test that a far-away change costs far less than the first plan."""
+        world = GridWorld(rows=30, cols=30)
+        planner = DStarLite(world)
+        initial = planner.nodes_expanded
+
+        world.place_wall(Position(0, 29))
+        planner.path()
+
+        self.assertLess(planner.nodes_expanded, initial // 10)
+        planner.close()
+
+    def test_matches_bfs_under_random_changes(self):
+        """Test plans stay shortest while walls change along the way."""
+        rng = random.Random(3)
+        world = GridWorld(rows=10, cols=10)
+        planner = DStarLite(world)
+        pathfinder = Pathfinder(world)
+        pos = world.start
+
+        for _ in range(15):
+            for _ in range(3):
+                cell = Position(rng.randrange(10), rng.randrange(10))
+                if cell in (pos, world.goal):
+                    continue
+                if rng.random() < 0.6:
+                    world.place_wall(cell)
+                else:
+                    world.remove_wall(cell)
+
+            expected = pathfinder.find_path(pos, world.goal)
+            path = planner.path(pos)
+            if expected is None:
+                self.assertIsNone(path)
+                break
+            self.assertEqual(len(path), len(expected))
+            if len(path) == 1:
+                break
+            pos = path[1]
+
+        planner.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""Unit tests for distance and flow fields."""
+
+import unittest
+import sys
+sys.path.append('..')
+from position import Position
+from grid_world import GridWorld
+from agent import Agent
+from path import Pathfinder
+from fields import NO_DIRECTION
+
+
+class TestFlowField(unittest.TestCase):
+    """Test cases for GridWorld.distance_field and GridWorld.flow_field."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.world = GridWorld.from_ascii("""
+            S..#.
+            .#.#.
+            .#...
+            .##.#
+            ....G
+        """)
+
+    def test_distances_match_bfs(self):
+        """Test every distance equals the BFS path length to the goal."""
+        dist = self.world.distance_field()
+        pathfinder = Pathfinder(self.world)
+
+        for row in range(self.world.rows):
+            for col in range(self.world.cols):
+                pos = Position(row, col)
+                path = pathfinder.find_path(pos, self.world.goal)
+                if not self.world.passable(pos) or path is None:
+                    self.assertEqual(dist[row, col], -1)
+                else:
+                    self.assertEqual(dist[row, col], len(path) - 1)
+
+    def test_directions_lead_downhill(self):
+        """Test each direction points to a cell one step closer."""
+        field = self.world.flow_field()
+
+        self.assertEqual(field.directions[4, 4], NO_DIRECTION)
+        self.assertIsNone(field.next_step(self.world.goal))
+        for row in range(self.world.rows):
+            for col in range(self.world.cols):
+                pos = Position(row, col)
+                step = field.next_step(pos)
+                if step is not None:
+                    self.assertEqual(field.distance(step), field.distance(pos) - 1)
+
+    def test_unreachable_cells(self):
+        """Test walled-off cells have no distance or direction."""
+        self.world.place_wall(Position(1, 4))
+        field = self.world.flow_field(Position(0, 4))
+
+        self.assertIsNone(field.distance(Position(0, 0)))
+        self.assertIsNone(field.direction(Position(0, 0)))
+        self.assertIsNone(field.distance(Position(-1, 0)))
+
+    def test_cached_until_walls_change(self):
+        """Test the field is reused until the world version changes."""
+        field = self.world.flow_field()
+        self.assertIs(self.world.flow_field(), field)
+
+        self.world.place_wall(Position(2, 2))
+        self.assertIsNot(self.world.flow_field(), field)
+
+    def test_agent_follows_field(self):
+        """Test an agent can walk a flow field to the goal."""
+        agent = Agent(self.world)
+        agent.follow(self.world.flow_field())
+
+        steps = 0
+        while agent.advance():
+            steps += 1
+
+        self.assertEqual(agent.at, self.world.goal)
+        self.assertEqual(steps, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
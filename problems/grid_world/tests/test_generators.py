@@ -0,0 +1,53 @@
+"""Unit tests for the map generators."""
+
+import unittest
+import sys
+sys.path.append('..')
+from position import Position
+from generators import GENERATORS, maze, random_fill, rooms
+from path import Pathfinder
+
+
+class TestGenerators(unittest.TestCase):
+    """Test cases for the map generators."""
+
+    def test_seeded_and_deterministic(self):
+        """Test the same seed gives the same map and another seed differs."""
+        for name, generate in GENERATORS.items():
+            first = generate(30, 40, seed=5)
+            self.assertEqual((first.rows, first.cols), (30, 40), name)
+            self.assertEqual(first.occupancy(), generate(30, 40, seed=5).occupancy(), name)
+        self.assertNotEqual(random_fill(30, 30, seed=1).occupancy(),
+                            random_fill(30, 30, seed=2).occupancy())
+
+    def test_start_and_goal_open(self):
+        """Test every generator leaves start and goal passable."""
+        for name, generate in GENERATORS.items():
+            world = generate(25, 17, seed=3)
+            self.assertTrue(world.passable(world.start), name)
+            self.assertTrue(world.passable(world.goal), name)
+
+    def test_density(self):
+        """Test random fill roughly honors its density."""
+        world = random_fill(100, 100, density=0.3)
+        self.assertAlmostEqual(len(world.walls) / 10000, 0.3, delta=0.03)
+
+    def test_maze_is_perfect(self):
+        """Test a maze connects start and goal through its corridors."""
+        world = maze(21, 31, seed=4)
+        self.assertEqual(world.goal, Position(20, 30))
+        rooms_count = 11 * 16
+        self.assertEqual(21 * 31 - len(world.walls), 2 * rooms_count - 1)
+        self.assertIsNotNone(Pathfinder(world).find_path(world.start, world.goal))
+
+    def test_rooms_connected(self):
+        """Test every open cell of a rooms map is reachable."""
+        for size in (10, 11, 21, 33):
+            world = rooms(size, size + 4, room_size=5, seed=size)
+            index = world.build_component_index()
+            self.assertEqual(index.components, 1, size)
+            index.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
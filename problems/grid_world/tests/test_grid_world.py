@@ -5,6 +5,8 @@ import sys
 sys.path.append('..')
 from position import Position
 from grid_world import GridWorld
+from occupancy import BitOccupancyGrid
+from path import Pathfinder
 
 
 class TestGridWorld(unittest.TestCase):
@@ -65,6 +67,159 @@ class TestGridWorld(unittest.TestCase):
         self.assertNotIn(pos, self.world.walls)
         self.assertTrue(self.world.passable(pos))
 
+    def test_version_counter(self):
+        """Test that wall changes bump the version, no-ops do not."""
+        pos = Position(3, 3)
+        self.assertEqual(self.world.version, 0)
+
+        self.world.place_wall(pos)
+        self.world.place_wall(pos)
+        self.assertEqual(self.world.version, 1)
+
+        self.world.remove_wall(pos)
+        self.world.remove_wall(pos)
+        self.assertEqual(self.world.version, 2)
+
+    def test_subscribe_to_wall_changes(self):
+        """Test that listeners hear about real wall changes only."""
+        events = []
+        self.world.subscribe(lambda pos, is_wall: events.append((pos, is_wall)))
+
+        self.world.place_wall(Position(1, 1))
+        self.world.place_wall(Position(1, 1))
+        self.world.remove_wall(Position(1, 1))
+
+        self.assertEqual(events, [(Position(1, 1), True), (Position(1, 1), False)])
+
+    def test_direct_wall_edits_are_tracked(self):
+        """Test editing walls directly bumps the version and notifies."""
+        events = []
+        self.world.subscribe(lambda pos, is_wall: events.append((pos, is_wall)))
+
+        self.world.walls.add(Position(1, 1))
+        self.world.walls.update([Position(1, 1), Position(2, 2)])
+        self.world.walls.discard(Position(1, 1))
+        self.world.walls -= {Position(2, 2)}
+
+        self.assertEqual(self.world.version, 4)
+        self.assertEqual(events, [(Position(1, 1), True), (Position(2, 2), True),
+                                  (Position(1, 1), False), (Position(2, 2), False)])
+
+    def test_replacing_walls_notifies_changed_cells(self):
+        """Test assigning a new store reports each differing cell once."""
+        self.world.place_wall(Position(1, 1))
+        old = self.world.walls
+        events = []
+        self.world.subscribe(lambda pos, is_wall: events.append((pos, is_wall)))
+
+        self.world.walls = {Position(1, 1), Position(2, 2)}
+        self.assertEqual(events, [(Position(2, 2), True)])
+
+        self.world.walls = set()
+        self.assertEqual(sorted(events[1:]), [(Position(1, 1), False), (Position(2, 2), False)])
+
+        version = self.world.version
+        old.add(Position(3, 3))
+        self.assertEqual(self.world.version, version)
+        self.assertEqual(len(events), 3)
+
+    def test_pathfinder_sees_direct_wall_edits(self):
+        """Test a wall added to world.walls is not walked through."""
+        for compact in (False, True):
+            world = GridWorld(rows=3, cols=3, compact=compact)
+            finder = Pathfinder(world)
+            finder.find_path(Position(0, 0), Position(2, 2))
+            world.walls.add(Position(0, 1))
+
+            path = finder.find_path(Position(0, 0), Position(0, 2))
+            self.assertNotIn(Position(0, 1), path)
+            self.assertEqual(len(path), 5)
+
+    def test_occupancy_is_patched_in_place(self):
+        """Test wall edits update the cached buffer instead of rebuilding it."""
+        bits = BitOccupancyGrid(5, 5)
+        for walls in (None, bits):
+            world = GridWorld(rows=5, cols=5, walls=walls)
+            cells = world.occupancy()
+            world.place_wall(Position(1, 2))
+            world.walls.add(Position(9, 9))
+            self.assertIs(world.occupancy(), cells)
+            self.assertEqual(cells[7], 1)
+            self.assertEqual(cells.count(1), 1)
+            world.remove_wall(Position(1, 2))
+            self.assertEqual(cells.count(1), 0)
+
+        world.walls = {Position(0, 1)}
+        self.assertIsNot(world.occupancy(), cells)
+        self.assertEqual(world.occupancy()[1], 1)
+
+    def test_compact_backend(self):
+        """Test that the compact backend behaves like the set backend."""
+        world = GridWorld(rows=5, cols=5, walls={Position(1, 1)}, compact=True)
+        self.assertFalse(world.passable(Position(1, 1)))
+
+        world.place_wall(Position(2, 2))
+        self.assertFalse(world.passable(Position(2, 2)))
+        self.assertIn(Position(2, 2), world.walls)
+
+        world.remove_wall(Position(2, 2))
+        self.assertTrue(world.passable(Position(2, 2)))
+        self.assertEqual(len(world.occupancy()), 25)
+
+    def test_from_ascii(self):
+        """Test building a world from an ASCII map."""
+        world = GridWorld.from_ascii("""
+            S.#
+            .#.
+            ..G
+        """)
+        self.assertEqual((world.rows, world.cols), (3, 3))
+        self.assertEqual(world.start, Position(0, 0))
+        self.assertEqual(world.goal, Position(2, 2))
+        self.assertFalse(world.passable(Position(0, 2)))
+        self.assertFalse(world.passable(Position(1, 1)))
+        self.assertTrue(world.passable(Position(1, 0)))
+
+    def test_from_ascii_unknown_character(self):
+        """Test that unknown map characters are rejected."""
+        with self.assertRaises(ValueError):
+            GridWorld.from_ascii("S.x\n..G")
+
+    def test_interning_pool(self):
+        """Test that an interning world hands out shared positions."""
+        world = GridWorld(rows=5, cols=5, intern=True)
+        self.assertIs(world.position(1, 2), world.position(1, 2))
+        self.assertEqual(world.position(1, 2), Position(1, 2))
+        self.assertIs(GridWorld(rows=5, cols=5).pool, None)
+
+    def test_terrain_costs(self):
+        """Test per-cell costs default to 1 and bump the version."""
+        self.assertEqual(self.world.cost(Position(2, 2)), 1)
+        self.assertIsNone(self.world.costs)
+
+        self.world.set_cost(Position(2, 2), 7)
+        self.assertEqual(self.world.cost(Position(2, 2)), 7)
+        self.assertEqual(self.world.version, 1)
+        self.world.set_cost(Position(2, 2), 7)
+        self.assertEqual(self.world.version, 1)
+
+        with self.assertRaises(ValueError):
+            self.world.set_cost(Position(2, 2), 0)
+        with self.assertRaises(ValueError):
+            self.world.set_cost(Position(-1, 0), 3)
+
+    def test_set_costs_from_rows(self):
+        """Test bulk cost assignment and validation."""
+        world = GridWorld(rows=2, cols=3)
+        world.set_costs([[1, 2, 3], [4, 5, 6]])
+        self.assertEqual(world.cost(Position(1, 2)), 6)
+        with self.assertRaises(ValueError):
+            world.set_costs([[1, 2], [3, 4]])
+        with self.assertRaises(ValueError):
+            world.set_costs([[1, 0, 1], [1, 1, 1]])
+        world.set_costs(None)
+        self.assertEqual(world.cost(Position(1, 2)), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
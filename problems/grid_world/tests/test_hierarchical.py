@@ -0,0 +1,107 @@
+"""Unit tests for HierarchicalPathfinder class."""
+
+import random
+import unittest
+import sys
+sys.path.append('..')
+from position import Position
+from grid_world import GridWorld
+from path import Pathfinder
+from hierarchical import HierarchicalPathfinder
+
+
+class TestHierarchicalPathfinder(unittest.TestCase):
+    """Test cases for HierarchicalPathfinder class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        rng = random.Random(5)
+        self.world = GridWorld(rows=24, cols=24, compact=True)
+        for _ in range(120):
+            self.world.place_wall(Position(rng.randrange(24), rng.randrange(24)))
+        self.world.remove_wall(self.world.start)
+        self.world.remove_wall(self.world.goal)
+        self.planner = HierarchicalPathfinder(self.world, cluster_size=6)
+
+    def tearDown(self):
+        """Unsubscribe the planner from the world."""
+        self.planner.close()
+
+    def assert_valid_path(self, path, start, goal):
+        """Check path runs from start to goal through adjacent open cells."""
+        self.assertEqual(path[0], start)
+        self.assertEqual(path[-1], goal)
+        for curr, next_pos in zip(path, path[1:]):
+            self.assertEqual(abs(curr.row - next_pos.row) + abs(curr.col - next_pos.col), 1)
+            self.assertTrue(self.world.passable(next_pos))
+
+    def test_build_statistics(self):
+        """Test the build reports its size and timing."""
+        self.assertGreater(self.planner.abstract_nodes, 0)
+        self.assertGreater(self.planner.abstract_edges, 0)
+        self.assertGreaterEqual(self.planner.build_time, 0)
+        self.assertEqual(self.planner.rebuilt_clusters, 16)
+
+    def test_paths_are_valid_and_near_optimal(self):
+        """Test paths agree with BFS on reachability and stay close in length."""
+        pathfinder = Pathfinder(self.world)
+        rng = random.Random(9)
+        for _ in range(40):
+            start = Position(rng.randrange(24), rng.randrange(24))
+            goal = Position(rng.randrange(24), rng.randrange(24))
+            if not (self.world.passable(start) and self.world.passable(goal)):
+                continue
+
+            path = self.planner.find_path(start, goal)
+            optimal = pathfinder.find_path(start, goal)
+            if optimal is None:
+                self.assertIsNone(path)
+                continue
+            self.assert_valid_path(path, start, goal)
+            self.assertGreaterEqual(len(path), len(optimal))
+            self.assertLessEqual(len(path) - 1, 2 * (len(optimal) - 1))
+            self.assertGreaterEqual(self.planner.suboptimality_bound, 1.0)
+
+    def test_suboptimality(self):
+        """Test the exact suboptimality ratio is at least 1."""
+        ratio = self.planner.suboptimality(self.world.start, self.world.goal)
+        if ratio is not None:
+            self.assertGreaterEqual(ratio, 1.0)
+
+    def test_wall_change_rebuilds_only_nearby_clusters(self):
+        """Test a wall change refreshes a handful of clusters, not all."""
+        world = GridWorld(rows=30, cols=30)
+        planner = HierarchicalPathfinder(world, cluster_size=5)
+        for col in range(30):
+            if col != 29:
+                world.place_wall(Position(14, col))
+
+        path = planner.find_path(Position(0, 0), Position(29, 0))
+        self.assertIn(Position(14, 29), path)
+        self.assertLess(planner.rebuilt_clusters, 36)
+
+        world.place_wall(Position(14, 29))
+        self.assertIsNone(planner.find_path(Position(0, 0), Position(29, 0)))
+        self.assertLessEqual(planner.rebuilt_clusters, 5)
+        planner.close()
+
+    def test_replaced_walls_rebuild_clusters(self):
+        """Test assigning a new wall store refreshes the abstract graph."""
+        self.world.walls = {Position(r, 12) for r in range(1, 24)}
+        path = self.planner.find_path(self.world.start, self.world.goal)
+        self.assert_valid_path(path, self.world.start, self.world.goal)
+        self.assertIn(Position(0, 12), path)
+
+    def test_same_cluster_and_trivial_queries(self):
+        """Test start == goal and queries inside one cluster."""
+        self.assertEqual(self.planner.find_path(Position(0, 0), Position(0, 0)), [Position(0, 0)])
+
+        world = GridWorld(rows=12, cols=12)
+        planner = HierarchicalPathfinder(world, cluster_size=6)
+        path = planner.find_path(Position(1, 1), Position(4, 4))
+        self.assertEqual(len(path), 7)
+        planner.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
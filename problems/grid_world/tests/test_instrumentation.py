@@ -0,0 +1,130 @@
+"""Unit tests for search statistics and hooks."""
+
+import json
+import unittest
+import sys
+sys.path.append('..')
+from position import Position
+from grid_world import GridWorld
+from chunked_world import ChunkedGridWorld
+from generators import random_fill
+from path import ALGORITHMS, Pathfinder
+from instrumentation import (LatencyHistogram, SamplingHook, SearchStats,
+                             CACHE_HIT, EXHAUSTED, FOUND, UNREACHABLE)
+
+
+class TestSearchStats(unittest.TestCase):
+    """Test cases for Pathfinder.last_stats."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.world = random_fill(30, 30, density=0.2, seed=4)
+
+    def test_every_algorithm_fills_stats(self):
+        """Test each engine reports expansions, visits and path length."""
+        for algorithm in ALGORITHMS:
+            pathfinder = Pathfinder(self.world, algorithm=algorithm, profile=True)
+            path = pathfinder.find_path(self.world.start, self.world.goal)
+            stats = pathfinder.last_stats
+            self.assertEqual(stats.reason, FOUND, algorithm)
+            self.assertEqual(stats.path_length, len(path), algorithm)
+            self.assertEqual(stats.nodes_expanded, pathfinder.nodes_expanded, algorithm)
+            self.assertGreaterEqual(stats.visited, stats.nodes_expanded - 1, algorithm)
+            self.assertGreater(stats.max_frontier, 0, algorithm)
+            self.assertGreater(stats.seconds, 0, algorithm)
+
+    def test_bfs_frontier_only_when_profiling(self):
+        """Test plain BFS skips the frontier pass unless profiling."""
+        pathfinder = Pathfinder(self.world)
+        pathfinder.find_path(self.world.start, self.world.goal)
+        self.assertIsNone(pathfinder.last_stats.max_frontier)
+        self.assertIsNotNone(pathfinder.last_stats.visited)
+
+    def test_bfs_frontier_matches_generic_search(self):
+        """Test the post-hoc BFS frontier equals one tracked live."""
+        pathfinder = Pathfinder(self.world, profile=True)
+        for goal in (self.world.goal, Position(15, 15), Position(3, 27)):
+            pathfinder.find_path(self.world.start, goal)
+            cell_stats = pathfinder.last_stats
+            pathfinder._find_path_generic(self.world.start, goal)
+            self.assertEqual(cell_stats.max_frontier, pathfinder._counters["max_frontier"])
+            self.assertEqual(cell_stats.visited, pathfinder._counters["visited"])
+
+    def test_reasons(self):
+        """Test exhausted, cached and component-pruned searches."""
+        world = GridWorld.from_ascii("""
+            S.#..
+            ..#.G
+        """)
+        pathfinder = Pathfinder(world, cache_size=4)
+        pathfinder.find_path(world.start, world.goal)
+        self.assertEqual(pathfinder.last_stats.reason, EXHAUSTED)
+        self.assertIsNone(pathfinder.last_stats.path_length)
+        pathfinder.find_path(world.start, world.goal)
+        self.assertEqual(pathfinder.last_stats.reason, CACHE_HIT)
+
+        index = world.build_component_index()
+        pathfinder.clear_cache()
+        pathfinder.find_path(world.start, world.goal)
+        self.assertEqual(pathfinder.last_stats.reason, UNREACHABLE)
+        self.assertEqual(pathfinder.last_stats.nodes_expanded, 0)
+        index.close()
+
+    def test_generic_search_stats(self):
+        """Test worlds without an occupancy buffer are instrumented too."""
+        world = ChunkedGridWorld(6, 6)
+        pathfinder = Pathfinder(world)
+        pathfinder.find_path(world.start, world.goal)
+        self.assertEqual(pathfinder.last_stats.visited, 36)
+        self.assertGreater(pathfinder.last_stats.max_frontier, 1)
+
+    def test_to_dict_is_json(self):
+        """Test records export to JSON."""
+        pathfinder = Pathfinder(self.world)
+        pathfinder.find_path(self.world.start, self.world.goal)
+        data = json.loads(json.dumps(pathfinder.last_stats.to_dict()))
+        self.assertEqual(data["goal"], [29, 29])
+        self.assertIn("SearchStats(bfs", repr(pathfinder.last_stats))
+
+
+class TestHooks(unittest.TestCase):
+    """Test cases for hooks and latency histograms."""
+
+    def test_hook_receives_every_search(self):
+        """Test the hook sees each find_path call."""
+        seen = []
+        world = GridWorld(5, 5)
+        pathfinder = Pathfinder(world, hook=seen.append)
+        pathfinder.find_path(Position(0, 0), Position(4, 4))
+        pathfinder.find_path(Position(0, 0), Position(0, 1))
+        self.assertEqual(len(seen), 2)
+        self.assertIsInstance(seen[0], SearchStats)
+        self.assertIs(seen[1], pathfinder.last_stats)
+
+    def test_latency_histogram(self):
+        """Test bucket counts and percentiles."""
+        histogram = LatencyHistogram(smallest=1e-3, factor=10, buckets=3)
+        for seconds in (0.0005, 0.002, 0.003, 0.05, 5.0):
+            histogram.record(seconds)
+        self.assertEqual(histogram.counts, [1, 2, 1, 1])
+        self.assertEqual(histogram.percentile(50), 1e-2)
+        self.assertEqual(histogram.percentile(100), float("inf"))
+        self.assertIsNone(LatencyHistogram().percentile(50))
+
+        pathfinder = Pathfinder(GridWorld(4, 4), hook=histogram)
+        pathfinder.find_path(Position(0, 0), Position(3, 3))
+        self.assertEqual(histogram.to_dict()["count"], 6)
+
+    def test_sampling_hook(self):
+        """Test only every n-th search is forwarded."""
+        seen = []
+        pathfinder = Pathfinder(GridWorld(4, 4), hook=SamplingHook(seen.append, every=3))
+        for _ in range(7):
+            pathfinder.find_path(Position(0, 0), Position(3, 3))
+        self.assertEqual(len(seen), 2)
+        with self.assertRaises(ValueError):
+            SamplingHook(seen.append, every=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+"""Unit tests for binary map files and the .map importer."""
+
+import os
+import tempfile
+import unittest
+import sys
+sys.path.append('..')
+from position import Position
+from grid_world import GridWorld
+from occupancy import BitOccupancyGrid, pack_bits, unpack_bits
+from mapio import HEADER, save_map, load_map, load_movingai
+from path import Pathfinder
+
+
+class TestBitPacking(unittest.TestCase):
+    """Test cases for pack_bits / unpack_bits."""
+
+    def test_round_trip(self):
+        """Test odd-length buffers survive packing."""
+        cells = bytearray([1, 0, 0, 1, 1, 0, 1, 0, 0, 1, 1])
+        packed = pack_bits(cells)
+        self.assertEqual(packed, bytes([0b10011010, 0b01100000]))
+        self.assertEqual(unpack_bits(packed, len(cells)), cells)
+
+    def test_empty(self):
+        """Test an empty buffer packs to nothing."""
+        self.assertEqual(pack_bits(b""), b"")
+        self.assertEqual(unpack_bits(b"", 0), bytearray())
+
+
+class TestBitOccupancyGrid(unittest.TestCase):
+    """Test cases for BitOccupancyGrid class."""
+
+    def test_set_interface(self):
+        """Test add, discard, len and iteration."""
+        grid = BitOccupancyGrid(3, 5)
+        grid.add(Position(1, 2))
+        grid.add(Position(2, 4))
+        grid.add(Position(1, 2))
+        grid.add(Position(7, 7))
+        self.assertIn(Position(1, 2), grid)
+        self.assertNotIn(Position(0, 0), grid)
+        self.assertNotIn(Position(-1, 0), grid)
+        self.assertEqual(len(grid), 2)
+        self.assertEqual(list(grid), [Position(1, 2), Position(2, 4)])
+
+        grid.discard(Position(1, 2))
+        self.assertNotIn(Position(1, 2), grid)
+        self.assertEqual(len(grid), 1)
+
+    def test_unpack_matches_occupancy(self):
+        """Test unpack produces the byte-per-cell layout."""
+        world = GridWorld(4, 6, walls={Position(0, 1), Position(3, 5)})
+        grid = BitOccupancyGrid.pack(4, 6, world.occupancy())
+        self.assertEqual(grid.unpack(), world.occupancy())
+
+
+class TestMapFiles(unittest.TestCase):
+    """Test cases for save_map and load_map."""
+
+    def setUp(self):
+        """Set up a temporary directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "world.gwm")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        """Test walls, start and goal survive save and load."""
+        walls = {Position(0, 1), Position(1, 1), Position(2, 3), Position(4, 6)}
+        world = GridWorld(5, 7, walls=walls, start=Position(0, 0), goal=Position(4, 5))
+        save_map(world, self.path)
+        self.assertEqual(os.path.getsize(self.path), HEADER.size + 5)
+
+        loaded = load_map(self.path)
+        self.assertEqual((loaded.rows, loaded.cols), (5, 7))
+        self.assertEqual(loaded.start, Position(0, 0))
+        self.assertEqual(loaded.goal, Position(4, 5))
+        self.assertEqual(set(loaded.walls), walls)
+        self.assertEqual(loaded.occupancy(), world.occupancy())
+        self.assertEqual(Pathfinder(loaded).find_path(loaded.start, loaded.goal),
+                         Pathfinder(world).find_path(world.start, world.goal))
+
+    def test_edits_do_not_touch_file(self):
+        """Test the mapping is copy-on-write."""
+        save_map(GridWorld(3, 3), self.path)
+        loaded = load_map(self.path)
+        loaded.place_wall(Position(1, 1))
+        self.assertEqual(loaded.occupancy()[4], 1)
+        self.assertNotIn(Position(1, 1), load_map(self.path).walls)
+
+    def test_save_loaded_world(self):
+        """Test a loaded world can be saved again with its edits."""
+        save_map(GridWorld(3, 3), self.path)
+        loaded = load_map(self.path)
+        loaded.place_wall(Position(2, 0))
+        other = os.path.join(self.tmp.name, "edited.gwm")
+        save_map(loaded, other)
+        self.assertEqual(set(load_map(other).walls), {Position(2, 0)})
+
+    def test_rejects_bad_files(self):
+        """Test non-map and truncated files raise ValueError."""
+        with open(self.path, "wb") as f:
+            f.write(b"not a map file at all, just text")
+        with self.assertRaises(ValueError):
+            load_map(self.path)
+
+        save_map(GridWorld(10, 10), self.path)
+        with open(self.path, "r+b") as f:
+            f.truncate(HEADER.size + 3)
+        with self.assertRaises(ValueError):
+            load_map(self.path)
+
+
+class TestMovingAI(unittest.TestCase):
+    """Test cases for the .map importer."""
+
+    def setUp(self):
+        """Set up a temporary directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "arena.map")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp.cleanup()
+
+    def write(self, text):
+        """Write text to the test .map file."""
+        with open(self.path, "w") as f:
+            f.write(text)
+
+    def test_import(self):
+        """Test terrain characters map to walls and open cells."""
+        self.write("type octile\nheight 3\nwidth 4\nmap\n"
+                   ".G@T\n"
+                   "S.OW\n"
+                   "....\n")
+        world = load_movingai(self.path)
+        self.assertEqual((world.rows, world.cols), (3, 4))
+        self.assertEqual(set(world.walls), {Position(0, 2), Position(0, 3),
+                                            Position(1, 2), Position(1, 3)})
+        self.assertEqual(world.goal, Position(2, 3))
+
+    def test_rejects_malformed(self):
+        """Test wrong row counts and widths raise ValueError."""
+        self.write("type octile\nheight 2\nwidth 3\nmap\n...\n")
+        with self.assertRaises(ValueError):
+            load_movingai(self.path)
+        self.write("type octile\nheight 1\nwidth 3\nmap\n....\n")
+        with self.assertRaises(ValueError):
+            load_movingai(self.path)
+        self.write("type octile\nheight 1\nwidth 3\n")
+        with self.assertRaises(ValueError):
+            load_movingai(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
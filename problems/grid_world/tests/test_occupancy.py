@@ -0,0 +1,68 @@
+"""Unit tests for OccupancyGrid class."""
+
+import unittest
+import sys
+sys.path.append('..')
+from position import Position
+from occupancy import OccupancyGrid
+
+
+class TestOccupancyGrid(unittest.TestCase):
+    """Test cases for OccupancyGrid class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.grid = OccupancyGrid(rows=3, cols=4)
+
+    def test_initialization(self):
+        """Test grid starts empty with one byte per cell."""
+        self.assertEqual(len(self.grid.cells), 12)
+        self.assertEqual(len(self.grid), 0)
+
+    def test_add_and_discard(self):
+        """Test wall placement and removal."""
+        pos = Position(1, 2)
+        self.grid.add(pos)
+        self.assertIn(pos, self.grid)
+        self.assertEqual(self.grid.cells[1 * 4 + 2], 1)
+        self.assertEqual(len(self.grid), 1)
+
+        self.grid.discard(pos)
+        self.assertNotIn(pos, self.grid)
+        self.assertEqual(len(self.grid), 0)
+
+    def test_out_of_bounds_is_not_wall(self):
+        """Test that out-of-bounds positions are never walls."""
+        self.grid.add(Position(5, 5))
+        self.assertNotIn(Position(5, 5), self.grid)
+        self.assertNotIn(Position(-1, 0), self.grid)
+        self.assertEqual(len(self.grid), 0)
+
+    def test_iteration(self):
+        """Test iterating yields wall positions in row-major order."""
+        self.grid.add(Position(2, 0))
+        self.grid.add(Position(0, 3))
+        self.assertEqual(list(self.grid), [Position(0, 3), Position(2, 0)])
+
+    def test_from_array(self):
+        """Test building a grid from nested lists."""
+        grid = OccupancyGrid.from_array([[0, 1], [1, 0]])
+        self.assertEqual((grid.rows, grid.cols), (2, 2))
+        self.assertEqual(set(grid), {Position(0, 1), Position(1, 0)})
+
+    def test_nonzero_cells_are_walls(self):
+        """Test any nonzero byte in a supplied buffer counts as a wall everywhere."""
+        grid = OccupancyGrid(1, 3, bytes([0, 2, 255]))
+        self.assertEqual(grid.cells, bytearray([0, 1, 1]))
+        self.assertIn(Position(0, 1), grid)
+        self.assertEqual(len(grid), 2)
+        self.assertEqual(list(grid), [Position(0, 1), Position(0, 2)])
+
+    def test_from_array_rejects_ragged_rows(self):
+        """Test that rows of different lengths are rejected."""
+        with self.assertRaises(ValueError):
+            OccupancyGrid.from_array([[0, 1], [1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
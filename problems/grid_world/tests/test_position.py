@@ -1,9 +1,10 @@
 """Unit tests for Position class."""
 
+import pickle
 import unittest
 import sys
 sys.path.append('..')
-from position import Position
+from position import Position, PositionPool
 
 
 class TestPosition(unittest.TestCase):
@@ -60,6 +61,65 @@ class TestPosition(unittest.TestCase):
         self.assertEqual(repr(pos), "(2,3)")
         self.assertEqual(str(pos), "(2,3)")
 
+    def test_immutable(self):
+        """Test that positions cannot be modified."""
+        pos = Position(2, 3)
+        with self.assertRaises(AttributeError):
+            pos.row = 5
+        with self.assertRaises(AttributeError):
+            pos.extra = 1
+        self.assertEqual(pos, Position(2, 3))
+
+    def test_pickle_round_trip(self):
+        """Test that positions survive pickling."""
+        pos = Position(2, 3)
+        self.assertEqual(pickle.loads(pickle.dumps(pos)), pos)
+
+    def test_unpacks_like_a_pair(self):
+        """Test a position unpacks to (row, col) and has no __dict__."""
+        row, col = Position(2, 3)
+        self.assertEqual((row, col), (2, 3))
+        self.assertFalse(hasattr(Position(2, 3), "__dict__"))
+
+
+class TestPositionPool(unittest.TestCase):
+    """Test cases for PositionPool class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.pool = PositionPool(rows=5, cols=5)
+
+    def test_get_returns_shared_instance(self):
+        """Test that the pool hands out one instance per cell."""
+        self.assertIs(self.pool.get(2, 3), self.pool.get(2, 3))
+        self.assertIs(self.pool.intern(Position(2, 3)), self.pool.get(2, 3))
+        self.assertEqual(len(self.pool), 1)
+
+    def test_pooled_equals_plain(self):
+        """Test pooled positions compare and hash like plain ones."""
+        pooled = self.pool.get(2, 3)
+        self.assertEqual(pooled, Position(2, 3))
+        self.assertEqual(hash(pooled), hash(Position(2, 3)))
+        self.assertIn(Position(2, 3), {pooled})
+
+    def test_neighbors_are_pooled(self):
+        """Test neighbors_4 of a pooled position returns pooled neighbors."""
+        up, down, left, right = self.pool.get(2, 3).neighbors_4()
+        self.assertIs(up, self.pool.get(1, 3))
+        self.assertIs(right, self.pool.get(2, 4))
+
+    def test_out_of_bounds_not_pooled(self):
+        """Test that out-of-bounds positions are created fresh."""
+        up, _, _, _ = self.pool.get(0, 0).neighbors_4()
+        self.assertEqual(up, Position(-1, 0))
+        self.assertIsNot(up, self.pool.get(-1, 0))
+
+    def test_pooled_pickles_as_plain(self):
+        """Test a pooled position unpickles as an equal plain Position."""
+        restored = pickle.loads(pickle.dumps(self.pool.get(2, 3)))
+        self.assertIs(type(restored), Position)
+        self.assertEqual(restored, Position(2, 3))
+
 
 if __name__ == "__main__":
     unittest.main()
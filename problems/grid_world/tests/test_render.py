@@ -0,0 +1,96 @@
+"""Unit tests for Renderer class."""
+
+import io
+import unittest
+import sys
+sys.path.append('..')
+from position import Position
+from grid_world import GridWorld
+from chunked_world import ChunkedGridWorld
+from render import Renderer
+
+
+class TestRenderer(unittest.TestCase):
+    """Test cases for Renderer class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.world = GridWorld.from_ascii("""
+            S.#..
+            ..#..
+            .....
+            ..#.G
+        """)
+        self.stream = io.StringIO()
+        self.renderer = Renderer(self.world, stream=self.stream)
+
+    def tearDown(self):
+        """Unsubscribe the renderer from the world."""
+        self.renderer.close()
+
+    def test_to_string_legend(self):
+        """Test walls, start, goal, path and agent glyphs."""
+        path = [Position(0, 0), Position(1, 0), Position(2, 0), Position(2, 1)]
+        text = self.renderer.to_string(path=path, agent=Position(2, 1))
+        self.assertEqual(text, "S.#..\n*.#..\n*A...\n..#.G\n")
+
+    def test_render_to_stream(self):
+        """Test render writes the same frame to the stream."""
+        self.renderer.render()
+        self.assertEqual(self.stream.getvalue(), self.renderer.to_string())
+
+    def test_viewport_is_clipped(self):
+        """Test a viewport shows a window and stays inside the grid."""
+        self.renderer.viewport = (2, 3, 2, 2)
+        self.assertEqual(self.renderer.to_string(), "..\n.G\n")
+        self.renderer.viewport = (10, 10, 2, 3)
+        self.assertEqual(self.renderer.to_string(), "...\n#.G\n")
+
+    def test_center(self):
+        """Test center keeps a position in the viewport."""
+        self.renderer.viewport = (0, 0, 2, 2)
+        self.renderer.center(Position(3, 4))
+        self.assertEqual(self.renderer.to_string(), "..\n.G\n")
+
+    def test_incremental_draw(self):
+        """Test draw repaints only the cells that changed."""
+        drawn = self.renderer.draw(agent=Position(1, 0))
+        self.assertEqual(drawn, 20)
+        self.assertTrue(self.stream.getvalue().startswith("\x1b[2J"))
+
+        self.stream.truncate(0)
+        self.stream.seek(0)
+        drawn = self.renderer.draw(agent=Position(1, 1))
+        self.assertEqual(drawn, 2)
+        self.assertEqual(self.stream.getvalue(), "\x1b[2;1H.\x1b[2;2HA\x1b[5;1H")
+
+        self.world.place_wall(Position(2, 4))
+        self.assertEqual(self.renderer.draw(agent=Position(1, 1)), 1)
+        self.assertEqual(self.renderer.draw(agent=Position(1, 1)), 0)
+
+    def test_replaced_walls_are_redrawn(self):
+        """Test draw repaints cells changed by assigning a new wall store."""
+        self.renderer.draw()
+        self.world.walls = {Position(0, 2), Position(1, 2), Position(3, 2), Position(0, 4)}
+
+        self.assertEqual(self.renderer.draw(), 1)
+        self.assertEqual(self.renderer.to_string(), "S.#.#\n..#..\n.....\n..#.G\n")
+
+    def test_moving_viewport_redraws(self):
+        """Test a new viewport triggers a full repaint."""
+        self.renderer.viewport = (0, 0, 2, 2)
+        self.assertEqual(self.renderer.draw(), 4)
+        self.renderer.viewport = (1, 1, 2, 2)
+        self.assertEqual(self.renderer.draw(), 4)
+
+    def test_chunked_world(self):
+        """Test worlds without an occupancy buffer render too."""
+        world = ChunkedGridWorld(walls={Position(-1, 1)}, goal=Position(0, 1))
+        renderer = Renderer(world, viewport=(-1, 0, 2, 3))
+        self.assertEqual(renderer.to_string(), ".#.\nSG.\n")
+        with self.assertRaises(ValueError):
+            Renderer(world).to_string()
+
+
+if __name__ == '__main__':
+    unittest.main()
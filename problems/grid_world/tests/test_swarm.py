@@ -0,0 +1,102 @@
+"""Unit tests for AgentSwarm class."""
+
+import random
+import unittest
+import sys
+sys.path.append('..')
+import numpy as np
+from position import Position
+from grid_world import GridWorld
+from agent import Agent, DIRECTIONS
+from swarm import AgentSwarm
+
+UP, DOWN, LEFT, RIGHT = range(4)
+STAY = -1
+
+
+class TestAgentSwarm(unittest.TestCase):
+    """Test cases for AgentSwarm class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.world = GridWorld.from_ascii("""
+            S....
+            .#...
+            .....
+            ....G
+        """)
+
+    def test_matches_agent_step(self):
+        """Test separated agents move exactly like Agent.step."""
+        rng = random.Random(3)
+        starts = [Position(0, 0), Position(2, 2), Position(3, 4), Position(0, 4)]
+        swarm = AgentSwarm(self.world, starts, collide=False)
+        agents = [Agent(self.world, pos) for pos in starts]
+
+        for _ in range(50):
+            codes = [rng.randrange(4) for _ in agents]
+            expected = [agent.step(DIRECTIONS[code]) for agent, code in zip(agents, codes)]
+            success = swarm.step(np.array(codes))
+            self.assertEqual(success.tolist(), expected)
+            self.assertEqual(swarm.positions.tolist(), [[a.at.row, a.at.col] for a in agents])
+
+    def test_walls_bounds_and_stay(self):
+        """Test blocked moves fail and staying succeeds."""
+        swarm = AgentSwarm(self.world, [Position(0, 0), Position(0, 1), Position(2, 2)])
+        success = swarm.step([UP, DOWN, STAY])
+        self.assertEqual(success.tolist(), [False, False, True])
+        self.assertEqual(swarm.positions.tolist(), [[0, 0], [0, 1], [2, 2]])
+
+    def test_same_target_lowest_index_wins(self):
+        """Test two agents moving onto one cell."""
+        swarm = AgentSwarm(self.world, [Position(2, 0), Position(2, 2)])
+        success = swarm.step([RIGHT, LEFT])
+        self.assertEqual(success.tolist(), [True, False])
+        self.assertEqual(swarm.positions.tolist(), [[2, 1], [2, 2]])
+
+    def test_staying_agent_blocks_and_cascades(self):
+        """Test a blocked agent stays and blocks the agents behind it."""
+        swarm = AgentSwarm(self.world, [Position(3, 0), Position(3, 1),
+                                        Position(3, 2), Position(3, 3)])
+        success = swarm.step([STAY, LEFT, LEFT, LEFT])
+        self.assertEqual(success.tolist(), [True, False, False, False])
+
+        success = swarm.step([DOWN, UP, LEFT, LEFT])
+        self.assertEqual(success.tolist(), [False, True, True, True])
+        self.assertEqual(swarm.positions.tolist(), [[3, 0], [2, 1], [3, 1], [3, 2]])
+
+    def test_no_swaps(self):
+        """Test two agents cannot pass through each other."""
+        swarm = AgentSwarm(self.world, [Position(0, 2), Position(0, 3)])
+        success = swarm.step([RIGHT, LEFT])
+        self.assertEqual(success.tolist(), [False, False])
+        self.assertEqual(swarm.positions.tolist(), [[0, 2], [0, 3]])
+
+    def test_random_steps_never_overlap(self):
+        """Test agents never share a cell or stand on a wall."""
+        world = GridWorld(20, 20, walls={Position(r, 10) for r in range(18)}, compact=True)
+        rng = np.random.default_rng(0)
+        cells = rng.choice([c for c in range(400) if c % 20 != 10 or c // 20 >= 18],
+                           size=150, replace=False)
+        swarm = AgentSwarm(world, np.stack((cells // 20, cells % 20), axis=1))
+        occupancy = np.frombuffer(world.occupancy(), dtype=np.uint8)
+        for _ in range(100):
+            swarm.step(rng.integers(-1, 4, size=len(swarm)))
+            flat = swarm.rows * 20 + swarm.cols
+            self.assertEqual(np.unique(flat).size, len(swarm))
+            self.assertFalse(occupancy[flat].any())
+
+    def test_reset_and_validation(self):
+        """Test reset and rejection of bad direction arrays."""
+        swarm = AgentSwarm(self.world, [Position(0, 0)])
+        swarm.step([RIGHT])
+        swarm.reset()
+        self.assertEqual(swarm.positions.tolist(), [[0, 0]])
+        with self.assertRaises(ValueError):
+            swarm.step([4])
+        with self.assertRaises(ValueError):
+            swarm.step([RIGHT, RIGHT])
+
+
+if __name__ == '__main__':
+    unittest.main()
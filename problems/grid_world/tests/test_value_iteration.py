@@ -0,0 +1,140 @@
+"""Unit tests for value iteration, policy evaluation and ValuePolicy."""
+
+import unittest
+import sys
+sys.path.append('..')
+import numpy as np
+from position import Position
+from grid_world import GridWorld
+from agent import Agent
+from fields import NO_DIRECTION, distance_field
+from generators import random_fill
+from value_iteration import ValuePolicy, evaluate_policy, value_iteration
+
+
+class TestValueIteration(unittest.TestCase):
+    """Test cases for value_iteration and evaluate_policy."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.world = random_fill(25, 25, density=0.25, seed=6)
+        self.dist = distance_field(self.world, self.world.goal)
+
+    def test_undiscounted_values_are_negative_distances(self):
+        """Test gamma=1 with -1 per step and -1 for the goal move gives -distance."""
+        values, policy, iterations, converged = value_iteration(
+            self.world, gamma=1.0, step_reward=-1.0, goal_reward=-1.0)
+        reachable = self.dist >= 0
+
+        self.assertTrue(converged)
+        np.testing.assert_array_equal(values[reachable], -self.dist[reachable])
+        self.assertLessEqual(iterations, self.dist.max() + 2)
+
+    def test_discounted_values_closed_form(self):
+        """Test discounted values match the geometric sum along a shortest path."""
+        gamma = 0.9
+        values, _, _, converged = value_iteration(self.world, gamma=gamma, goal_reward=10.0)
+        d = self.dist[self.dist > 0]
+        expected = -(1 - gamma ** (d - 1)) / (1 - gamma) + 10.0 * gamma ** (d - 1)
+
+        self.assertTrue(converged)
+        np.testing.assert_allclose(values[self.dist > 0], expected)
+
+    def test_policy_descends_distance(self):
+        """Test every policy move goes one step closer to the goal."""
+        _, policy, _, _ = value_iteration(self.world)
+        for row, col in zip(*np.nonzero(self.dist > 0)):
+            pos = Position(int(row), int(col))
+            agent = Agent(self.world, pos)
+            self.assertNotEqual(policy[row, col], NO_DIRECTION)
+            self.assertTrue(agent.step(("up", "down", "left", "right")[policy[row, col]]))
+            self.assertEqual(self.dist[agent.at.row, agent.at.col], self.dist[row, col] - 1)
+
+    def test_walls_and_unreachable_cells(self):
+        """Test walls are NaN and cut-off cells get the never-arrive value."""
+        world = GridWorld(rows=3, cols=3, walls={Position(0, 1), Position(1, 0)})
+        values, policy, _, _ = value_iteration(world, gamma=0.5, step_reward=-1.0)
+
+        self.assertTrue(np.isnan(values[0, 1]))
+        self.assertEqual(values[0, 0], -2.0)
+        self.assertEqual(policy[0, 0], NO_DIRECTION)
+        self.assertEqual(policy[2, 2], NO_DIRECTION)
+
+    def test_max_iterations(self):
+        """Test the sweep limit stops early without converging."""
+        _, _, iterations, converged = value_iteration(self.world, max_iterations=2)
+        self.assertEqual(iterations, 2)
+        self.assertFalse(converged)
+
+    def test_rejects_bad_parameters(self):
+        """Test invalid gamma and undiscounted positive rewards are rejected."""
+        with self.assertRaises(ValueError):
+            value_iteration(self.world, gamma=0.0)
+        with self.assertRaises(ValueError):
+            value_iteration(self.world, gamma=1.0, step_reward=1.0)
+
+    def test_evaluating_optimal_policy_gives_optimal_values(self):
+        """Test policy evaluation of the greedy policy reproduces its values."""
+        values, policy, _, _ = value_iteration(self.world, gamma=0.95)
+        evaluated, _, converged = evaluate_policy(self.world, policy, gamma=0.95)
+        reachable = self.dist >= 0
+
+        self.assertTrue(converged)
+        np.testing.assert_allclose(evaluated[reachable], values[reachable], atol=1e-5)
+
+    def test_undiscounted_evaluation_terminates(self):
+        """Test gamma=1 evaluation gives cells that never arrive their value."""
+        values, policy, _, _ = value_iteration(self.world, gamma=1.0)
+        cut_off = (self.dist == -1) & ~np.isnan(values)
+        self.assertTrue(cut_off.any())
+
+        evaluated, _, converged = evaluate_policy(self.world, policy, gamma=1.0)
+        self.assertTrue(converged)
+        np.testing.assert_array_equal(evaluated[cut_off], -np.inf)
+        np.testing.assert_array_equal(evaluated[self.dist >= 0], values[self.dist >= 0])
+
+        # Moving up forever never reaches the bottom-right goal
+        up = np.zeros(policy.shape, dtype=np.int8)
+        evaluated, _, converged = evaluate_policy(self.world, up, gamma=1.0, step_reward=0.0)
+        self.assertTrue(converged)
+        self.assertEqual(np.nansum(np.abs(evaluated)), 0.0)
+
+    def test_evaluating_staying_policy(self):
+        """Test a policy that never moves earns the never-arrive value."""
+        world = GridWorld(rows=2, cols=2)
+        stay = np.full((2, 2), NO_DIRECTION)
+        values, _, _ = evaluate_policy(world, stay, gamma=0.5, tolerance=1e-9)
+        self.assertAlmostEqual(values[0, 0], -2.0, places=6)
+        self.assertEqual(values[1, 1], 0.0)
+
+
+class TestValuePolicy(unittest.TestCase):
+    """Test cases for ValuePolicy class."""
+
+    def test_agent_follows_policy_to_goal(self):
+        """Test an agent following the policy reaches the goal in BFS steps."""
+        world = random_fill(30, 30, density=0.2, seed=2)
+        dist = distance_field(world, world.goal)
+        policy = ValuePolicy(world)
+        agent = Agent(world, planner=policy)
+        moves = 0
+        while agent.advance():
+            moves += 1
+
+        self.assertEqual(agent.at, world.goal)
+        self.assertEqual(moves, dist[0, 0])
+
+    def test_lookups(self):
+        """Test value, direction and next_step at the goal and off the grid."""
+        world = GridWorld(rows=3, cols=3)
+        policy = ValuePolicy(world)
+
+        self.assertEqual(policy.value(world.goal), 0.0)
+        self.assertIsNone(policy.direction(world.goal))
+        self.assertIsNone(policy.next_step(Position(5, 5)))
+        self.assertIsNone(policy.value(Position(-1, 0)))
+        self.assertIn(policy.next_step(Position(0, 0)), [Position(1, 0), Position(0, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Unit tests for VectorEnv class."""
+
+import random
+import unittest
+import sys
+sys.path.append('..')
+import numpy as np
+from position import Position
+from grid_world import GridWorld
+from agent import Agent, DIRECTIONS
+from vec_env import VectorEnv
+
+UP, DOWN, LEFT, RIGHT = range(4)
+
+
+class TestVectorEnv(unittest.TestCase):
+    """Test cases for VectorEnv class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.world = GridWorld.from_ascii("""
+            S....
+            .#...
+            .....
+            ....G
+        """)
+        self.goal = self.world.goal.row * self.world.cols + self.world.goal.col
+
+    def test_reset_returns_start_cells(self):
+        """Test every episode starts at world.start."""
+        env = VectorEnv(self.world, 3)
+        self.assertEqual(env.reset().tolist(), [0, 0, 0])
+
+    def test_matches_agent_step(self):
+        """Test one episode moves exactly like Agent.step."""
+        rng = random.Random(1)
+        env = VectorEnv(self.world, 1)
+        env.reset()
+        agent = Agent(self.world)
+        for _ in range(30):
+            code = rng.randrange(4)
+            agent.step(DIRECTIONS[code])
+            obs, _, done = env.step(np.array([code]))
+            if done[0]:
+                break
+            self.assertEqual(obs[0], agent.at.row * self.world.cols + agent.at.col)
+
+    def test_goal_reward_and_auto_reset(self):
+        """Test reaching the goal pays goal_reward and restarts the episode."""
+        env = VectorEnv(self.world, 2, step_reward=-1.0, goal_reward=10.0)
+        env.reset()
+        for code in (RIGHT, RIGHT, RIGHT, RIGHT, DOWN, DOWN):
+            obs, rewards, done = env.step(np.array([code, UP]))
+            self.assertFalse(done.any())
+            self.assertEqual(rewards.tolist(), [-1.0, -1.0])
+        obs, rewards, done = env.step(np.array([DOWN, UP]))
+
+        self.assertEqual(done.tolist(), [True, False])
+        self.assertEqual(rewards.tolist(), [10.0, -1.0])
+        self.assertEqual(obs.tolist(), [0, 0])
+        self.assertEqual(env.final_observations[0], self.goal)
+        self.assertEqual(env.steps.tolist(), [0, 7])
+
+    def test_max_steps_truncates(self):
+        """Test episodes end after max_steps moves."""
+        env = VectorEnv(self.world, 4, max_steps=3)
+        env.reset()
+        stay = np.full(4, -1)
+        for _ in range(2):
+            self.assertFalse(env.step(stay)[2].any())
+        obs, rewards, done = env.step(stay)
+        self.assertTrue(done.all())
+        self.assertTrue((rewards == env.step_reward).all())
+
+    def test_walls_block(self):
+        """Test moves into walls and off the grid leave the agent in place."""
+        world = GridWorld(rows=3, cols=3, walls={Position(0, 1)})
+        env = VectorEnv(world, 2)
+        env.reset()
+        obs, _, _ = env.step(np.array([RIGHT, UP]))
+        self.assertEqual(obs.tolist(), [0, 0])
+
+    def test_episodes_are_independent(self):
+        """Test agents may share a cell."""
+        env = VectorEnv(self.world, 2)
+        env.reset()
+        obs, _, _ = env.step(np.array([RIGHT, RIGHT]))
+        self.assertEqual(obs.tolist(), [1, 1])
+
+    def test_random_start_open_cells(self):
+        """Test random starts are open, non-goal and seeded."""
+        env = VectorEnv(self.world, 200, random_start=True, seed=3)
+        obs = env.reset()
+        occupancy = np.frombuffer(self.world.occupancy(), dtype=np.uint8)
+
+        self.assertFalse(occupancy[obs].any())
+        self.assertNotIn(self.goal, obs.tolist())
+        again = VectorEnv(self.world, 200, random_start=True, seed=3).reset()
+        self.assertEqual(obs.tolist(), again.tolist())
+
+    def test_rejects_bad_actions(self):
+        """Test action arrays must match num_envs and be valid codes."""
+        env = VectorEnv(self.world, 2)
+        env.reset()
+        with self.assertRaises(ValueError):
+            env.step(np.array([0]))
+        with self.assertRaises(ValueError):
+            env.step(np.array([0, 4]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,305 @@
+"""Value iteration and policy evaluation over a grid world with NumPy."""
+
+import numpy as np
+from agent import DIRECTIONS, DELTAS
+from fields import NO_DIRECTION, distance_field
+from position import Position
+
+
+def _successors(world):
+    """
+    Next cell of every (direction, cell) pair under Agent.step's rules.
+
+    Args:
+        world (GridWorld): World with an occupancy buffer
+
+    Returns:
+        np.ndarray: ``int64`` array of shape ``(4, rows * cols)``; moves
+            off the grid or into a wall lead back to the same cell
+    """
+    rows, cols = world.rows, world.cols
+    free = np.frombuffer(world.occupancy(), dtype=np.uint8) == 0
+    row, col = np.divmod(np.arange(rows * cols, dtype=np.int64), cols)
+    nxt = np.empty((len(DIRECTIONS), rows * cols), dtype=np.int64)
+    for code, name in enumerate(DIRECTIONS):
+        dr, dc = DELTAS[name]
+        r = row + dr
+        c = col + dc
+        inside = (r >= 0) & (r < rows) & (c >= 0) & (c < cols)
+        target = np.where(inside, r * cols + c, 0)
+        nxt[code] = np.where(inside & free[target], target, row * cols + col)
+    return nxt
+
+
+def _unreachable_value(gamma, step_reward):
+    """Return of an agent that never reaches the goal."""
+    if gamma < 1:
+        return step_reward / (1 - gamma)
+    return -np.inf if step_reward < 0 else 0.0
+
+
+def _check(gamma, step_reward, tolerance):
+    """Validate the shared solver parameters."""
+    if not 0 < gamma <= 1:
+        raise ValueError("gamma must be in (0, 1]")
+    if gamma == 1 and step_reward > 0:
+        raise ValueError("step_reward must be <= 0 without discounting")
+    if tolerance <= 0:
+        raise ValueError("tolerance must be > 0")
+
+
+def value_iteration(world, goal=None, gamma=0.99, step_reward=-1.0, goal_reward=0.0,
+                    tolerance=1e-6, max_iterations=None):
+    """
+    Optimal state values and greedy policy by synchronous value iteration.
+
+    Moves are deterministic and follow Agent.step: a blocked move leaves
+    the agent in place. Every move earns ``step_reward``, except the one
+    entering the goal, which earns ``goal_reward`` and ends the episode.
+    Each sweep updates every cell at once with whole-array operations:
+
+        V(s) = max_a  r(s, a) + gamma * V(next(s, a))
+
+    Cells that cannot reach the goal (found with a BFS distance field)
+    are given the value of never arriving and left out of the sweeps.
+    The others start from a pessimistic bound, so for non-positive step
+    rewards the values only rise and settle after about as many sweeps
+    as the longest shortest path.
+
+    Args:
+        world (GridWorld): World with an occupancy buffer
+        goal (Position, optional): Terminal cell (default: world.goal)
+        gamma (float): Discount factor in (0, 1] (default: 0.99)
+        step_reward (float): Reward per move (default: -1.0)
+        goal_reward (float): Reward for entering the goal (default: 0.0)
+        tolerance (float): Stop once no value changes by more than this
+        max_iterations (int, optional): Upper bound on sweeps
+
+    Returns:
+        tuple: (values ``float64`` array of shape ``(rows, cols)``, NaN on
+            walls; policy ``int8`` array of direction codes, NO_DIRECTION
+            at the goal, walls and cells that cannot reach it; sweeps run;
+            whether the values converged)
+    """
+    _check(gamma, step_reward, tolerance)
+    goal = goal if goal is not None else world.goal
+    rows, cols = world.rows, world.cols
+    n = rows * cols
+    free = np.frombuffer(world.occupancy(), dtype=np.uint8) == 0
+    values = np.full(n, _unreachable_value(gamma, step_reward))
+    values[~free] = np.nan
+    policy = np.full(n, NO_DIRECTION, dtype=np.int8)
+
+    if not world.in_bounds(goal) or not free[goal.row * cols + goal.col]:
+        return values.reshape(rows, cols), policy.reshape(rows, cols), 0, True
+    goal_cell = goal.row * cols + goal.col
+    values[goal_cell] = 0.0
+    active = np.flatnonzero(distance_field(world, goal) > 0)
+    if not active.size:
+        return values.reshape(rows, cols), policy.reshape(rows, cols), 0, True
+
+    nxt = _successors(world)[:, active]
+    rewards = np.where(nxt == goal_cell, goal_reward, step_reward)
+    # Any return is at least the worst reward on every step, and no
+    # shortest path is longer than n moves
+    worst = min(step_reward, goal_reward, 0.0)
+    values[active] = worst / (1 - gamma) if gamma < 1 else worst * n
+
+    # Sweep buffers are allocated once and reused
+    q = np.empty(nxt.shape)
+    updated = np.empty(active.size)
+    current = values[active]
+    iterations = 0
+    converged = False
+    while max_iterations is None or iterations < max_iterations:
+        iterations += 1
+        np.take(values, nxt, out=q)
+        q *= gamma
+        q += rewards
+        q.max(axis=0, out=updated)
+        current -= updated
+        change = np.abs(current, out=current).max()
+        values[active] = updated
+        current, updated = updated, current
+        if change <= tolerance:
+            converged = True
+            break
+
+    np.take(values, nxt, out=q)
+    q *= gamma
+    q += rewards
+    policy[active] = q.argmax(axis=0)
+    return values.reshape(rows, cols), policy.reshape(rows, cols), iterations, converged
+
+
+def evaluate_policy(world, policy, goal=None, gamma=0.99, step_reward=-1.0, goal_reward=0.0,
+                    tolerance=1e-6, max_iterations=None):
+    """
+    State values of a fixed policy by iterative policy evaluation.
+
+    Same rewards and moves as value_iteration; cells with NO_DIRECTION
+    stay where they are. Values start at 0 and every sweep applies
+
+        V(s) = r(s, policy(s)) + gamma * V(next(s, policy(s)))
+
+    to all cells whose policy leads to the goal. Cells whose policy
+    never gets there (NO_DIRECTION, or a move into a wall or a loop) are
+    found first by following the policy and given the value of never
+    arriving, as in value_iteration, so the sweeps also terminate
+    without discounting.
+
+    Args:
+        world (GridWorld): World with an occupancy buffer
+        policy (np.ndarray): Direction code per cell, shape ``(rows, cols)``
+        goal (Position, optional): Terminal cell (default: world.goal)
+        gamma (float): Discount factor in (0, 1] (default: 0.99)
+        step_reward (float): Reward per move (default: -1.0)
+        goal_reward (float): Reward for entering the goal (default: 0.0)
+        tolerance (float): Stop once no value changes by more than this
+        max_iterations (int, optional): Upper bound on sweeps
+
+    Returns:
+        tuple: (values ``float64`` array of shape ``(rows, cols)``, NaN on
+            walls; sweeps run; whether the values converged)
+    """
+    _check(gamma, step_reward, tolerance)
+    goal = goal if goal is not None else world.goal
+    rows, cols = world.rows, world.cols
+    free = np.frombuffer(world.occupancy(), dtype=np.uint8) == 0
+    codes = np.asarray(policy).ravel()
+    if codes.size != rows * cols:
+        raise ValueError("policy must have one code per cell")
+
+    active = free.copy()
+    if world.in_bounds(goal):
+        active[goal.row * cols + goal.col] = False
+    active = np.flatnonzero(active)
+    nxt = _successors(world)
+    moves = codes[active]
+    target = np.where(moves == NO_DIRECTION, active, nxt[np.maximum(moves, 0), active])
+    goal_cell = goal.row * cols + goal.col if world.in_bounds(goal) else -1
+    values = np.zeros(rows * cols)
+    values[~free] = np.nan
+
+    # Follow the policy by pointer jumping: after k rounds a cell knows
+    # whether the goal lies within 2**k moves of it
+    reaches = np.zeros(rows * cols, dtype=bool)
+    if goal_cell >= 0 and free[goal_cell]:
+        reaches[goal_cell] = True
+        hop = np.arange(rows * cols)
+        hop[active] = target
+        for _ in range((rows * cols).bit_length()):
+            reaches |= reaches[hop]
+            hop = hop[hop]
+    stuck = ~reaches[active]
+    values[active[stuck]] = _unreachable_value(gamma, step_reward)
+    active = active[~stuck]
+    target = target[~stuck]
+
+    entering = target == goal_cell
+    rewards = np.where(entering, goal_reward, step_reward)
+
+    iterations = 0
+    converged = False
+    while max_iterations is None or iterations < max_iterations:
+        iterations += 1
+        updated = rewards + gamma * np.where(entering, 0.0, values[target])
+        change = np.abs(updated - values[active]).max() if active.size else 0.0
+        values[active] = updated
+        if change <= tolerance:
+            converged = True
+            break
+
+    return values.reshape(rows, cols), iterations, converged
+
+
+class ValuePolicy:
+    """
+    Optimal values and policy for every cell of a world.
+
+    Solved once with value_iteration; afterwards any number of agents
+    read their next move in O(1). ValuePolicy has the same
+    ``next_step(pos)`` method as the planners, so ``Agent.follow(policy)``
+    works.
+
+    Attributes:
+        goal (Position): Terminal cell
+        gamma (float): Discount factor
+        version (int): World version the solution was computed for
+        values (np.ndarray): State value per cell, NaN on walls
+        policy (np.ndarray): Direction code per cell, NO_DIRECTION if none
+        iterations (int): Value iteration sweeps run
+        converged (bool): Whether the sweeps met the tolerance
+    """
+
+    def __init__(self, world, goal=None, gamma=0.99, step_reward=-1.0, goal_reward=0.0,
+                 tolerance=1e-6, max_iterations=None):
+        """
+        Solve the world.
+
+        Args:
+            world (GridWorld): World with an occupancy buffer
+            goal (Position, optional): Terminal cell (default: world.goal)
+            gamma (float): Discount factor in (0, 1] (default: 0.99)
+            step_reward (float): Reward per move (default: -1.0)
+            goal_reward (float): Reward for entering the goal (default: 0.0)
+            tolerance (float): Convergence threshold on value changes
+            max_iterations (int, optional): Upper bound on sweeps
+        """
+        self.goal = goal if goal is not None else world.goal
+        self.gamma = gamma
+        self.version = getattr(world, "version", None)
+        self.values, self.policy, self.iterations, self.converged = value_iteration(
+            world, self.goal, gamma, step_reward, goal_reward, tolerance, max_iterations)
+
+    def _in_bounds(self, pos):
+        """Check pos lies inside the solution."""
+        rows, cols = self.policy.shape
+        return 0 <= pos.row < rows and 0 <= pos.col < cols
+
+    def value(self, pos):
+        """
+        State value of a cell.
+
+        Args:
+            pos (Position): Position to look up
+
+        Returns:
+            float or None: Value, or None for walls and out-of-bounds cells
+        """
+        if not self._in_bounds(pos):
+            return None
+        v = float(self.values[pos.row, pos.col])
+        return None if np.isnan(v) else v
+
+    def direction(self, pos):
+        """
+        Best direction to move from pos.
+
+        Args:
+            pos (Position): Position to look up
+
+        Returns:
+            str or None: 'up', 'down', 'left' or 'right', or None at the
+                goal and at cells that cannot reach it
+        """
+        if not self._in_bounds(pos):
+            return None
+        code = self.policy[pos.row, pos.col]
+        return DIRECTIONS[code] if code != NO_DIRECTION else None
+
+    def next_step(self, pos):
+        """
+        Next position from pos under the policy.
+
+        Args:
+            pos (Position): Current position
+
+        Returns:
+            Position or None: Adjacent position, or None if there is no move
+        """
+        name = self.direction(pos)
+        if name is None:
+            return None
+        dr, dc = DELTAS[name]
+        return Position(pos.row + dr, pos.col + dc)
@@ -0,0 +1,144 @@
+"""Vectorized reinforcement-learning environment over one grid world."""
+
+import numpy as np
+from swarm import move_agents
+
+
+class VectorEnv:
+    """
+    N independent episodes of the same GridWorld stepped in lockstep.
+
+    Each episode has one agent that starts at the world's start (or a
+    random open cell) and ends on reaching the world's goal or after
+    ``max_steps`` moves. Moves follow Agent.step's rules and are applied
+    to all episodes at once with swarm.move_agents; episodes do not see
+    each other. Finished episodes reset automatically inside step(), so
+    callers never have to reset individual environments.
+
+    Observations are flat cell ids (``row * cols + col``), ready to
+    index a Q-table of shape ``(rows * cols, 4)``. Actions are direction
+    codes, indices into agent.DIRECTIONS.
+
+    Attributes:
+        world (GridWorld): Shared walls and goal
+        num_envs (int): Number of episodes
+        max_steps (int or None): Moves before an episode is cut off
+        step_reward (float): Reward for every move that does not reach
+            the goal, blocked or not
+        goal_reward (float): Reward for the move that reaches the goal
+        random_start (bool): Start episodes on random open cells
+        steps (np.ndarray): Moves taken in each current episode
+        final_observations (np.ndarray): Cell each episode ended on in the
+            last step(), valid where that step's done flag is set
+    """
+
+    def __init__(self, world, num_envs, max_steps=None, step_reward=-0.01,
+                 goal_reward=1.0, random_start=False, seed=None):
+        """
+        Initialize the environments; call reset() before stepping.
+
+        Args:
+            world (GridWorld): World with an occupancy buffer and a goal
+            num_envs (int): Number of episodes run in lockstep
+            max_steps (int, optional): Truncate episodes after this many
+                moves (default: no limit)
+            step_reward (float): Reward per move (default: -0.01)
+            goal_reward (float): Reward on reaching the goal (default: 1.0)
+            random_start (bool): Start each episode on a uniformly random
+                open, non-goal cell instead of world.start (default: False)
+            seed (int, optional): Seed for random starts
+        """
+        if num_envs < 1:
+            raise ValueError("num_envs must be >= 1")
+        if max_steps is not None and max_steps < 1:
+            raise ValueError("max_steps must be >= 1")
+        self.world = world
+        self.num_envs = num_envs
+        self.max_steps = max_steps
+        self.step_reward = step_reward
+        self.goal_reward = goal_reward
+        self.random_start = random_start
+        self._rng = np.random.default_rng(seed)
+        self._goal = world.goal.row * world.cols + world.goal.col
+        self._rows = np.zeros(num_envs, dtype=np.int64)
+        self._cols = np.zeros(num_envs, dtype=np.int64)
+        self.steps = np.zeros(num_envs, dtype=np.int64)
+        self.final_observations = np.zeros(num_envs, dtype=np.int64)
+
+    def _occupancy(self):
+        """Current wall buffer as a uint8 array (a view, not a copy)."""
+        return np.frombuffer(self.world.occupancy(), dtype=np.uint8)
+
+    def _start_cells(self, count):
+        """Start cell ids for ``count`` new episodes."""
+        world = self.world
+        if not self.random_start:
+            return np.full(count, world.start.row * world.cols + world.start.col,
+                           dtype=np.int64)
+        open_cells = np.flatnonzero(self._occupancy() == 0)
+        open_cells = open_cells[open_cells != self._goal]
+        if not open_cells.size:
+            raise ValueError("world has no open cell to start from")
+        return self._rng.choice(open_cells, size=count)
+
+    def _restart(self, envs):
+        """Put the episodes selected by a boolean mask back at a start."""
+        cells = self._start_cells(np.count_nonzero(envs))
+        self._rows[envs], self._cols[envs] = np.divmod(cells, self.world.cols)
+        self.steps[envs] = 0
+
+    def reset(self):
+        """
+        Start a new episode in every environment.
+
+        Returns:
+            np.ndarray: ``int64`` cell id observation per environment
+        """
+        self._restart(np.ones(self.num_envs, dtype=bool))
+        return self.observations
+
+    @property
+    def observations(self):
+        """
+        Current cell id of every environment's agent.
+
+        Returns:
+            np.ndarray: ``int64`` array of ``row * cols + col``
+        """
+        return self._rows * self.world.cols + self._cols
+
+    def step(self, actions):
+        """
+        Apply one action per environment.
+
+        Episodes that reach the goal or hit ``max_steps`` are done; their
+        returned observation is already the first of a new episode, and
+        the cell they ended on is kept in ``final_observations``.
+
+        Args:
+            actions: Array of direction codes, one per environment;
+                indices into agent.DIRECTIONS, -1 to stay
+
+        Returns:
+            tuple: (observations ``int64``, rewards ``float64``, done
+                flags ``bool``), each of shape ``(num_envs,)``
+        """
+        world = self.world
+        cols = world.cols
+        self._rows, self._cols, _ = move_agents(
+            self._occupancy(), world.rows, cols, self._rows, self._cols,
+            np.asarray(actions), collide=False)
+        self.steps += 1
+
+        cells = self._rows * cols + self._cols
+        reached = cells == self._goal
+        rewards = np.where(reached, self.goal_reward, self.step_reward)
+        done = reached
+        if self.max_steps is not None:
+            done = reached | (self.steps >= self.max_steps)
+
+        self.final_observations = cells
+        if done.any():
+            self._restart(done)
+            cells = self.observations
+        return cells, rewards, done